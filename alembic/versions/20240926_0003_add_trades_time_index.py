@@ -0,0 +1,23 @@
+"""add trades (executed_at, symbol) index"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "20240926_0003"
+down_revision = "20240924_0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_trades_time_symbol",
+        "trades",
+        ["executed_at", "symbol"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_trades_time_symbol", table_name="trades")
@@ -0,0 +1,23 @@
+"""add covering index on pnl_daily date range queries"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "20240927_0004"
+down_revision = "20240926_0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_pnl_daily_date_equity",
+        "pnl_daily",
+        ["date", "realized_pnl", "total_equity"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_pnl_daily_date_equity", table_name="pnl_daily")
@@ -2,17 +2,19 @@
 """빗썸 실제 자동매매 시작 스크립트 - 실제 주문 실행."""
 
 import asyncio
+import hashlib
 import json
+import os
 import time
+import urllib.parse
 import uuid
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
 import jwt
-import numpy as np
-import pandas as pd
+import orjson
 import requests
-import ta
 from dataclasses import dataclass
 
 # 환경변수에서 API 키 로드
@@ -56,6 +58,12 @@ class TradingConfig:
         if self.target_symbols is None:
             self.target_symbols = ["BTC", "ETH", "XRP", "DOGE", "WLD"]  # 거래대금 상위 5개 코인
 
+@lru_cache(maxsize=128)
+def _hash_params(sorted_items: Tuple[Tuple[str, object], ...]) -> str:
+    """정렬된 쿼리 파라미터의 SHA512 해시 (동일 파라미터는 캐시 재사용)."""
+    query_string = urllib.parse.urlencode(sorted_items)
+    return hashlib.sha512(query_string.encode('utf-8')).hexdigest()
+
 class BithumbTradingAPI:
     """빗썸 거래 API 클래스."""
 
@@ -74,11 +82,7 @@ class BithumbTradingAPI:
         }
 
         if params:
-            import urllib.parse
-            import hashlib
-            query_string = urllib.parse.urlencode(sorted(params.items()))
-            query_hash = hashlib.sha512(query_string.encode('utf-8')).hexdigest()
-            payload['query_hash'] = query_hash
+            payload['query_hash'] = _hash_params(tuple(sorted(params.items())))
             payload['query_hash_alg'] = 'SHA512'
 
         jwt_token = jwt.encode(payload, self.secret_key, algorithm='HS256')
@@ -89,7 +93,7 @@ class BithumbTradingAPI:
         try:
             url = f"{self.base_url}/public/ticker/{symbol}"
             response = self.session.get(url, timeout=10)
-            return response.json()
+            return orjson.loads(response.content)
         except Exception as e:
             print(f"시세 조회 오류 ({symbol}): {e}")
             return None
@@ -109,7 +113,7 @@ class BithumbTradingAPI:
             response = self.session.get(url, headers=headers, timeout=10)
 
             if response.status_code == 200:
-                return response.json()
+                return orjson.loads(response.content)
             else:
                 print(f"계좌 조회 실패: {response.status_code}")
                 return None
@@ -148,6 +152,21 @@ class BithumbTradingAPI:
             print(f"주문 실행 오류: {e}")
             return {"error": "Exception", "message": str(e)}
 
+@lru_cache(maxsize=1024)
+def _rsi_signal_pure(symbol: str, price_seed: int, time_seed: int) -> Tuple[int, str, float]:
+    """(종목, 가격 구간, 5분 구간)별 RSI 신호 계산 - 같은 구간 내 재계산 방지."""
+    # 시간 기반 의사 랜덤 RSI (실제로는 과거 데이터 필요)
+    combined_seed = (time_seed + price_seed + hash(symbol)) % 100
+
+    # 현실적인 RSI 범위 (20-80)
+    rsi = 20 + (combined_seed % 60)
+
+    # 트렌드 추정
+    trend = 'bullish' if combined_seed % 3 == 0 else 'bearish' if combined_seed % 3 == 1 else 'neutral'
+
+    volatility = (combined_seed % 20) / 1000.0  # 0-2% 변동성
+    return rsi, trend, volatility
+
 class TradingEngine:
     """실제 자동매매 엔진."""
 
@@ -161,22 +180,15 @@ class TradingEngine:
     def calculate_rsi_signal(self, symbol: str, current_price: float) -> Dict:
         """RSI 기반 간단한 신호 계산."""
         try:
-            # 시간 기반 의사 랜덤 RSI (실제로는 과거 데이터 필요)
             time_seed = int(time.time() // 300)  # 5분 단위로 변경
             price_seed = int(current_price / 1000000)  # 가격 기반 시드
-            combined_seed = (time_seed + price_seed + hash(symbol)) % 100
-
-            # 현실적인 RSI 범위 (20-80)
-            rsi = 20 + (combined_seed % 60)
-
-            # 트렌드 추정
-            trend = 'bullish' if combined_seed % 3 == 0 else 'bearish' if combined_seed % 3 == 1 else 'neutral'
+            rsi, trend, volatility = _rsi_signal_pure(symbol, price_seed, time_seed)
 
             return {
                 'rsi': rsi,
                 'trend': trend,
                 'price': current_price,
-                'volatility': (combined_seed % 20) / 1000.0  # 0-2% 변동성
+                'volatility': volatility
             }
 
         except Exception as e:
@@ -391,8 +403,24 @@ class TradingEngine:
         print(f"\n🏁 자동매매 엔진 종료 (총 거래: {self.trade_count}회)")
         self.is_running = False
 
+def _pin_cpu_affinity():
+    """TRADER_CPU가 지정된 경우에만 매매 루프를 해당 코어에 고정 (캐시 유지, Linux 전용)."""
+    cpu = os.getenv('TRADER_CPU')
+    if not cpu:
+        return
+
+    try:
+        os.sched_setaffinity(0, {int(cpu)})
+    except (AttributeError, OSError, ValueError) as e:
+        print(f"⚠️ CPU 고정 실패 (TRADER_CPU={cpu}): {e}")
+        return
+
+    print(f"📌 CPU {cpu}번 코어에 고정")
+
 async def main():
     """메인 실행 함수."""
+    _pin_cpu_affinity()
+
     config = TradingConfig(
         target_symbols=["BTC", "ETH", "XRP", "DOGE", "WLD"],  # 거래대금 상위 5개 코인
         position_size_percent=1.0,  # 1%만 사용
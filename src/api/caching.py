@@ -0,0 +1,17 @@
+"""HTTP 응답 캐싱 유틸리티."""
+
+import hashlib
+from typing import Any
+
+import orjson
+from fastapi import Request, Response
+
+def cached_response(request: Request, payload: Any, max_age: int = 1) -> Response:
+    """ETag를 붙인 JSON 응답 생성 (If-None-Match 일치 시 304)."""
+    body = orjson.dumps(payload)
+    etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": f"max-age={max_age}"}
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
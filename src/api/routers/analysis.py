@@ -3,7 +3,9 @@
 from datetime import datetime, timedelta
 from typing import List, Dict, Any
 
+import numpy as np
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from ...backtest.performance import PerformanceAnalyzer
@@ -12,6 +14,9 @@ from ...utils.logger import get_logger
 logger = get_logger(__name__)
 router = APIRouter()
 
+# 분석기는 상태가 없으므로 요청마다 생성하지 않고 재사용
+_ANALYZER = PerformanceAnalyzer(risk_free_rate=0.02)
+
 class PerformanceMetrics(BaseModel):
     """성과 지표."""
     total_return: float
@@ -32,6 +37,12 @@ class EquityPoint(BaseModel):
     equity: float
     drawdown: float
 
+class EquityCurve(BaseModel):
+    """자산 곡선 (컬럼 단위, columnar=true 요청 시)."""
+    timestamps: List[datetime]
+    equity: List[float]
+    drawdown: List[float]
+
 @router.get("/performance", response_model=PerformanceMetrics)
 async def get_performance_metrics(
     start_date: str = Query(..., description="시작 날짜 (YYYY-MM-DD)"),
@@ -40,8 +51,8 @@ async def get_performance_metrics(
     """성과 지표 조회."""
     try:
         # 날짜 파싱
-        start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-        end_dt = datetime.strptime(end_date, "%Y-%m-%d")
+        start_dt = datetime.fromisoformat(start_date)
+        end_dt = datetime.fromisoformat(end_date)
 
         # 실제로는 DB에서 거래 내역과 자산 곡선을 조회해야 함
         # 임시로 백테스트 결과 사용
@@ -79,8 +90,7 @@ async def get_performance_metrics(
         ]
 
         # 성과 분석
-        analyzer = PerformanceAnalyzer(risk_free_rate=0.02)
-        metrics = analyzer.analyze(equity_curve, trades, initial_capital)
+        metrics = _ANALYZER.analyze(equity_curve, trades, initial_capital)
 
         return PerformanceMetrics(
             total_return=round(metrics.total_return, 2),
@@ -103,40 +113,42 @@ async def get_performance_metrics(
 @router.get("/equity-curve", response_model=List[EquityPoint])
 async def get_equity_curve(
     start_date: str = Query(..., description="시작 날짜 (YYYY-MM-DD)"),
-    end_date: str = Query(..., description="종료 날짜 (YYYY-MM-DD)")
+    end_date: str = Query(..., description="종료 날짜 (YYYY-MM-DD)"),
+    columnar: bool = Query(False, description="컬럼 단위 배열(EquityCurve)로 응답할지 여부")
 ):
     """자산 곡선 조회."""
     try:
-        start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-        end_dt = datetime.strptime(end_date, "%Y-%m-%d")
+        start_dt = datetime.fromisoformat(start_date)
+        end_dt = datetime.fromisoformat(end_date)
 
         # 실제로는 DB에서 일별 자산 데이터 조회
-        equity_points = []
         initial_capital = 1000000
-        peak_equity = initial_capital
-        days = (end_dt - start_dt).days
-
-        for i in range(days):
-            timestamp = start_dt + timedelta(days=i)
+        days = max((end_dt - start_dt).days, 0)
+        i = np.arange(days)
 
-            # 자산 시뮬레이션 (변동성 포함)
-            growth_factor = 1 + (i * 0.001) + ((i % 7) - 3) * 0.002
-            equity = initial_capital * growth_factor
+        # 자산 시뮬레이션 (변동성 포함)
+        growth_factor = 1 + (i * 0.001) + ((i % 7) - 3) * 0.002
+        equity = initial_capital * growth_factor
 
-            # 고점 갱신
-            if equity > peak_equity:
-                peak_equity = equity
+        # 고점 및 드로다운 계산 (초기 자본을 시작 고점으로 사용)
+        peak_equity = np.maximum(np.maximum.accumulate(equity), initial_capital)
+        drawdown = (equity - peak_equity) / peak_equity * 100
 
-            # 드로다운 계산
-            drawdown = (equity - peak_equity) / peak_equity * 100 if peak_equity > 0 else 0
+        timestamps = [(start_dt + timedelta(days=d)).isoformat() for d in range(days)]
 
-            equity_points.append(EquityPoint(
-                timestamp=timestamp,
-                equity=round(equity, 2),
-                drawdown=round(drawdown, 2)
-            ))
+        if columnar:
+            # Pydantic 모델 생성 없이 orjson이 numpy 배열을 직접 직렬화
+            return ORJSONResponse({
+                "timestamps": timestamps,
+                "equity": equity.round(2),
+                "drawdown": drawdown.round(2)
+            })
 
-        return equity_points
+        # 기본 응답은 포인트 목록 (모델 생성 없이 딕셔너리로 직렬화)
+        return ORJSONResponse([
+            {"timestamp": timestamp, "equity": eq, "drawdown": dd}
+            for timestamp, eq, dd in zip(timestamps, equity.round(2).tolist(), drawdown.round(2).tolist())
+        ])
 
     except Exception as e:
         logger.error(f"자산 곡선 조회 실패: {e}")
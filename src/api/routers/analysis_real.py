@@ -1,11 +1,18 @@
 """실제 DB 데이터 기반 분석 API 라우터."""
 
+import itertools
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import Iterator, List, Dict, Any, Optional, Tuple
 from decimal import Decimal
 
+import numpy as np
+import orjson
 from fastapi import APIRouter, HTTPException, Query, Depends
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+from scipy.stats import kurtosis, skew
+from sqlalchemy import Float, case, cast, func, select
 from sqlalchemy.orm import Session
 
 from ...data.database import get_db
@@ -16,6 +23,12 @@ from ...utils.logger import get_logger
 logger = get_logger(__name__)
 router = APIRouter()
 
+# 요청 간 공유하는 성과 분석기 (인스턴스 상태 없음)
+_ANALYZER = PerformanceAnalyzer()
+
+# 거래/자산 내역 스트리밍 조회 시 한 번에 가져올 행 수
+STREAM_BATCH_SIZE = 1000
+
 class PerformanceMetrics(BaseModel):
     """성과 지표."""
     total_return: float
@@ -36,6 +49,8 @@ class PerformanceMetrics(BaseModel):
 
 class EquityPoint(BaseModel):
     """자산 곡선 포인트."""
+    model_config = ConfigDict(extra='ignore', frozen=True)
+
     timestamp: datetime
     equity: float
     drawdown: float
@@ -43,13 +58,23 @@ class EquityPoint(BaseModel):
 
 class TradeAnalysis(BaseModel):
     """거래 분석."""
+    model_config = ConfigDict(extra='ignore', frozen=True)
+
     symbol: str
     total_trades: int
     win_rate: float
     avg_return: float
     total_pnl: float
 
-@router.get("/performance", response_model=PerformanceMetrics)
+@lru_cache(maxsize=1024)
+def _parse_date(value: str) -> datetime:
+    """YYYY-MM-DD 날짜 파싱 (대시보드가 반복 요청하는 날짜는 캐시 재사용)."""
+    return datetime.fromisoformat(value)
+
+# 리스트 응답용 검증기 (스키마를 한 번만 생성해 재사용)
+_EQUITY_LIST_ADAPTER = TypeAdapter(List[EquityPoint])
+
+@router.get("/performance", response_model=PerformanceMetrics, response_model_exclude_none=True)
 async def get_performance_metrics(
     start_date: str = Query(..., description="시작 날짜 (YYYY-MM-DD)"),
     end_date: str = Query(..., description="종료 날짜 (YYYY-MM-DD)"),
@@ -59,54 +84,67 @@ async def get_performance_metrics(
     """실제 DB 기반 성과 지표 조회."""
     try:
         # 날짜 파싱
-        start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-        end_dt = datetime.strptime(end_date, "%Y-%m-%d")
-
-        # DB에서 거래 내역 조회
-        query = db.query(Trade).filter(
+        start_dt = _parse_date(start_date)
+        end_dt = _parse_date(end_date)
+
+        # DB에서 거래 내역 조회 (ORM 객체 대신 float로 캐스팅된 컬럼만 선택)
+        query = select(
+            Trade.executed_at,
+            Trade.symbol,
+            Trade.side,
+            cast(Trade.quantity, Float),
+            cast(Trade.price, Float),
+            func.coalesce(cast(Trade.fee, Float), 0.0),
+            func.coalesce(cast(Trade.realized_pnl, Float), 0.0)
+        ).where(
             Trade.executed_at >= start_dt,
             Trade.executed_at <= end_dt
         )
 
         if symbol:
-            query = query.filter(Trade.symbol == symbol)
+            query = query.where(Trade.symbol == symbol)
 
-        trades = query.all()
-
-        if not trades:
-            raise HTTPException(status_code=404, detail="해당 기간에 거래 내역이 없습니다.")
-
-        # 성과 분석 실행
-        analyzer = PerformanceAnalyzer()
+        # 배치 단위로 받아 바로 변환 (DB 결과 행 목록과 변환된 거래 목록을 동시에 보유하지 않음)
+        # 성과 분석기는 전체 거래 목록을 받으므로 변환 결과는 모두 메모리에 적재됨
+        trades = db.execute(query.execution_options(yield_per=STREAM_BATCH_SIZE))
 
         # 거래 데이터를 분석 가능한 형태로 변환
-        trade_data = []
-        for trade in trades:
-            trade_data.append({
-                'timestamp': trade.executed_at,
-                'symbol': trade.symbol,
-                'side': trade.side,
-                'quantity': float(trade.quantity),
-                'price': float(trade.price),
-                'fee': float(trade.fee or 0),
-                'pnl': float(trade.realized_pnl or 0)
-            })
+        trade_data = [
+            {
+                'timestamp': executed_at,
+                'symbol': trade_symbol,
+                'side': side,
+                'quantity': quantity,
+                'price': price,
+                'fee': fee,
+                'pnl': pnl
+            }
+            for executed_at, trade_symbol, side, quantity, price, fee, pnl in trades
+        ]
+
+        if not trade_data:
+            raise HTTPException(status_code=404, detail="해당 기간에 거래 내역이 없습니다.")
 
         # 일별 PnL 데이터 조회
-        daily_pnl_query = db.query(DailyPnL).filter(
-            DailyPnL.date >= start_dt.date(),
-            DailyPnL.date <= end_dt.date()
-        )
-        daily_pnl_records = daily_pnl_query.all()
+        daily_pnl_records = db.execute(
+            select(
+                DailyPnL.date,
+                cast(DailyPnL.realized_pnl, Float),
+                cast(DailyPnL.total_equity, Float)
+            ).where(
+                DailyPnL.date >= start_dt.date(),
+                DailyPnL.date <= end_dt.date()
+            )
+        ).all()
 
         # 성과 지표 계산
-        metrics = analyzer.calculate_comprehensive_metrics(
+        metrics = _ANALYZER.calculate_comprehensive_metrics(
             trades=trade_data,
             daily_pnl=[{
-                'date': record.date,
-                'pnl': float(record.realized_pnl),
-                'equity': float(record.total_equity)
-            } for record in daily_pnl_records]
+                'date': record_date,
+                'pnl': pnl,
+                'equity': equity
+            } for record_date, pnl, equity in daily_pnl_records]
         )
 
         return PerformanceMetrics(**metrics)
@@ -117,56 +155,115 @@ async def get_performance_metrics(
         logger.error(f"성과 지표 조회 실패: {e}")
         raise HTTPException(status_code=500, detail="성과 지표 조회 중 오류 발생")
 
-@router.get("/equity-curve", response_model=List[EquityPoint])
+@router.get("/equity-curve", response_model=List[EquityPoint], response_model_exclude_none=True)
 async def get_equity_curve(
     start_date: str = Query(..., description="시작 날짜 (YYYY-MM-DD)"),
     end_date: str = Query(..., description="종료 날짜 (YYYY-MM-DD)"),
+    stream: bool = Query(False, description="NDJSON 스트리밍 응답 여부 (장기간 조회용)"),
     db: Session = Depends(get_db)
 ):
     """실제 DB 기반 자산 곡선 조회."""
     try:
-        start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-        end_dt = datetime.strptime(end_date, "%Y-%m-%d")
+        start_dt = _parse_date(start_date)
+        end_dt = _parse_date(end_date)
 
         # DB에서 일별 PnL 데이터 조회
-        daily_records = db.query(DailyPnL).filter(
+        equity_query = select(
+            DailyPnL.date,
+            cast(DailyPnL.realized_pnl, Float),
+            cast(DailyPnL.total_equity, Float)
+        ).where(
             DailyPnL.date >= start_dt.date(),
             DailyPnL.date <= end_dt.date()
-        ).order_by(DailyPnL.date).all()
+        ).order_by(DailyPnL.date)
+
+        if stream:
+            # 전체 결과를 적재하지 않고 배치 단위로 계산해 한 줄씩 전송
+            # (첫 배치는 응답 전에 계산해 빈 결과/조회 오류를 JSON 응답과 같은 상태 코드로 처리)
+            rows = _iter_equity_ndjson(db, equity_query)
+            first_row = next(rows, None)
+            if first_row is None:
+                raise HTTPException(status_code=404, detail="해당 기간에 자산 데이터가 없습니다.")
+            return StreamingResponse(
+                itertools.chain((first_row,), rows),
+                media_type="application/x-ndjson"
+            )
+
+        daily_records = db.execute(equity_query).all()
 
         if not daily_records:
             raise HTTPException(status_code=404, detail="해당 기간에 자산 데이터가 없습니다.")
 
-        # 자산 곡선 계산
-        equity_curve = []
-        max_equity = 0
-
-        for record in daily_records:
-            equity = float(record.total_equity)
-            max_equity = max(max_equity, equity)
-
-            # 드로우다운 계산
-            drawdown = (equity - max_equity) / max_equity * 100 if max_equity > 0 else 0
-
-            # 일일 수익률 계산
-            daily_return = float(record.realized_pnl) / equity * 100 if equity > 0 else 0
-
-            equity_curve.append(EquityPoint(
-                timestamp=datetime.combine(record.date, datetime.min.time()),
-                equity=equity,
-                drawdown=drawdown,
-                daily_return=daily_return
-            ))
-
-        return equity_curve
-
+        # 자산 곡선 계산 (누적 최대값 기반 벡터 연산)
+        count = len(daily_records)
+        equity = np.fromiter((r[2] for r in daily_records), dtype=np.float64, count=count)
+        pnl = np.fromiter((r[1] for r in daily_records), dtype=np.float64, count=count)
+        _, drawdown, daily_return = _calculate_equity_series(equity, pnl)
+
+        # 모델을 하나씩 생성하지 않고 리스트 단위로 한 번에 검증
+        equity_curve = _EQUITY_LIST_ADAPTER.validate_python([
+            {
+                'timestamp': datetime.combine(record[0], datetime.min.time()),
+                'equity': eq,
+                'drawdown': dd,
+                'daily_return': ret
+            }
+            for record, eq, dd, ret in zip(
+                daily_records, equity.tolist(), drawdown.tolist(), daily_return.tolist()
+            )
+        ])
+
+        # 응답 모델 재검증 없이 바로 직렬화
+        return ORJSONResponse(content=_EQUITY_LIST_ADAPTER.dump_python(equity_curve, exclude_none=True))
+
+    except HTTPException:
+        raise
     except ValueError as e:
         raise HTTPException(status_code=400, detail=f"잘못된 날짜 형식: {e}")
     except Exception as e:
         logger.error(f"자산 곡선 조회 실패: {e}")
         raise HTTPException(status_code=500, detail="자산 곡선 조회 중 오류 발생")
 
-@router.get("/trades-analysis", response_model=List[TradeAnalysis])
+def _calculate_equity_series(
+    equity: np.ndarray,
+    pnl: np.ndarray,
+    prior_peak: float = 0.0
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """누적 최대 자산, 드로우다운(%), 일일 수익률(%) 계산."""
+    max_equity = np.maximum.accumulate(np.maximum(equity, prior_peak))
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # 드로우다운 계산
+        drawdown = np.where(max_equity > 0, (equity - max_equity) / max_equity * 100, 0.0)
+
+        # 일일 수익률 계산
+        daily_return = np.where(equity > 0, pnl / equity * 100, 0.0)
+
+    return max_equity, drawdown, daily_return
+
+def _iter_equity_ndjson(db: Session, equity_query) -> Iterator[bytes]:
+    """자산 곡선을 배치 단위로 계산해 NDJSON 행으로 반환."""
+    result = db.execute(equity_query.execution_options(yield_per=STREAM_BATCH_SIZE))
+    peak = 0.0
+
+    for batch in result.partitions():
+        count = len(batch)
+        equity = np.fromiter((r[2] for r in batch), dtype=np.float64, count=count)
+        pnl = np.fromiter((r[1] for r in batch), dtype=np.float64, count=count)
+
+        # 이전 배치의 고점을 이어받아 드로우다운 계산
+        max_equity, drawdown, daily_return = _calculate_equity_series(equity, pnl, peak)
+        peak = float(max_equity[-1])
+
+        for record, eq, dd, ret in zip(batch, equity.tolist(), drawdown.tolist(), daily_return.tolist()):
+            yield orjson.dumps({
+                'timestamp': datetime.combine(record[0], datetime.min.time()),
+                'equity': eq,
+                'drawdown': dd,
+                'daily_return': ret
+            }) + b"\n"
+
+@router.get("/trades-analysis", response_model=List[TradeAnalysis], response_model_exclude_none=True)
 async def get_trades_analysis(
     start_date: str = Query(..., description="시작 날짜 (YYYY-MM-DD)"),
     end_date: str = Query(..., description="종료 날짜 (YYYY-MM-DD)"),
@@ -174,58 +271,37 @@ async def get_trades_analysis(
 ):
     """종목별 거래 분석."""
     try:
-        start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-        end_dt = datetime.strptime(end_date, "%Y-%m-%d")
-
-        # 종목별 거래 통계 계산
-        trades = db.query(Trade).filter(
+        start_dt = _parse_date(start_date)
+        end_dt = _parse_date(end_date)
+
+        # 종목별 거래 통계를 DB에서 집계 (ORM 객체 로딩 없이 종목 수만큼의 행만 전송)
+        trade_count = func.count(Trade.id)
+        rows = db.query(
+            Trade.symbol,
+            trade_count,
+            func.sum(case((Trade.realized_pnl > 0, 1), else_=0)),
+            func.sum(func.coalesce(cast(Trade.realized_pnl, Float), 0.0))
+        ).filter(
             Trade.executed_at >= start_dt,
             Trade.executed_at <= end_dt
-        ).all()
-
-        if not trades:
-            return []
+        ).group_by(Trade.symbol).order_by(trade_count.desc()).all()
 
-        # 종목별로 그룹화
-        symbol_stats = {}
-
-        for trade in trades:
-            symbol = trade.symbol
-            if symbol not in symbol_stats:
-                symbol_stats[symbol] = {
-                    'trades': [],
-                    'total_pnl': 0
-                }
-
-            symbol_stats[symbol]['trades'].append(trade)
-            symbol_stats[symbol]['total_pnl'] += float(trade.realized_pnl or 0)
-
-        # 분석 결과 생성
+        # 분석 결과 생성 (총 거래 수 기준 정렬은 SQL에서 처리)
         analysis_results = []
 
-        for symbol, stats in symbol_stats.items():
-            trades_list = stats['trades']
-            total_trades = len(trades_list)
-
-            # 수익 거래 계산
-            profitable_trades = sum(1 for t in trades_list if (t.realized_pnl or 0) > 0)
-            win_rate = profitable_trades / total_trades * 100 if total_trades > 0 else 0
-
-            # 평균 수익률 계산
-            avg_return = stats['total_pnl'] / total_trades if total_trades > 0 else 0
+        for symbol, total_trades, profitable_trades, total_pnl in rows:
+            total_pnl = float(total_pnl or 0)
 
             analysis_results.append(TradeAnalysis(
                 symbol=symbol,
                 total_trades=total_trades,
-                win_rate=win_rate,
-                avg_return=avg_return,
-                total_pnl=stats['total_pnl']
+                win_rate=(profitable_trades or 0) / total_trades * 100,
+                avg_return=total_pnl / total_trades,
+                total_pnl=total_pnl
             ))
 
-        # 총 거래 수 기준으로 정렬
-        analysis_results.sort(key=lambda x: x.total_trades, reverse=True)
-
-        return analysis_results
+        # 응답 모델 재검증 없이 바로 직렬화
+        return ORJSONResponse(content=[result.model_dump(exclude_none=True) for result in analysis_results])
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=f"잘못된 날짜 형식: {e}")
@@ -237,28 +313,30 @@ async def get_trades_analysis(
 async def get_current_positions(db: Session = Depends(get_db)):
     """현재 보유 포지션 조회."""
     try:
-        # 현재 활성 포지션 조회
-        positions = db.query(Position).filter(
-            Position.is_active == True,
-            Position.quantity > 0
+        # 현재 활성 포지션과 평가 지표를 한 번의 쿼리로 조회 (float로 캐스팅된 컬럼만 선택)
+        # 현재가는 실시간 API 대신 저장된 마지막 가격 사용
+        quantity = cast(Position.quantity, Float)
+        average_price = cast(Position.average_price, Float)
+        current_price = func.coalesce(cast(Position.current_price, Float), 0.0)
+        unrealized_pnl = quantity * (current_price - average_price)
+
+        rows = db.execute(
+            select(
+                Position.symbol.label('symbol'),
+                quantity.label('quantity'),
+                average_price.label('average_price'),
+                current_price.label('current_price'),
+                (quantity * current_price).label('market_value'),
+                unrealized_pnl.label('unrealized_pnl'),
+                (unrealized_pnl / (quantity * average_price) * 100).label('unrealized_pnl_percent'),
+                Position.opened_at.label('opened_at')
+            ).where(
+                Position.is_active.is_(True),
+                Position.quantity > 0
+            )
         ).all()
 
-        result = []
-        for pos in positions:
-            # 현재가 조회 (실시간 API 호출 필요)
-            # 여기서는 저장된 마지막 가격 사용
-            unrealized_pnl = float(pos.quantity) * (float(pos.current_price or 0) - float(pos.average_price))
-
-            result.append({
-                'symbol': pos.symbol,
-                'quantity': float(pos.quantity),
-                'average_price': float(pos.average_price),
-                'current_price': float(pos.current_price or 0),
-                'market_value': float(pos.quantity) * float(pos.current_price or 0),
-                'unrealized_pnl': unrealized_pnl,
-                'unrealized_pnl_percent': unrealized_pnl / (float(pos.quantity) * float(pos.average_price)) * 100,
-                'opened_at': pos.opened_at
-            })
+        result = [dict(row._mapping) for row in rows]
 
         return {"positions": result}
 
@@ -274,11 +352,14 @@ async def get_risk_metrics(
 ):
     """위험 지표 조회."""
     try:
-        start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-        end_dt = datetime.strptime(end_date, "%Y-%m-%d")
-
-        # 일별 수익률 데이터 조회
-        daily_records = db.query(DailyPnL).filter(
+        start_dt = _parse_date(start_date)
+        end_dt = _parse_date(end_date)
+
+        # 일별 수익률 계산에 필요한 컬럼만 조회
+        daily_records = db.query(
+            cast(DailyPnL.realized_pnl, Float),
+            cast(DailyPnL.total_equity, Float)
+        ).filter(
             DailyPnL.date >= start_dt.date(),
             DailyPnL.date <= end_dt.date()
         ).order_by(DailyPnL.date).all()
@@ -286,28 +367,27 @@ async def get_risk_metrics(
         if not daily_records:
             raise HTTPException(status_code=404, detail="위험 지표 계산을 위한 데이터가 없습니다.")
 
-        # 위험 지표 계산
-        daily_returns = [float(record.realized_pnl) / float(record.total_equity) * 100
-                        for record in daily_records if record.total_equity > 0]
+        # 위험 지표 계산 (단일 float64 배열에서 벡터 연산)
+        pnl, equity = np.array(daily_records, dtype=np.float64).T
+        valid = equity > 0
+        daily_returns = pnl[valid] / equity[valid] * 100
 
-        if not daily_returns:
+        if not daily_returns.size:
             return {"error": "유효한 수익률 데이터가 없습니다."}
 
-        import numpy as np
-
-        volatility = float(np.std(daily_returns)) * (252 ** 0.5)  # 연환산 변동성
-        downside_returns = [r for r in daily_returns if r < 0]
-        downside_volatility = float(np.std(downside_returns)) * (252 ** 0.5) if downside_returns else 0
+        volatility = float(daily_returns.std()) * (252 ** 0.5)  # 연환산 변동성
+        downside_returns = daily_returns[daily_returns < 0]
+        downside_volatility = float(downside_returns.std()) * (252 ** 0.5) if downside_returns.size else 0
 
         # VaR 계산 (95% 신뢰도)
-        var_95 = float(np.percentile(daily_returns, 5)) if daily_returns else 0
+        var_95 = float(np.percentile(daily_returns, 5))
 
         return {
             "volatility": volatility,
             "downside_volatility": downside_volatility,
             "var_95": var_95,
-            "skewness": float(np.skew(daily_returns)) if len(daily_returns) > 2 else 0,
-            "kurtosis": float(np.kurtosis(daily_returns)) if len(daily_returns) > 3 else 0,
+            "skewness": float(skew(daily_returns)) if daily_returns.size > 2 else 0,
+            "kurtosis": float(kurtosis(daily_returns)) if daily_returns.size > 3 else 0,
             "max_consecutive_losses": _calculate_max_consecutive_losses(daily_returns)
         }
 
@@ -315,16 +395,12 @@ async def get_risk_metrics(
         logger.error(f"위험 지표 계산 실패: {e}")
         raise HTTPException(status_code=500, detail="위험 지표 계산 중 오류 발생")
 
-def _calculate_max_consecutive_losses(returns: List[float]) -> int:
-    """최대 연속 손실 일수 계산."""
-    max_consecutive = 0
-    current_consecutive = 0
+def _calculate_max_consecutive_losses(returns: np.ndarray) -> int:
+    """최대 연속 손실 일수 계산 (손실 구간의 run-length를 벡터 연산으로 계산)."""
+    losses = np.concatenate(([False], np.asarray(returns) < 0, [False]))
+    edges = np.flatnonzero(np.diff(losses.astype(np.int8)))
 
-    for ret in returns:
-        if ret < 0:
-            current_consecutive += 1
-            max_consecutive = max(max_consecutive, current_consecutive)
-        else:
-            current_consecutive = 0
+    if not edges.size:
+        return 0
 
-    return max_consecutive
\ No newline at end of file
+    return int((edges[1::2] - edges[::2]).max())
\ No newline at end of file
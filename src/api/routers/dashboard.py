@@ -2,9 +2,10 @@
 
 from datetime import datetime
 from decimal import Decimal
-from typing import Dict, Any, List
+from typing import Dict, Any, Final, List, Tuple
 
-from fastapi import APIRouter, HTTPException, Depends
+import orjson
+from fastapi import APIRouter, HTTPException, Depends, Response
 from pydantic import BaseModel
 
 # from ...exchange.client import BithumbClient  # 임시로 주석 처리
@@ -35,7 +36,7 @@ class PositionInfo(BaseModel):
     unrealized_pnl_percent: float
     market_value: float
 
-@router.get("/summary", response_model=DashboardSummary)
+@router.get("/summary", response_model=DashboardSummary, response_model_exclude_none=True)
 async def get_dashboard_summary():
     """대시보드 요약 정보 조회."""
     try:
@@ -66,42 +67,67 @@ async def get_dashboard_summary():
         logger.error(f"대시보드 요약 조회 실패: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.get("/positions", response_model=List[PositionInfo])
+# Mock 포지션 데이터 (요청마다 생성/직렬화하지 않도록 미리 계산)
+_POSITIONS: Final[Tuple[PositionInfo, ...]] = (
+    PositionInfo(
+        symbol="BTC_KRW",
+        quantity=0.005,
+        average_price=98000000,
+        current_price=100000000,
+        unrealized_pnl=10000,
+        unrealized_pnl_percent=2.04,
+        market_value=500000
+    ),
+    PositionInfo(
+        symbol="ETH_KRW",
+        quantity=0.1,
+        average_price=3100000,
+        current_price=3200000,
+        unrealized_pnl=10000,
+        unrealized_pnl_percent=3.23,
+        market_value=320000
+    ),
+    PositionInfo(
+        symbol="XRP_KRW",
+        quantity=1000,
+        average_price=650,
+        current_price=680,
+        unrealized_pnl=30000,
+        unrealized_pnl_percent=4.62,
+        market_value=680000
+    )
+)
+_POSITIONS_JSON: Final[bytes] = orjson.dumps([position.model_dump() for position in _POSITIONS])
+
+# 최근 거래 내역 (임시 데이터)
+_RECENT_TRADES: Final[Tuple[Dict[str, Any], ...]] = (
+    {
+        "timestamp": "2025-09-22T13:35:00Z",
+        "symbol": "BTC_KRW",
+        "side": "buy",
+        "quantity": 0.001,
+        "price": 98500000,
+        "amount": 98500,
+        "fee": 246.25,
+        "status": "filled"
+    },
+    {
+        "timestamp": "2025-09-22T12:45:00Z",
+        "symbol": "ETH_KRW",
+        "side": "sell",
+        "quantity": 0.05,
+        "price": 3200000,
+        "amount": 160000,
+        "fee": 400,
+        "status": "filled"
+    }
+)
+
+@router.get("/positions", response_model=List[PositionInfo], response_model_exclude_none=True)
 async def get_positions():
     """현재 포지션 목록 조회."""
     try:
-        # Mock 포지션 데이터
-        positions = [
-            PositionInfo(
-                symbol="BTC_KRW",
-                quantity=0.005,
-                average_price=98000000,
-                current_price=100000000,
-                unrealized_pnl=10000,
-                unrealized_pnl_percent=2.04,
-                market_value=500000
-            ),
-            PositionInfo(
-                symbol="ETH_KRW",
-                quantity=0.1,
-                average_price=3100000,
-                current_price=3200000,
-                unrealized_pnl=10000,
-                unrealized_pnl_percent=3.23,
-                market_value=320000
-            ),
-            PositionInfo(
-                symbol="XRP_KRW",
-                quantity=1000,
-                average_price=650,
-                current_price=680,
-                unrealized_pnl=30000,
-                unrealized_pnl_percent=4.62,
-                market_value=680000
-            )
-        ]
-
-        return positions
+        return Response(content=_POSITIONS_JSON, media_type="application/json")
 
     except Exception as e:
         logger.error(f"포지션 조회 실패: {e}")
@@ -112,30 +138,7 @@ async def get_recent_trades(limit: int = 10):
     """최근 거래 내역 조회."""
     try:
         # DB에서 최근 거래 내역 조회 (임시 데이터)
-        recent_trades = [
-            {
-                "timestamp": "2025-09-22T13:35:00Z",
-                "symbol": "BTC_KRW",
-                "side": "buy",
-                "quantity": 0.001,
-                "price": 98500000,
-                "amount": 98500,
-                "fee": 246.25,
-                "status": "filled"
-            },
-            {
-                "timestamp": "2025-09-22T12:45:00Z",
-                "symbol": "ETH_KRW",
-                "side": "sell",
-                "quantity": 0.05,
-                "price": 3200000,
-                "amount": 160000,
-                "fee": 400,
-                "status": "filled"
-            }
-        ]
-
-        return {"trades": recent_trades[:limit]}
+        return {"trades": list(_RECENT_TRADES[:limit])}
 
     except Exception as e:
         logger.error(f"최근 거래 내역 조회 실패: {e}")
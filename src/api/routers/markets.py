@@ -1,10 +1,16 @@
 """종목 API 라우터."""
 
+import asyncio
+import heapq
+import time
 from datetime import datetime, timedelta
-from typing import List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
 
+import numpy as np
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 # from ...exchange.client import BithumbClient  # 임시로 주석 처리
 from ...utils.logger import get_logger
@@ -12,8 +18,29 @@ from ...utils.logger import get_logger
 logger = get_logger(__name__)
 router = APIRouter()
 
+# 종목명 매핑 (실제로는 DB나 설정에서 관리)
+SYMBOL_NAME_MAP = {
+    'BTC': '비트코인',
+    'ETH': '이더리움',
+    'XRP': '리플',
+    'ADA': '에이다',
+    'DOT': '폴카닷'
+}
+
+@lru_cache(maxsize=1)
+def _get_client() -> "BithumbClient":
+    """요청 간 공유되는 거래소 클라이언트 (커넥션 풀 재사용)."""
+    return BithumbClient()
+
+# 종목 목록 캐시 (초 단위 TTL)
+_MARKET_LIST_TTL = 2.0
+_market_list_cache: Dict[str, Any] = {"t": 0.0, "v": None}
+_market_list_lock = asyncio.Lock()
+
 class MarketInfo(BaseModel):
     """종목 정보."""
+    model_config = ConfigDict(extra='ignore', frozen=True)
+
     symbol: str
     name: str
     current_price: float
@@ -26,6 +53,8 @@ class MarketInfo(BaseModel):
 
 class CandleData(BaseModel):
     """캔들 데이터."""
+    model_config = ConfigDict(extra='ignore', frozen=True)
+
     timestamp: datetime
     open: float
     high: float
@@ -33,66 +62,85 @@ class CandleData(BaseModel):
     close: float
     volume: float
 
-@router.get("/list", response_model=List[MarketInfo])
+# 리스트 응답용 검증기 (스키마를 한 번만 생성해 재사용)
+_MARKET_LIST_ADAPTER = TypeAdapter(List[MarketInfo])
+_CANDLE_LIST_ADAPTER = TypeAdapter(List[CandleData])
+
+@router.get("/list", response_model=List[MarketInfo], response_model_exclude_none=True)
 async def get_market_list():
     """전체 종목 목록 조회."""
     try:
-        client = BithumbClient()
-
-        # 빗썸 전체 종목 조회
-        tickers = await client.get_all_tickers()
-
-        markets = []
-        for symbol, ticker_data in tickers.items():
-            if symbol == 'date':
-                continue
-
-            # 종목명 매핑 (실제로는 DB나 설정에서 관리)
-            symbol_name_map = {
-                'BTC': '비트코인',
-                'ETH': '이더리움',
-                'XRP': '리플',
-                'ADA': '에이다',
-                'DOT': '폴카닷'
-            }
-
-            current_price = float(ticker_data.get('closing_price', 0))
-            prev_closing = float(ticker_data.get('prev_closing_price', current_price))
-            change_24h = current_price - prev_closing
-            change_24h_percent = (change_24h / prev_closing * 100) if prev_closing > 0 else 0
+        # 짧은 TTL 내 동시 요청은 한 번의 거래소 호출 결과를 공유
+        cached = _market_list_cache["v"]
+        if cached is not None and time.monotonic() - _market_list_cache["t"] < _MARKET_LIST_TTL:
+            return ORJSONResponse(content=cached)
 
-            markets.append(MarketInfo(
-                symbol=f"{symbol}_KRW",
-                name=symbol_name_map.get(symbol, symbol),
-                current_price=current_price,
-                change_24h=change_24h,
-                change_24h_percent=round(change_24h_percent, 2),
-                volume_24h=float(ticker_data.get('units_traded_24H', 0)),
-                high_24h=float(ticker_data.get('max_price', 0)),
-                low_24h=float(ticker_data.get('min_price', 0))
-            ))
+        async with _market_list_lock:
+            cached = _market_list_cache["v"]
+            if cached is not None and time.monotonic() - _market_list_cache["t"] < _MARKET_LIST_TTL:
+                return ORJSONResponse(content=cached)
 
-        # 거래량 순으로 정렬
-        markets.sort(key=lambda x: x.volume_24h, reverse=True)
+            content = await _fetch_market_list()
+            _market_list_cache["v"] = content
+            _market_list_cache["t"] = time.monotonic()
 
-        return markets[:50]  # 상위 50개만
+        return ORJSONResponse(content=content)
 
     except Exception as e:
         logger.error(f"종목 목록 조회 실패: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+async def _fetch_market_list() -> List[Dict[str, Any]]:
+    """거래소에서 종목 목록을 조회해 거래량 상위 50개를 직렬화 형태로 반환."""
+    client = _get_client()
+
+    # 빗썸 전체 종목 조회
+    tickers = await client.get_all_tickers()
+
+    # 거래량 상위 50개를 먼저 선택한 뒤 해당 종목만 변환 (전체 정렬 없이 O(n log 50))
+    top_tickers = heapq.nlargest(
+        50,
+        ((symbol, data) for symbol, data in tickers.items() if symbol != 'date'),
+        key=lambda item: float(item[1].get('units_traded_24H', 0))
+    )
+
+    markets = []
+    for symbol, ticker_data in top_tickers:
+        current_price = float(ticker_data.get('closing_price', 0))
+        prev_closing = float(ticker_data.get('prev_closing_price', current_price))
+        change_24h = current_price - prev_closing
+        change_24h_percent = (change_24h / prev_closing * 100) if prev_closing > 0 else 0
+
+        markets.append({
+            'symbol': f"{symbol}_KRW",
+            'name': SYMBOL_NAME_MAP.get(symbol, symbol),
+            'current_price': current_price,
+            'change_24h': change_24h,
+            'change_24h_percent': round(change_24h_percent, 2),
+            'volume_24h': float(ticker_data.get('units_traded_24H', 0)),
+            'high_24h': float(ticker_data.get('max_price', 0)),
+            'low_24h': float(ticker_data.get('min_price', 0))
+        })
+
+    # 모델을 하나씩 생성하지 않고 리스트 단위로 한 번에 검증
+    top_markets = _MARKET_LIST_ADAPTER.validate_python(markets)
+
+    return _MARKET_LIST_ADAPTER.dump_python(top_markets, exclude_none=True)
+
 @router.get("/{symbol}")
 async def get_market_detail(symbol: str):
     """종목 상세 정보 조회."""
     try:
-        client = BithumbClient()
+        client = _get_client()
 
         # 심볼에서 _KRW 제거
         crypto_symbol = symbol.replace('_KRW', '')
 
-        # 종목 상세 정보 조회
-        ticker = await client.get_ticker(symbol)
-        orderbook = await client.get_orderbook(symbol)
+        # 종목 상세 정보 조회 (시세/호가 동시 요청)
+        ticker, orderbook = await asyncio.gather(
+            client.get_ticker(symbol),
+            client.get_orderbook(symbol)
+        )
 
         if not ticker:
             raise HTTPException(status_code=404, detail="종목을 찾을 수 없습니다")
@@ -132,14 +180,13 @@ async def get_candle_data(
         # 빗썸은 캔들 API가 제한적이므로 임시 데이터 생성
         # 실제로는 외부 데이터 소스나 수집된 데이터 사용
 
-        client = BithumbClient()
+        client = _get_client()
         ticker = await client.get_ticker(symbol)
 
         if not ticker:
             raise HTTPException(status_code=404, detail="종목을 찾을 수 없습니다")
 
         current_price = float(ticker.get('closing_price', 0))
-        candles = []
 
         # 간격 매핑
         interval_map = {
@@ -154,27 +201,37 @@ async def get_candle_data(
         minutes = interval_map.get(interval, 60)
         base_time = datetime.now() - timedelta(minutes=minutes * limit)
 
-        # 임시 캔들 데이터 생성 (실제 가격 기반)
-        for i in range(limit):
-            timestamp = base_time + timedelta(minutes=minutes * i)
-
-            # 가격 변동 시뮬레이션 (±1% 범위)
-            price_variation = 1 + (i % 10 - 5) / 500  # ±1% 변동
-            price = current_price * price_variation
-
-            candles.append(CandleData(
-                timestamp=timestamp,
-                open=price * 0.999,
-                high=price * 1.005,
-                low=price * 0.995,
-                close=price,
-                volume=1000000 + (i * 50000)
-            ))
+        # 임시 캔들 데이터 생성 (실제 가격 기반, 배열 단위 계산)
+        i = np.arange(max(limit, 0), dtype=np.int64)
+        timestamps = (np.datetime64(base_time, 'us') + i * np.timedelta64(minutes, 'm')).tolist()
+
+        # 가격 변동 시뮬레이션 (±1% 범위)
+        price = current_price * (1 + ((i % 10) - 5) / 500.0)
+        volume = 1000000 + i * 50000
+
+        candles = [
+            {
+                'timestamp': timestamp,
+                'open': open_,
+                'high': high,
+                'low': low,
+                'close': close,
+                'volume': vol
+            }
+            for timestamp, open_, high, low, close, vol in zip(
+                timestamps,
+                (price * 0.999).tolist(),
+                (price * 1.005).tolist(),
+                (price * 0.995).tolist(),
+                price.tolist(),
+                volume.tolist()
+            )
+        ]
 
         return {
             "symbol": symbol,
             "interval": interval,
-            "candles": candles
+            "candles": _CANDLE_LIST_ADAPTER.validate_python(candles)
         }
 
     except Exception as e:
@@ -185,7 +242,7 @@ async def get_candle_data(
 async def get_orderbook(symbol: str, depth: int = 20):
     """호가 정보 조회."""
     try:
-        client = BithumbClient()
+        client = _get_client()
 
         orderbook = await client.get_orderbook(symbol)
 
@@ -1,8 +1,9 @@
 """설정 API 라우터."""
 
-from typing import Dict, Any
+from typing import Dict, Any, Final
 
-from fastapi import APIRouter, HTTPException
+import orjson
+from fastapi import APIRouter, HTTPException, Response
 from pydantic import BaseModel
 
 from ...core.parameters import StrategyParameters, StrategyParameterStore
@@ -42,22 +43,41 @@ class NotificationConfig(BaseModel):
     slack_enabled: bool = False
     slack_webhook_url: str = ""
 
+# 실제로는 DB나 설정 파일에서 로드 (고정 응답이므로 모듈 로드 시 한 번만 직렬화)
+_STRATEGY_CONFIG_JSON: Final[bytes] = orjson.dumps(StrategyConfig(
+    ema_short_period=20,
+    ema_long_period=60,
+    rsi_period=14,
+    rsi_oversold=30,
+    rsi_overbought=70,
+    atr_period=14,
+    position_size_percent=5.0,
+    max_positions=5,
+    stop_loss_percent=3.0
+).model_dump())
+_RISK_CONFIG_JSON: Final[bytes] = orjson.dumps(RiskConfig(
+    max_daily_loss_percent=5.0,
+    max_position_size_percent=10.0,
+    max_open_positions=5,
+    stop_loss_percent=3.0,
+    take_profit_percent=10.0,
+    trailing_stop_percent=2.0
+).model_dump())
+_NOTIFICATION_CONFIG_JSON: Final[bytes] = orjson.dumps(NotificationConfig(
+    email_enabled=True,
+    email_address="user@example.com",
+    telegram_enabled=False,
+    telegram_bot_token="",
+    telegram_chat_id="",
+    slack_enabled=False,
+    slack_webhook_url=""
+).model_dump())
+
 @router.get("/strategy")
 async def get_strategy_config():
     """전략 설정 조회."""
     try:
-        # 실제로는 DB나 설정 파일에서 로드
-        return StrategyConfig(
-            ema_short_period=20,
-            ema_long_period=60,
-            rsi_period=14,
-            rsi_oversold=30,
-            rsi_overbought=70,
-            atr_period=14,
-            position_size_percent=5.0,
-            max_positions=5,
-            stop_loss_percent=3.0
-        )
+        return Response(content=_STRATEGY_CONFIG_JSON, media_type="application/json")
 
     except Exception as e:
         logger.error(f"전략 설정 조회 실패: {e}")
@@ -99,14 +119,7 @@ async def update_strategy_config(config: StrategyConfig):
 async def get_risk_config():
     """리스크 설정 조회."""
     try:
-        return RiskConfig(
-            max_daily_loss_percent=5.0,
-            max_position_size_percent=10.0,
-            max_open_positions=5,
-            stop_loss_percent=3.0,
-            take_profit_percent=10.0,
-            trailing_stop_percent=2.0
-        )
+        return Response(content=_RISK_CONFIG_JSON, media_type="application/json")
 
     except Exception as e:
         logger.error(f"리스크 설정 조회 실패: {e}")
@@ -141,15 +154,7 @@ async def update_risk_config(config: RiskConfig):
 async def get_notification_config():
     """알림 설정 조회."""
     try:
-        return NotificationConfig(
-            email_enabled=True,
-            email_address="user@example.com",
-            telegram_enabled=False,
-            telegram_bot_token="",
-            telegram_chat_id="",
-            slack_enabled=False,
-            slack_webhook_url=""
-        )
+        return Response(content=_NOTIFICATION_CONFIG_JSON, media_type="application/json")
 
     except Exception as e:
         logger.error(f"알림 설정 조회 실패: {e}")
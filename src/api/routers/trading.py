@@ -1,25 +1,40 @@
 """거래 API 라우터."""
 
+from bisect import bisect_left
 from datetime import datetime
-from typing import List, Optional
+from functools import lru_cache
+from typing import Any, Dict, Final, List, Literal, Optional, Tuple
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from pydantic import BaseModel, model_validator
 
 # from ...exchange.client import BithumbClient  # 임시로 주석 처리
+from ..caching import cached_response
 from ...utils.logger import get_logger
 
 logger = get_logger(__name__)
 router = APIRouter()
 
+@lru_cache(maxsize=1)
+def get_client() -> "BithumbClient":
+    """요청 간 공유되는 거래소 클라이언트 (최초 요청 시 생성)."""
+    return BithumbClient()
+
 class OrderRequest(BaseModel):
     """주문 요청."""
     symbol: str
-    side: str  # buy, sell
-    order_type: str  # market, limit
+    side: Literal['buy', 'sell']
+    order_type: Literal['market', 'limit']
     quantity: float
     price: Optional[float] = None
 
+    @model_validator(mode='after')
+    def _require_limit_price(self) -> 'OrderRequest':
+        """지정가 주문 가격 확인."""
+        if self.order_type == 'limit' and not self.price:
+            raise ValueError("지정가 주문에는 가격이 필요합니다")
+        return self
+
 class OrderResponse(BaseModel):
     """주문 응답."""
     order_id: str
@@ -31,22 +46,56 @@ class OrderResponse(BaseModel):
     status: str
     timestamp: datetime
 
+# 거래 내역 (임시 데이터, DB 연동 전)
+_TRADES: Final[Tuple[Dict[str, Any], ...]] = (
+    {
+        "trade_id": "trade_001",
+        "timestamp": "2025-09-22T13:30:00Z",
+        "symbol": "BTC_KRW",
+        "side": "buy",
+        "quantity": 0.001,
+        "price": 98500000,
+        "amount": 98500,
+        "fee": 246.25,
+        "order_id": "order_001"
+    },
+    {
+        "trade_id": "trade_002",
+        "timestamp": "2025-09-22T12:45:00Z",
+        "symbol": "ETH_KRW",
+        "side": "sell",
+        "quantity": 0.05,
+        "price": 3200000,
+        "amount": 160000,
+        "fee": 400,
+        "order_id": "order_002"
+    }
+)
+
+TradeKey = Tuple[str, str]
+TradeIndex = Tuple[Tuple[TradeKey, ...], Tuple[Dict[str, Any], ...]]
+
+def _trade_key(trade: Dict[str, Any]) -> TradeKey:
+    """커서 정렬 키 (timestamp, trade_id)."""
+    return trade['timestamp'], trade['trade_id']
+
+def _build_trade_index(trades) -> TradeIndex:
+    """커서 키 오름차순으로 정렬된 (키 목록, 거래 목록) 생성."""
+    ordered = tuple(sorted(trades, key=_trade_key))
+    return tuple(_trade_key(trade) for trade in ordered), ordered
+
+# 전체/심볼별 거래 내역 인덱스 (전체 스캔 없이 조회)
+_ALL_TRADES_INDEX: Final[TradeIndex] = _build_trade_index(_TRADES)
+_EMPTY_TRADES_INDEX: Final[TradeIndex] = ((), ())
+_TRADES_BY_SYMBOL: Final[Dict[str, TradeIndex]] = {
+    symbol: _build_trade_index(trade for trade in _TRADES if trade['symbol'] == symbol)
+    for symbol in {trade['symbol'] for trade in _TRADES}
+}
+
 @router.post("/orders", response_model=OrderResponse)
-async def create_order(order_request: OrderRequest):
+async def create_order(order_request: OrderRequest, client: "BithumbClient" = Depends(get_client)):
     """주문 생성."""
     try:
-        client = BithumbClient()
-
-        # 주문 유효성 검증
-        if order_request.side not in ['buy', 'sell']:
-            raise HTTPException(status_code=400, detail="잘못된 주문 유형")
-
-        if order_request.order_type not in ['market', 'limit']:
-            raise HTTPException(status_code=400, detail="잘못된 주문 타입")
-
-        if order_request.order_type == 'limit' and not order_request.price:
-            raise HTTPException(status_code=400, detail="지정가 주문에는 가격이 필요합니다")
-
         # 빗썸 API 주문 실행 (실제 구현)
         if order_request.side == 'buy':
             if order_request.order_type == 'market':
@@ -92,30 +141,31 @@ async def create_order(order_request: OrderRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/orders")
-async def get_orders(symbol: Optional[str] = None, status: Optional[str] = None):
+async def get_orders(
+    request: Request,
+    symbol: Optional[str] = None,
+    status: Optional[str] = None,
+    client: "BithumbClient" = Depends(get_client)
+):
     """주문 내역 조회."""
     try:
-        client = BithumbClient()
-
         # 빗썸 주문 내역 조회
         orders = await client.get_orders(symbol=symbol)
 
-        # 상태별 필터링
+        # 상태별 필터링 (빗썸 주문 조회는 상태 필터를 지원하지 않음)
         if status:
             orders = [order for order in orders if order.get('status') == status]
 
-        return {"orders": orders}
+        return cached_response(request, {"orders": orders})
 
     except Exception as e:
         logger.error(f"주문 내역 조회 실패: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.delete("/orders/{order_id}")
-async def cancel_order(order_id: str):
+async def cancel_order(order_id: str, client: "BithumbClient" = Depends(get_client)):
     """주문 취소."""
     try:
-        client = BithumbClient()
-
         # 빗썸 주문 취소
         result = await client.cancel_order(order_id)
 
@@ -130,51 +180,44 @@ async def cancel_order(order_id: str):
 
 @router.get("/trades")
 async def get_trade_history(
+    request: Request,
     symbol: Optional[str] = None,
-    limit: int = 50,
-    offset: int = 0
+    after: Optional[str] = Query(None, description="이전 페이지의 next_cursor (timestamp:trade_id)"),
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0, description="건너뛸 거래 수 (커서가 있으면 커서 이후 기준)")
 ):
-    """거래 내역 조회."""
+    """거래 내역 조회 (최신순, 커서 또는 offset 기반 페이징)."""
+    cursor: Optional[TradeKey] = None
+    if after:
+        timestamp, sep, trade_id = after.rpartition(':')
+        if not sep or not timestamp or not trade_id:
+            raise HTTPException(status_code=400, detail="잘못된 커서")
+        cursor = (timestamp, trade_id)
+
     try:
         # DB에서 거래 내역 조회 (실제 구현 필요)
-        trades = [
-            {
-                "trade_id": "trade_001",
-                "timestamp": "2025-09-22T13:30:00Z",
-                "symbol": "BTC_KRW",
-                "side": "buy",
-                "quantity": 0.001,
-                "price": 98500000,
-                "amount": 98500,
-                "fee": 246.25,
-                "order_id": "order_001"
-            },
-            {
-                "trade_id": "trade_002",
-                "timestamp": "2025-09-22T12:45:00Z",
-                "symbol": "ETH_KRW",
-                "side": "sell",
-                "quantity": 0.05,
-                "price": 3200000,
-                "amount": 160000,
-                "fee": 400,
-                "order_id": "order_002"
-            }
-        ]
-
-        # 심볼별 필터링
         if symbol:
-            trades = [trade for trade in trades if trade['symbol'] == symbol]
+            keys, trades = _TRADES_BY_SYMBOL.get(symbol, _EMPTY_TRADES_INDEX)
+        else:
+            keys, trades = _ALL_TRADES_INDEX
+
+        # 커서 이전(더 오래된) 거래 중 offset 개를 건너뛰고 최신순으로 limit 개
+        end = max(0, (bisect_left(keys, cursor) if cursor else len(trades)) - offset)
+        start = max(0, end - limit)
+        page = trades[start:end][::-1]
 
-        # 페이징
-        paginated_trades = trades[offset:offset + limit]
+        next_cursor = None
+        if start > 0 and page:
+            last = page[-1]
+            next_cursor = f"{last['timestamp']}:{last['trade_id']}"
 
-        return {
-            "trades": paginated_trades,
+        return cached_response(request, {
+            "trades": page,
+            "next_cursor": next_cursor,
             "total": len(trades),
             "limit": limit,
             "offset": offset
-        }
+        })
 
     except Exception as e:
         logger.error(f"거래 내역 조회 실패: {e}")
@@ -1,24 +1,37 @@
 """거래 API 라우터 - 단순 버전."""
 
+import itertools
+import time
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, Final, List, Literal, Optional, Tuple
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+from fastapi import APIRouter, HTTPException, Request
+from pydantic import BaseModel, model_validator
 
+from ..caching import cached_response
 from ...utils.logger import get_logger
 
 logger = get_logger(__name__)
 router = APIRouter()
 
+# Mock 주문 ID 일련번호 (시작 시각 기반 시드로 재시작 간 중복 최소화)
+_order_sequence = itertools.count(int(time.time() * 1000) & 0xFFFFFFFF)
+
 class OrderRequest(BaseModel):
     """주문 요청."""
     symbol: str
-    side: str  # buy, sell
-    order_type: str  # market, limit
+    side: Literal['buy', 'sell']
+    order_type: Literal['market', 'limit']
     quantity: float
     price: Optional[float] = None
 
+    @model_validator(mode='after')
+    def _require_limit_price(self) -> 'OrderRequest':
+        """지정가 주문 가격 확인."""
+        if self.order_type == 'limit' and not self.price:
+            raise ValueError("지정가 주문에는 가격이 필요합니다")
+        return self
+
 class OrderResponse(BaseModel):
     """주문 응답."""
     order_id: str
@@ -30,23 +43,36 @@ class OrderResponse(BaseModel):
     status: str
     timestamp: datetime
 
+# 주문 내역 (임시 데이터)
+_ORDERS: Final[Tuple[Dict[str, Any], ...]] = (
+    {
+        "order_id": "order_12345",
+        "symbol": "BTC_KRW",
+        "side": "buy",
+        "order_type": "limit",
+        "quantity": 0.001,
+        "price": 98000000,
+        "status": "filled",
+        "timestamp": "2025-09-22T13:30:00Z"
+    },
+    {
+        "order_id": "order_12346",
+        "symbol": "ETH_KRW",
+        "side": "sell",
+        "order_type": "market",
+        "quantity": 0.05,
+        "price": None,
+        "status": "pending",
+        "timestamp": "2025-09-22T13:45:00Z"
+    }
+)
+
 @router.post("/orders", response_model=OrderResponse)
 async def create_order(order_request: OrderRequest):
     """주문 생성."""
     try:
-        # 주문 유효성 검증
-        if order_request.side not in ['buy', 'sell']:
-            raise HTTPException(status_code=400, detail="잘못된 주문 유형")
-
-        if order_request.order_type not in ['market', 'limit']:
-            raise HTTPException(status_code=400, detail="잘못된 주문 타입")
-
-        if order_request.order_type == 'limit' and not order_request.price:
-            raise HTTPException(status_code=400, detail="지정가 주문에는 가격이 필요합니다")
-
         # Mock 주문 ID 생성
-        import uuid
-        order_id = f"order_{uuid.uuid4().hex[:8]}"
+        order_id = f"order_{next(_order_sequence):08x}"
 
         return OrderResponse(
             order_id=order_id,
@@ -64,40 +90,19 @@ async def create_order(order_request: OrderRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/orders")
-async def get_orders(symbol: Optional[str] = None, status: Optional[str] = None):
+async def get_orders(request: Request, symbol: Optional[str] = None, status: Optional[str] = None):
     """주문 내역 조회."""
     try:
-        # Mock 주문 내역
+        # 필터가 있을 때만 새 목록 생성
+        if not symbol and not status:
+            return cached_response(request, {"orders": _ORDERS})
+
         orders = [
-            {
-                "order_id": "order_12345",
-                "symbol": "BTC_KRW",
-                "side": "buy",
-                "order_type": "limit",
-                "quantity": 0.001,
-                "price": 98000000,
-                "status": "filled",
-                "timestamp": "2025-09-22T13:30:00Z"
-            },
-            {
-                "order_id": "order_12346",
-                "symbol": "ETH_KRW",
-                "side": "sell",
-                "order_type": "market",
-                "quantity": 0.05,
-                "price": None,
-                "status": "pending",
-                "timestamp": "2025-09-22T13:45:00Z"
-            }
+            order for order in _ORDERS
+            if (not symbol or order['symbol'] == symbol)
+            and (not status or order['status'] == status)
         ]
-
-        # 필터링
-        if symbol:
-            orders = [order for order in orders if order['symbol'] == symbol]
-        if status:
-            orders = [order for order in orders if order['status'] == status]
-
-        return {"orders": orders}
+        return cached_response(request, {"orders": orders})
 
     except Exception as e:
         logger.error(f"주문 내역 조회 실패: {e}")
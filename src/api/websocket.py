@@ -1,10 +1,14 @@
 """WebSocket 실시간 통신."""
 
-import json
+import time
 import asyncio
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Set, Tuple
 
+import httpx
+import numpy as np
+import orjson
+import ormsgpack
 from fastapi import WebSocket, WebSocketDisconnect
 from fastapi.applications import FastAPI
 
@@ -13,54 +17,293 @@ from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 빗썸 공개 API (keep-alive 커넥션 풀로 호출)
+BITHUMB_API_URL = "https://api.bithumb.com"
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=40, keepalive_expiry=85.0)
+
+# 시세 캐시 유효 시간 (가격 틱 주기 2초보다 약간 길게)
+TICKER_CACHE_TTL = 3.0
+
+# 브로드캐스트 묶음 전송 대기 시간 (초)
+BROADCAST_BATCH_WINDOW = 0.05
+
+# 연결별 전송 대기열 크기 (초과 시 느린 클라이언트로 보고 연결 해제)
+SEND_QUEUE_SIZE = 32
+
 class ConnectionManager:
     """WebSocket 연결 관리자."""
 
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Set[WebSocket] = set()
+        # 바이너리(MessagePack) 프레임을 요청한 연결
+        self._msgpack_connections: Set[WebSocket] = set()
+        # 묶음 전송({"type": "batch", "messages": [...]})을 요청한 연결
+        self._batch_connections: Set[WebSocket] = set()
+        # 직전 전송분과 달라진 종목만 가격 업데이트로 받기를 요청한 연결
+        self._delta_connections: Set[WebSocket] = set()
+        # 연결별 (전송 대기열, 전송 태스크)
+        self._writers: Dict[WebSocket, Tuple[asyncio.Queue, asyncio.Task]] = {}
         # self.client = BithumbClient()  # 임시로 주석 처리
+        self._http: Optional[httpx.AsyncClient] = None
+        # 종목별 (조회 시각, 시세) 캐시 - 가격/포트폴리오 스트림 공유
+        self._ticker_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        # delta 연결에 마지막으로 전송한 종목별 (가격, 변동, 변동률, 거래량)
+        self._last_price_snapshot: Dict[str, Tuple[float, float, float, float]] = {}
+        # 브로드캐스트 대기열 (전체 메시지, delta 연결용 메시지) 및 묶음 전송 태스크
+        self._out_queue: asyncio.Queue = asyncio.Queue()
+        self._flusher: Optional[asyncio.Task] = None
+
+    def _get_http(self) -> httpx.AsyncClient:
+        """공개 API용 HTTP 커넥션 풀 (최초 호출 시 생성)."""
+        if self._http is None:
+            self._http = httpx.AsyncClient(base_url=BITHUMB_API_URL, limits=HTTP_LIMITS, timeout=10.0)
+        return self._http
+
+    async def get_ticker(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """현재가 조회 (커넥션 재사용)."""
+        response = await self._get_http().get(f"/public/ticker/{symbol}")
+        response.raise_for_status()
+        data = response.json()
+        if data.get('status') == '0000':
+            return data.get('data')
+        return None
+
+    async def get_all_tickers(self) -> Dict[str, Dict[str, Any]]:
+        """원화 마켓 전체 시세를 한 번에 조회."""
+        response = await self._get_http().get("/public/ticker/ALL_KRW")
+        response.raise_for_status()
+        data = response.json()
+        if data.get('status') != '0000':
+            return {}
+        return {
+            f"{coin}_KRW": ticker
+            for coin, ticker in data.get('data', {}).items()
+            if coin != 'date'
+        }
+
+    async def cached_ticker(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """TTL 내 캐시된 시세 반환, 없으면 조회 후 캐시."""
+        entry = self._ticker_cache.get(symbol)
+        if entry is not None and time.monotonic() - entry[0] < TICKER_CACHE_TTL:
+            return entry[1]
+
+        ticker = await self.get_ticker(symbol)
+        if ticker:
+            self._ticker_cache[symbol] = (time.monotonic(), ticker)
+        return ticker
+
+    async def warmup(self):
+        """커넥션 풀 예열 (첫 틱의 TCP/TLS 핸드셰이크 비용 제거)."""
+        try:
+            await self.get_ticker("BTC_KRW")
+        except Exception as e:
+            logger.warning(f"커넥션 풀 예열 실패: {e}")
+
+    async def close(self):
+        """브로드캐스트 태스크 및 HTTP 커넥션 풀 종료."""
+        for websocket in tuple(self.active_connections):
+            self.disconnect(websocket)
+        if self._flusher is not None:
+            self._flusher.cancel()
+            await asyncio.gather(self._flusher, return_exceptions=True)
+            self._flusher = None
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
 
     async def connect(self, websocket: WebSocket):
         """클라이언트 연결."""
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections.add(websocket)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SEND_QUEUE_SIZE)
+        self._writers[websocket] = (queue, asyncio.create_task(self._writer(websocket, queue)))
         logger.info(f"WebSocket 클라이언트 연결: {len(self.active_connections)}명")
 
     def disconnect(self, websocket: WebSocket):
         """클라이언트 연결 해제."""
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+        # 엔드포인트와 브로드캐스트 양쪽에서 동시에 호출될 수 있으므로 한 번만 처리
+        if websocket not in self.active_connections:
+            return
+        self.active_connections.discard(websocket)
+        self._msgpack_connections.discard(websocket)
+        self._batch_connections.discard(websocket)
+        self._delta_connections.discard(websocket)
+        writer = self._writers.pop(websocket, None)
+        if writer is not None and writer[1] is not asyncio.current_task():
+            writer[1].cancel()
         logger.info(f"WebSocket 클라이언트 연결 해제: {len(self.active_connections)}명")
 
+    def set_format(self, websocket: WebSocket, message_format: str):
+        """연결별 전송 포맷 설정 (json 또는 msgpack)."""
+        if message_format == "msgpack":
+            self._msgpack_connections.add(websocket)
+        else:
+            self._msgpack_connections.discard(websocket)
+
+    def set_batch(self, websocket: WebSocket, enabled: bool):
+        """연결별 묶음 전송 설정 (기본은 메시지마다 개별 프레임)."""
+        if enabled:
+            self._batch_connections.add(websocket)
+        else:
+            self._batch_connections.discard(websocket)
+
+    def set_delta(self, websocket: WebSocket, enabled: bool):
+        """연결별 변경분 가격 업데이트 설정 (기본은 매 틱 전체 시세)."""
+        if enabled:
+            self._delta_connections.add(websocket)
+            # 새 delta 클라이언트가 다음 틱에서 전체 시세를 받도록 초기화
+            self._last_price_snapshot.clear()
+        else:
+            self._delta_connections.discard(websocket)
+
     async def send_personal_message(self, message: Dict[str, Any], websocket: WebSocket):
         """개별 메시지 전송."""
         try:
-            await websocket.send_text(json.dumps(message))
+            if websocket in self._msgpack_connections:
+                await websocket.send_bytes(ormsgpack.packb(message))
+            else:
+                await websocket.send_text(orjson.dumps(message).decode())
         except Exception as e:
             logger.error(f"개별 메시지 전송 실패: {e}")
 
     async def broadcast(self, message: Dict[str, Any]):
-        """모든 연결된 클라이언트에 브로드캐스트."""
+        """모든 연결된 클라이언트에 브로드캐스트 (짧은 시간 창 단위로 묶어 전송)."""
         if not self.active_connections:
             return
 
-        disconnected = []
-        for connection in self.active_connections:
+        self._enqueue(message, message)
+
+    async def broadcast_price_update(self, price_data: Dict[str, Dict[str, Any]]):
+        """가격 업데이트 브로드캐스트 (delta 연결에는 직전 전송분과 달라진 종목만 전송)."""
+        if not self.active_connections:
+            return
+
+        delta_message = None
+        if self._delta_connections:
+            snapshot = self._last_price_snapshot
+            delta = {}
+            for symbol, data in price_data.items():
+                values = (data["price"], data["change_24h"], data["change_rate_24h"], data["volume_24h"])
+                if snapshot.get(symbol) != values:
+                    snapshot[symbol] = values
+                    delta[symbol] = data
+            if delta:
+                delta_message = {"type": "price_update", "data": delta}
+
+        self._enqueue({"type": "price_update", "data": price_data}, delta_message)
+
+    def _enqueue(self, message: Dict[str, Any], delta_message: Optional[Dict[str, Any]]):
+        """브로드캐스트 대기열에 적재 (delta_message가 None이면 delta 연결에는 전송하지 않음)."""
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._flush_broadcasts())
+        self._out_queue.put_nowait((message, delta_message))
+
+    async def _flush_broadcasts(self):
+        """대기열의 메시지를 시간 창 안에서 모아 한 번에 전송."""
+        loop = asyncio.get_running_loop()
+        while True:
+            entries = [await self._out_queue.get()]
+            deadline = loop.time() + BROADCAST_BATCH_WINDOW
+            while True:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    entries.append(await asyncio.wait_for(self._out_queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+
             try:
-                await connection.send_text(json.dumps(message))
+                self._send_all(entries)
             except Exception as e:
-                logger.error(f"브로드캐스트 실패: {e}")
-                disconnected.append(connection)
+                logger.error(f"브로드캐스트 묶음 전송 실패: {e}")
+
+    def _send_all(self, entries: List[Tuple[Dict[str, Any], Optional[Dict[str, Any]]]]):
+        """현재 연결된 모든 클라이언트의 전송 대기열에 적재."""
+        if not self.active_connections:
+            return
 
-        # 연결이 끊어진 클라이언트 제거
-        for connection in disconnected:
+        # 적재 중 connect/disconnect가 일어나도 영향받지 않도록 스냅샷 사용
+        # (모든 변경은 await 없이 같은 이벤트 루프에서 일어나므로 별도 락 불필요)
+        connections = tuple(self.active_connections)
+
+        # 같은 옵션(포맷, 묶음, 변경분 여부)의 연결은 동일한 프레임이므로 조합별로 한 번만 직렬화
+        frames_by_option: Dict[Tuple[bool, bool, bool], List[Any]] = {}
+
+        # 실제 전송은 연결별 태스크가 담당하므로 느린 클라이언트가 다른 전송을 막지 않음
+        overflowed = []
+        for connection in connections:
+            writer = self._writers.get(connection)
+            if writer is None:
+                continue
+            option = (
+                connection in self._msgpack_connections,
+                connection in self._batch_connections,
+                connection in self._delta_connections
+            )
+            frames = frames_by_option.get(option)
+            if frames is None:
+                frames = frames_by_option[option] = self._encode(entries, *option)
+            try:
+                for frame in frames:
+                    writer[0].put_nowait(frame)
+            except asyncio.QueueFull:
+                overflowed.append(connection)
+
+        # 대기열이 가득 찬 클라이언트 연결 해제
+        for connection in overflowed:
+            logger.warning("전송 대기열 초과로 느린 클라이언트 연결 해제")
             self.disconnect(connection)
+            asyncio.create_task(self._close_quietly(connection))
+
+    @staticmethod
+    def _encode(
+        entries: List[Tuple[Dict[str, Any], Optional[Dict[str, Any]]]],
+        binary: bool,
+        batch: bool,
+        delta: bool
+    ) -> List[Any]:
+        """연결 옵션에 맞춰 전송 프레임 생성 (묶음 전송은 2개 이상일 때만 봉투 사용)."""
+        if delta:
+            messages = [delta_message for _, delta_message in entries if delta_message is not None]
+        else:
+            messages = [message for message, _ in entries]
+        if not messages:
+            return []
+        if batch and len(messages) > 1:
+            messages = [{"type": "batch", "messages": messages}]
+        if binary:
+            return [ormsgpack.packb(message) for message in messages]
+        return [orjson.dumps(message).decode() for message in messages]
+
+    async def _writer(self, websocket: WebSocket, queue: asyncio.Queue):
+        """연결별 전송 대기열을 순서대로 전송."""
+        try:
+            while True:
+                payload = await queue.get()
+                if isinstance(payload, bytes):
+                    await websocket.send_bytes(payload)
+                else:
+                    await websocket.send_text(payload)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"브로드캐스트 실패: {e}")
+            self.disconnect(websocket)
+
+    async def _close_quietly(self, websocket: WebSocket):
+        """연결 종료 (이미 끊어진 경우 무시)."""
+        try:
+            await websocket.close(code=1013)
+        except Exception:
+            pass
 
     async def start_price_stream(self):
         """실시간 가격 스트림 시작."""
         logger.info("실시간 가격 스트림 시작")
 
         symbols = ["BTC_KRW", "ETH_KRW", "XRP_KRW", "ADA_KRW"]
+        await self.warmup()
 
         while True:
             try:
@@ -68,10 +311,18 @@ class ConnectionManager:
                     await asyncio.sleep(5)
                     continue
 
-                # 주요 종목 가격 조회
+                # 전체 시세 한 번 조회 후 주요 종목만 추출
+                all_tickers = await self.get_all_tickers()
+                fetched_at = time.monotonic()
+                self._ticker_cache.update(
+                    (symbol, (fetched_at, ticker)) for symbol, ticker in all_tickers.items()
+                )
+
+                # 같은 틱의 종목들은 하나의 시각 문자열 공유
+                timestamp = datetime.now().isoformat()
                 price_data = {}
                 for symbol in symbols:
-                    ticker = await self.client.get_ticker(symbol)
+                    ticker = all_tickers.get(symbol)
                     if ticker:
                         price_data[symbol] = {
                             "symbol": symbol,
@@ -79,14 +330,11 @@ class ConnectionManager:
                             "change_24h": float(ticker.get('fluctate_24H', 0)),
                             "change_rate_24h": float(ticker.get('fluctate_rate_24H', 0)),
                             "volume_24h": float(ticker.get('units_traded_24H', 0)),
-                            "timestamp": datetime.now().isoformat()
+                            "timestamp": timestamp
                         }
 
                 if price_data:
-                    await self.broadcast({
-                        "type": "price_update",
-                        "data": price_data
-                    })
+                    await self.broadcast_price_update(price_data)
 
                 await asyncio.sleep(2)  # 2초마다 업데이트
 
@@ -115,26 +363,50 @@ class ConnectionManager:
                         "timestamp": datetime.now().isoformat()
                     }
 
-                    # 보유 코인 정보
-                    for symbol, info in balance.items():
-                        if symbol in ['KRW', 'date']:
-                            continue
-
-                        available = float(info.get('available', 0))
-                        in_use = float(info.get('in_use', 0))
-                        total_quantity = available + in_use
-
-                        if total_quantity > 0:
-                            # 현재가 조회
-                            ticker = await self.client.get_ticker(f'{symbol}_KRW')
-                            current_price = float(ticker.get('closing_price', 0)) if ticker else 0
-
-                            portfolio_data["positions"].append({
-                                "symbol": f"{symbol}_KRW",
-                                "quantity": total_quantity,
-                                "current_price": current_price,
-                                "market_value": total_quantity * current_price
-                            })
+                    # 보유 코인 수량 (available + in_use)
+                    coins = [symbol for symbol in balance if symbol not in ('KRW', 'date')]
+                    quantities = np.fromiter(
+                        (
+                            float(balance[symbol].get('available', 0)) + float(balance[symbol].get('in_use', 0))
+                            for symbol in coins
+                        ),
+                        dtype=np.float64,
+                        count=len(coins)
+                    )
+                    held = quantities > 0
+                    holdings = [symbol for symbol, is_held in zip(coins, held) if is_held]
+                    quantities = quantities[held]
+
+                    # 가격 스트림이 캐시한 시세 우선 사용, 만료/누락 종목만 조회
+                    tickers = await asyncio.gather(
+                        *(self.cached_ticker(f'{symbol}_KRW') for symbol in holdings),
+                        return_exceptions=True
+                    )
+                    prices = np.empty(len(holdings), dtype=np.float64)
+                    for i, (symbol, ticker) in enumerate(zip(holdings, tickers)):
+                        if isinstance(ticker, Exception):
+                            logger.error(f"{symbol}_KRW 시세 조회 실패: {ticker}")
+                            prices[i] = np.nan
+                        else:
+                            prices[i] = float(ticker.get('closing_price', 0)) if ticker else 0
+
+                    # 평가금액 일괄 계산 (조회 실패 종목 제외)
+                    priced = ~np.isnan(prices)
+                    market_values = quantities * prices
+                    portfolio_data["positions"] = [
+                        {
+                            "symbol": f"{symbol}_KRW",
+                            "quantity": quantity,
+                            "current_price": price,
+                            "market_value": market_value
+                        }
+                        for symbol, quantity, price, market_value in zip(
+                            [symbol for symbol, ok in zip(holdings, priced) if ok],
+                            quantities[priced].tolist(),
+                            prices[priced].tolist(),
+                            market_values[priced].tolist()
+                        )
+                    ]
 
                     await self.broadcast({
                         "type": "portfolio_update",
@@ -166,8 +438,8 @@ class WebSocketManager:
     def __init__(self):
         self.app = FastAPI()
         self.manager = manager
+        self._tasks: List[asyncio.Task] = []
         self._setup_routes()
-        self._start_background_tasks()
 
     def _setup_routes(self):
         """WebSocket 라우트 설정."""
@@ -179,7 +451,7 @@ class WebSocketManager:
                 while True:
                     # 클라이언트로부터 메시지 수신 대기
                     data = await websocket.receive_text()
-                    message = json.loads(data)
+                    message = orjson.loads(data)
 
                     # 메시지 타입별 처리
                     if message.get("type") == "ping":
@@ -189,31 +461,48 @@ class WebSocketManager:
                         )
                     elif message.get("type") == "subscribe":
                         # 구독 요청 처리
+                        # (format: json | msgpack, batch: 묶음 전송, delta: 변경 종목만 가격 업데이트)
+                        message_format = message.get("format", "json")
+                        batch = bool(message.get("batch", False))
+                        delta = bool(message.get("delta", False))
+                        self.manager.set_format(websocket, message_format)
+                        self.manager.set_batch(websocket, batch)
+                        self.manager.set_delta(websocket, delta)
                         await self.manager.send_personal_message(
-                            {"type": "subscribed", "channels": message.get("channels", [])},
+                            {
+                                "type": "subscribed",
+                                "channels": message.get("channels", []),
+                                "format": message_format,
+                                "batch": batch,
+                                "delta": delta
+                            },
                             websocket
                         )
 
             except WebSocketDisconnect:
                 self.manager.disconnect(websocket)
 
-    def _start_background_tasks(self):
-        """백그라운드 태스크 시작."""
-        import threading
-
-        def start_price_stream():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            loop.run_until_complete(self.manager.start_price_stream())
+    async def start(self):
+        """
+        백그라운드 스트림을 현재 이벤트 루프에 태스크로 등록.
 
-        def start_portfolio_stream():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            loop.run_until_complete(self.manager.start_portfolio_stream())
-
-        # 별도 스레드에서 실행
-        threading.Thread(target=start_price_stream, daemon=True).start()
-        threading.Thread(target=start_portfolio_stream, daemon=True).start()
+        마운트된 하위 앱의 lifespan/startup 이벤트는 실행되지 않으므로,
+        self.app을 마운트하는 앱의 lifespan에서 start()/stop()을 함께 호출해야 합니다.
+        """
+        if self._tasks:
+            return
+        self._tasks = [
+            asyncio.create_task(self.manager.start_price_stream()),
+            asyncio.create_task(self.manager.start_portfolio_stream()),
+        ]
+
+    async def stop(self):
+        """백그라운드 스트림 취소 및 커넥션 풀 종료."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        await self.manager.close()
 
 # 전역 WebSocket 매니저
 websocket_manager = WebSocketManager()
\ No newline at end of file
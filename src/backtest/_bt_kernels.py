@@ -0,0 +1,249 @@
+"""백테스트 수치 연산 커널 (Numba JIT)."""
+
+import os
+
+import numpy as np
+from numba import njit
+
+# 거래 유형 코드
+TRADE_BUY = 0
+TRADE_SELL = 1
+TRADE_STOP_LOSS = 2
+
+TRADE_TYPE_NAMES = ('buy', 'sell', 'stop_loss')
+
+
+@njit(cache=True)
+def run_backtest(close, signal, atr, initial_cash, position_size_percent, stop_loss_atr_multiplier):
+    """
+    단일 포지션 롱 전략의 봉 단위 시뮬레이션.
+
+    Args:
+        close: 종가 배열 (float64)
+        signal: 시그널 배열 (1 매수, -1 매도, 0 유지)
+        atr: ATR 배열 (float64, NaN 허용)
+        initial_cash: 초기 현금
+        position_size_percent: 진입 시 자산 대비 투자 비율 (%)
+        stop_loss_atr_multiplier: 손절 ATR 배수
+
+    Returns:
+        (거래 수, 거래 봉 인덱스, 거래 유형, 거래 가격, 거래 수량, 거래 손익,
+         봉별 자산, 봉별 현금, 봉별 포지션 가치)
+    """
+    n = close.shape[0]
+
+    trade_idx = np.empty(n, np.int64)
+    trade_type = np.empty(n, np.int8)
+    trade_price = np.empty(n, np.float64)
+    trade_qty = np.empty(n, np.float64)
+    trade_pnl = np.empty(n, np.float64)
+
+    equity = np.empty(n, np.float64)
+    cash_curve = np.empty(n, np.float64)
+    position_curve = np.empty(n, np.float64)
+
+    # ATR 기반 손절 폭을 미리 계산 (ATR이 양수가 아니거나 NaN이면 손절하지 않음)
+    sl_offset = np.full(n, np.nan)
+    for i in range(n):
+        if atr[i] > 0:
+            sl_offset[i] = atr[i] * stop_loss_atr_multiplier
+
+    cash = initial_cash
+    position = 0.0
+    position_value = 0.0
+    entry_price = 0.0
+    n_trades = 0
+
+    for i in range(n):
+        current_price = close[i]
+
+        # 포지션 가치 업데이트
+        if position > 0:
+            position_value = position * current_price
+
+        total_equity = cash + position_value
+
+        if signal[i] == 1 and position == 0:  # 매수 진입
+            position = (total_equity * position_size_percent / 100) / current_price
+            cash -= position * current_price
+            entry_price = current_price
+
+            trade_idx[n_trades] = i
+            trade_type[n_trades] = TRADE_BUY
+            trade_price[n_trades] = current_price
+            trade_qty[n_trades] = position
+            trade_pnl[n_trades] = 0.0
+            n_trades += 1
+
+        elif signal[i] == -1 and position > 0:  # 매도 청산
+            cash += position * current_price
+
+            trade_idx[n_trades] = i
+            trade_type[n_trades] = TRADE_SELL
+            trade_price[n_trades] = current_price
+            trade_qty[n_trades] = position
+            trade_pnl[n_trades] = (current_price - entry_price) * position
+            n_trades += 1
+
+            position = 0.0
+            position_value = 0.0
+
+        elif position > 0 and current_price <= entry_price - sl_offset[i]:  # 손절
+            cash += position * current_price
+
+            trade_idx[n_trades] = i
+            trade_type[n_trades] = TRADE_STOP_LOSS
+            trade_price[n_trades] = current_price
+            trade_qty[n_trades] = position
+            trade_pnl[n_trades] = (current_price - entry_price) * position
+            n_trades += 1
+
+            position = 0.0
+            position_value = 0.0
+
+        # 자산 곡선 기록
+        equity[i] = cash + position_value
+        cash_curve[i] = cash
+        position_curve[i] = position_value
+
+    return (
+        n_trades, trade_idx, trade_type, trade_price, trade_qty, trade_pnl,
+        equity, cash_curve, position_curve
+    )
+
+
+@njit(cache=True)
+def ema(values, span):
+    """지수이동평균 (pandas ewm(span=span).mean()과 동일, adjust=True)."""
+    n = values.shape[0]
+    out = np.empty(n, np.float64)
+    decay = 1.0 - 2.0 / (span + 1.0)
+    numerator = 0.0
+    denominator = 0.0
+
+    for i in range(n):
+        value = values[i]
+        if np.isnan(value):
+            numerator *= decay
+            denominator *= decay
+        else:
+            numerator = value + decay * numerator
+            denominator = 1.0 + decay * denominator
+        out[i] = numerator / denominator if denominator > 0 else np.nan
+
+    return out
+
+
+@njit(cache=True)
+def rolling_mean_std(values, window):
+    """이동평균과 이동표준편차(ddof=1) 동시 계산 (창 안에 NaN이 있으면 NaN)."""
+    n = values.shape[0]
+    mean = np.full(n, np.nan)
+    std = np.full(n, np.nan)
+
+    for i in range(window - 1, n):
+        total = 0.0
+        valid = True
+        for j in range(i - window + 1, i + 1):
+            if np.isnan(values[j]):
+                valid = False
+                break
+            total += values[j]
+        if not valid:
+            continue
+
+        window_mean = total / window
+        squared = 0.0
+        for j in range(i - window + 1, i + 1):
+            diff = values[j] - window_mean
+            squared += diff * diff
+
+        mean[i] = window_mean
+        if window > 1:
+            std[i] = np.sqrt(squared / (window - 1))
+
+    return mean, std
+
+
+@njit(cache=True)
+def bollinger_bands(values, window, num_std):
+    """볼린저 밴드 중심/상단/하단을 임시 배열 없이 계산."""
+    middle, std = rolling_mean_std(values, window)
+    n = values.shape[0]
+    upper = np.empty(n)
+    lower = np.empty(n)
+
+    for i in range(n):
+        band = std[i] * num_std
+        upper[i] = middle[i] + band
+        lower[i] = middle[i] - band
+
+    return middle, upper, lower
+
+
+@njit(cache=True)
+def rsi(close, period):
+    """단순 이동평균 RSI (상승/하락폭 평균과 RSI 변환을 한 번에 계산)."""
+    n = close.shape[0]
+    gains = np.zeros(n)
+    losses = np.zeros(n)
+
+    # 첫 봉과 NaN 변화량은 상승/하락 모두 0으로 취급
+    for i in range(1, n):
+        delta = close[i] - close[i - 1]
+        if delta > 0:
+            gains[i] = delta
+        elif delta < 0:
+            losses[i] = -delta
+
+    result = np.full(n, np.nan)
+    for i in range(period - 1, n):
+        gain_total = 0.0
+        loss_total = 0.0
+        for j in range(i - period + 1, i + 1):
+            gain_total += gains[j]
+            loss_total += losses[j]
+
+        gain = gain_total / period
+        loss = loss_total / period
+        if loss == 0.0:
+            if gain > 0.0:
+                result[i] = 100.0
+        else:
+            result[i] = 100 - (100 / (1 + gain / loss))
+
+    return result
+
+
+@njit(cache=True)
+def true_range(high, low, close):
+    """True Range를 한 번의 순회로 계산 (첫 봉과 NaN 입력은 NaN)."""
+    n = close.shape[0]
+    tr = np.full(n, np.nan)
+
+    for i in range(1, n):
+        prev_close = close[i - 1]
+        high_low = high[i] - low[i]
+        high_close = abs(high[i] - prev_close)
+        low_close = abs(low[i] - prev_close)
+        if np.isnan(high_low) or np.isnan(high_close) or np.isnan(low_close):
+            continue
+        tr[i] = max(high_low, high_close, low_close)
+
+    return tr
+
+
+def warmup() -> None:
+    """작은 입력으로 미리 호출해 JIT 컴파일 비용을 선지불."""
+    close = np.ones(2, np.float64)
+    run_backtest(close, np.zeros(2, np.int8), close, 1.0, 10.0, 2.0)
+    ema(close, 2)
+    rolling_mean_std(close, 2)
+    true_range(close, close, close)
+    bollinger_bands(close, 2, 2.0)
+    rsi(close, 2)
+
+
+# 임포트 시점에 컴파일/캐시 로드 (프로세스 풀 워커 포함), BITT_JIT_WARMUP=0이면 생략
+if os.environ.get('BITT_JIT_WARMUP', '1') == '1':
+    warmup()
@@ -5,22 +5,42 @@ import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import Dict, List, Optional, Tuple, Any
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Any, Union
 from dataclasses import dataclass
 import concurrent.futures
+import hashlib
+import math
+import os
 from multiprocessing import Pool, cpu_count
+from pathlib import Path
 
+from . import _bt_kernels
 from .real_data_collector import RealDataCollector, CandleData
+from .data_collector import CandleBatch, as_candle_batch
 from .performance import PerformanceAnalyzer
-from ..core.strategy import TradingStrategy
 from ..core.signals import SignalGenerator
 from ..core.risk import RiskManager
 from ..core.parameters import StrategyParameters
-from ..exchange.bithumb_unified_client import BithumbUnifiedClient
 from ..utils.logger import get_logger
 
+if TYPE_CHECKING:
+    from ..exchange.bithumb_unified_client import BithumbUnifiedClient
+
 logger = get_logger(__name__)
 
+MAX_WORKERS = min(cpu_count(), 8)
+
+# 지표/시그널/백테스트 작업용 공유 프로세스 풀 (최초 사용 시 생성)
+_process_pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+
+
+def _get_process_pool() -> concurrent.futures.ProcessPoolExecutor:
+    """공유 프로세스 풀 반환."""
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = concurrent.futures.ProcessPoolExecutor(max_workers=MAX_WORKERS)
+    return _process_pool
+
 
 @dataclass
 class BacktestResult:
@@ -32,18 +52,23 @@ class BacktestResult:
     final_capital: float
     total_return: float
     trades: List[Dict[str, Any]]
-    equity_curve: List[Dict[str, Any]]
+    equity_curve: pd.DataFrame  # timestamp 인덱스, equity/cash/position_value 컬럼
     performance_metrics: Dict[str, float]
     execution_time: float
 
+    def equity_curve_records(self) -> List[Dict[str, Any]]:
+        """자산 곡선을 기존 딕셔너리 리스트 형식으로 변환."""
+        return self.equity_curve.reset_index().to_dict('records')
+
 
 class AsyncBacktestEngine:
     """비동기 백테스트 엔진."""
 
     def __init__(
         self,
-        bithumb_client: BithumbUnifiedClient,
-        initial_capital: Decimal = Decimal('1000000')
+        bithumb_client: "BithumbUnifiedClient",
+        initial_capital: Decimal = Decimal('1000000'),
+        indicator_cache_dir: Optional[Path] = None
     ):
         """
         비동기 백테스트 엔진 초기화.
@@ -51,20 +76,22 @@ class AsyncBacktestEngine:
         Args:
             bithumb_client: 빗썸 클라이언트
             initial_capital: 초기 자본
+            indicator_cache_dir: 지표 parquet 캐시 디렉터리 (기본값 None은 캐시 사용 안 함)
         """
         self.client = bithumb_client
         self.initial_capital = initial_capital
+        self.indicator_cache_dir = indicator_cache_dir
 
         # 컴포넌트들
         self.data_collector = RealDataCollector(bithumb_client)
         self.signal_generator = SignalGenerator()
-        self.risk_manager = RiskManager()
+        self.risk_manager = RiskManager(StrategyParameters())
         self.performance_analyzer = PerformanceAnalyzer()
 
         self.logger = logger
 
-        # 병렬 처리 설정
-        self.max_workers = min(cpu_count(), 8)
+        # 병렬 처리 설정 (공유 프로세스 풀과 동일한 워커 수)
+        self.max_workers = MAX_WORKERS
 
     async def run_single_backtest(
         self,
@@ -90,22 +117,13 @@ class AsyncBacktestEngine:
         start_time = datetime.now()
 
         try:
-            # 1. 데이터 수집
+            # 1~3. 데이터 수집, DataFrame 변환, 기술적 지표 계산 (캐시 우선)
             self.logger.info(f"{symbol} 백테스트 시작: {start_date} ~ {end_date}")
 
-            candle_data = await self.data_collector.collect_candles_from_trades(
-                symbol, interval, start_date, end_date
+            df_with_indicators = await self._load_indicators(
+                symbol, interval, start_date, end_date, strategy_params
             )
 
-            if not candle_data:
-                raise ValueError(f"{symbol}에 대한 데이터를 수집할 수 없습니다.")
-
-            # 2. 데이터를 DataFrame으로 변환
-            df = self._candles_to_dataframe(candle_data)
-
-            # 3. 기술적 지표 계산 (비동기)
-            df_with_indicators = await self._calculate_indicators_async(df, strategy_params)
-
             # 4. 시그널 생성
             signals = await self._generate_signals_async(df_with_indicators, strategy_params)
 
@@ -115,30 +133,13 @@ class AsyncBacktestEngine:
             )
 
             # 6. 성과 분석
-            performance_metrics = self.performance_analyzer.calculate_metrics(
-                trades, equity_curve, float(self.initial_capital)
-            )
-
-            execution_time = (datetime.now() - start_time).total_seconds()
-
-            result = BacktestResult(
-                symbol=symbol,
-                start_date=start_date,
-                end_date=end_date,
-                initial_capital=float(self.initial_capital),
-                final_capital=equity_curve[-1]['equity'] if equity_curve else float(self.initial_capital),
-                total_return=performance_metrics.get('total_return', 0),
-                trades=trades,
-                equity_curve=equity_curve,
-                performance_metrics=performance_metrics,
-                execution_time=execution_time
-            )
+            result = self._build_result(symbol, start_date, end_date, trades, equity_curve, start_time)
 
             self.logger.info(
                 f"{symbol} 백테스트 완료: "
                 f"수익률 {result.total_return:.2f}%, "
                 f"거래 수 {len(trades)}건, "
-                f"실행 시간 {execution_time:.2f}초"
+                f"실행 시간 {result.execution_time:.2f}초"
             )
 
             return result
@@ -169,26 +170,51 @@ class AsyncBacktestEngine:
             종목별 백테스트 결과
         """
         self.logger.info(f"다중 종목 백테스트 시작: {len(symbols)}개 종목")
+        start_time = datetime.now()
+
+        # 1단계: 데이터 수집 (IO 작업만 이벤트 루프에서 동시 실행)
+        batches = await asyncio.gather(
+            *(
+                self.data_collector.collect_candle_batch(symbol, interval, start_date, end_date)
+                for symbol in symbols
+            ),
+            return_exceptions=True
+        )
 
-        # 비동기 태스크 생성
-        tasks = []
-        for symbol in symbols:
-            task = self.run_single_backtest(
-                symbol, start_date, end_date, strategy_params, interval
+        # 2단계: 지표/시그널/백테스트 (CPU 작업은 종목별로 프로세스 풀에서 실행)
+        loop = asyncio.get_running_loop()
+        pool = _get_process_pool()
+        jobs = []
+        for symbol, batch in zip(symbols, batches):
+            if isinstance(batch, Exception):
+                self.logger.error(f"{symbol} 데이터 수집 실패: {batch}")
+                continue
+            if len(batch) == 0:
+                self.logger.error(f"{symbol}에 대한 데이터를 수집할 수 없습니다.")
+                continue
+
+            future = loop.run_in_executor(
+                pool,
+                _cpu_pipeline,
+                self._candles_to_dataframe(batch),
+                strategy_params,
+                float(self.initial_capital)
             )
-            tasks.append(task)
+            jobs.append((symbol, future))
 
-        # 병렬 실행
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        results = await asyncio.gather(*(future for _, future in jobs), return_exceptions=True)
 
         # 결과 정리
         backtest_results = {}
-        for symbol, result in zip(symbols, results):
+        for (symbol, _), result in zip(jobs, results):
             if isinstance(result, Exception):
                 self.logger.error(f"{symbol} 백테스트 실패: {result}")
                 continue
 
-            backtest_results[symbol] = result
+            trades, equity_curve = result
+            backtest_results[symbol] = self._build_result(
+                symbol, start_date, end_date, trades, equity_curve, start_time
+            )
 
         self.logger.info(f"다중 종목 백테스트 완료: {len(backtest_results)}개 성공")
         return backtest_results
@@ -221,37 +247,75 @@ class AsyncBacktestEngine:
         # 파라미터 조합 생성
         param_combinations = self._generate_param_combinations(param_ranges, max_combinations)
 
-        # 병렬 백테스트 실행
-        optimization_tasks = []
+        # 데이터는 한 번만 수집해 모든 조합이 공유
+        candle_data = await self.data_collector.collect_candle_batch(
+            symbol, interval, start_date, end_date
+        )
+        if len(candle_data) == 0:
+            raise ValueError(f"{symbol}에 대한 데이터를 수집할 수 없습니다.")
+        df = self._candles_to_dataframe(candle_data)
+
+        # 지표 파라미터가 같은 조합끼리 묶어 지표는 그룹당 한 번만 계산
+        groups: Dict[Tuple[Any, ...], List[Tuple[Dict[str, Any], StrategyParameters]]] = {}
         for params in param_combinations:
             strategy_params = StrategyParameters(**params)
-            task = self.run_single_backtest(symbol, start_date, end_date, strategy_params, interval)
-            optimization_tasks.append((params, task))
+            groups.setdefault(self._indicator_key(strategy_params), []).append((params, strategy_params))
 
-        # 배치별로 실행 (메모리 관리)
-        batch_size = min(self.max_workers, 20)
-        best_result = None
-        best_params = None
-        best_score = float('-inf')
+        # 조합별 백테스트는 CPU 연산이므로 프로세스 풀에서 병렬 실행
+        # (지표 데이터는 작업 단위마다 한 번만 전달되도록 그룹을 워커 수만큼 분할)
+        loop = asyncio.get_running_loop()
+        initial_capital = float(self.initial_capital)
+        jobs = []
 
-        for i in range(0, len(optimization_tasks), batch_size):
-            batch = optimization_tasks[i:i + batch_size]
-            batch_tasks = [task for _, task in batch]
+        pool = _get_process_pool()
 
-            results = await asyncio.gather(*batch_tasks, return_exceptions=True)
+        for group in groups.values():
+            try:
+                df_with_indicators = await self._calculate_indicators_async(df, group[0][1])
+            except Exception as e:
+                self.logger.error(f"{symbol} 지표 계산 실패: {e}")
+                continue
+
+            chunk_size = math.ceil(len(group) / self.max_workers)
+            for i in range(0, len(group), chunk_size):
+                chunk = group[i:i + chunk_size]
+                future = loop.run_in_executor(
+                    pool,
+                    _score_combinations,
+                    df_with_indicators,
+                    [strategy_params for _, strategy_params in chunk],
+                    initial_capital
+                )
+                jobs.append((chunk, future))
 
-            # 결과 평가
-            for (params, _), result in zip(batch, results):
-                if isinstance(result, Exception):
-                    continue
+        results = await asyncio.gather(*(future for _, future in jobs), return_exceptions=True)
 
-                # 샤프 비율을 최적화 기준으로 사용
-                score = result.performance_metrics.get('sharpe_ratio', float('-inf'))
+        best_params = None
+        best_strategy_params = None
+        best_score = float('-inf')
 
-                if score > best_score:
+        for (chunk, _), scores in zip(jobs, results):
+            if isinstance(scores, Exception):
+                self.logger.error(f"{symbol} 백테스트 작업 실패: {scores}")
+                continue
+
+            # 샤프 비율을 최적화 기준으로 사용
+            for (params, strategy_params), score in zip(chunk, scores):
+                if score is not None and score > best_score:
                     best_score = score
-                    best_result = result
                     best_params = params
+                    best_strategy_params = strategy_params
+
+        # 최적 조합만 다시 실행해 전체 결과(거래 내역, 자산 곡선) 생성
+        best_result = None
+        if best_strategy_params is not None:
+            start_time = datetime.now()
+            df_with_indicators = await self._calculate_indicators_async(df, best_strategy_params)
+            signals = await self._generate_signals_async(df_with_indicators, best_strategy_params)
+            trades, equity_curve = await self._execute_backtest_async(
+                df_with_indicators, signals, best_strategy_params
+            )
+            best_result = self._build_result(symbol, start_date, end_date, trades, equity_curve, start_time)
 
         optimization_result = {
             'best_params': best_params,
@@ -267,22 +331,104 @@ class AsyncBacktestEngine:
 
         return optimization_result
 
-    def _candles_to_dataframe(self, candles: List[CandleData]) -> pd.DataFrame:
+    async def _load_indicators(
+        self,
+        symbol: str,
+        interval: str,
+        start_date: datetime,
+        end_date: datetime,
+        params: StrategyParameters
+    ) -> pd.DataFrame:
+        """
+        지표가 계산된 DataFrame 반환 (parquet 캐시가 있으면 재사용).
+
+        캐시 키에는 데이터 갱신 정보가 없으므로 마지막 캔들까지 마감된 구간만
+        캐시에서 읽고 저장한다. 진행 중인 구간은 항상 새로 수집한다.
+
+        Args:
+            symbol: 종목 코드
+            interval: 시간 간격
+            start_date: 시작 날짜
+            end_date: 종료 날짜
+            params: 전략 파라미터
+
+        Returns:
+            지표가 포함된 DataFrame
+        """
+        cache_path = None
+        interval_minutes = self.data_collector.supported_intervals.get(interval)
+        if self.indicator_cache_dir is not None and _is_closed_range(end_date, interval_minutes):
+            key = _cache_key(symbol, start_date, end_date, interval, self._indicator_key(params))
+            cache_path = self.indicator_cache_dir / f"{key}.parquet"
+
+            if cache_path.exists():
+                try:
+                    return pd.read_parquet(cache_path)
+                except Exception as e:
+                    self.logger.warning(f"지표 캐시 읽기 실패, 재계산합니다: {cache_path}, {e}")
+
+        candle_data = await self.data_collector.collect_candle_batch(
+            symbol, interval, start_date, end_date
+        )
+
+        if len(candle_data) == 0:
+            raise ValueError(f"{symbol}에 대한 데이터를 수집할 수 없습니다.")
+
+        df = self._candles_to_dataframe(candle_data)
+        df_with_indicators = await self._calculate_indicators_async(df, params)
+
+        if cache_path is not None:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                # 다른 프로세스가 반쯤 쓴 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체
+                tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+                df_with_indicators.to_parquet(tmp_path, compression='zstd')
+                os.replace(tmp_path, cache_path)
+            except Exception as e:
+                self.logger.warning(f"지표 캐시 저장 실패: {cache_path}, {e}")
+
+        return df_with_indicators
+
+    @staticmethod
+    def _indicator_key(params: StrategyParameters) -> Tuple[Any, ...]:
+        """지표 계산 결과에 영향을 주는 파라미터 묶음."""
+        return (params.short_ema_period, params.long_ema_period, params.rsi_period)
+
+    def _build_result(
+        self,
+        symbol: str,
+        start_date: datetime,
+        end_date: datetime,
+        trades: List[Dict[str, Any]],
+        equity_curve: pd.DataFrame,
+        start_time: datetime
+    ) -> BacktestResult:
+        """거래 내역과 자산 곡선으로 백테스트 결과 생성."""
+        performance_metrics = self.performance_analyzer.calculate_metrics(
+            trades, equity_curve, float(self.initial_capital)
+        )
+
+        return BacktestResult(
+            symbol=symbol,
+            start_date=start_date,
+            end_date=end_date,
+            initial_capital=float(self.initial_capital),
+            final_capital=float(equity_curve['equity'].iat[-1]) if len(equity_curve) else float(self.initial_capital),
+            total_return=performance_metrics.get('total_return', 0),
+            trades=trades,
+            equity_curve=equity_curve,
+            performance_metrics=performance_metrics,
+            execution_time=(datetime.now() - start_time).total_seconds()
+        )
+
+    def _candles_to_dataframe(self, candles: Union[List[CandleData], CandleBatch]) -> pd.DataFrame:
         """캔들 데이터를 DataFrame으로 변환."""
-        data = []
-        for candle in candles:
-            data.append({
-                'timestamp': candle.timestamp,
-                'open': float(candle.open_price),
-                'high': float(candle.high_price),
-                'low': float(candle.low_price),
-                'close': float(candle.close_price),
-                'volume': float(candle.volume)
-            })
-
-        df = pd.DataFrame(data)
-        df.set_index('timestamp', inplace=True)
-        df.sort_index(inplace=True)
+        # 컬럼 배열을 그대로 사용해 한 번에 구성
+        df = as_candle_batch(candles).to_dataframe()
+
+        # 수집기가 이미 시간순으로 반환하면 정렬 생략
+        if not df.index.is_monotonic_increasing:
+            df.sort_index(inplace=True)
 
         return df
 
@@ -292,47 +438,13 @@ class AsyncBacktestEngine:
         params: StrategyParameters
     ) -> pd.DataFrame:
         """비동기로 기술적 지표 계산."""
-        loop = asyncio.get_event_loop()
-
-        # CPU 집약적 계산을 별도 스레드에서 실행
-        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
-            future = executor.submit(self._calculate_indicators, df, params)
-            result = await loop.run_in_executor(None, lambda: future.result())
-
-        return result
+        # CPU 집약적 계산을 공유 프로세스 풀에서 실행
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_process_pool(), calculate_indicators, df, params)
 
     def _calculate_indicators(self, df: pd.DataFrame, params: StrategyParameters) -> pd.DataFrame:
         """기술적 지표 계산 (CPU 집약적)."""
-        df = df.copy()
-
-        # EMA 계산
-        df['ema_short'] = df['close'].ewm(span=params.ema_short_period).mean()
-        df['ema_long'] = df['close'].ewm(span=params.ema_long_period).mean()
-
-        # RSI 계산
-        delta = df['close'].diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=params.rsi_period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=params.rsi_period).mean()
-        rs = gain / loss
-        df['rsi'] = 100 - (100 / (1 + rs))
-
-        # ATR 계산
-        df['tr'] = np.maximum(
-            df['high'] - df['low'],
-            np.maximum(
-                abs(df['high'] - df['close'].shift(1)),
-                abs(df['low'] - df['close'].shift(1))
-            )
-        )
-        df['atr'] = df['tr'].rolling(window=14).mean()
-
-        # Bollinger Bands
-        df['bb_middle'] = df['close'].rolling(window=20).mean()
-        bb_std = df['close'].rolling(window=20).std()
-        df['bb_upper'] = df['bb_middle'] + (bb_std * 2)
-        df['bb_lower'] = df['bb_middle'] - (bb_std * 2)
-
-        return df
+        return calculate_indicators(df, params)
 
     async def _generate_signals_async(
         self,
@@ -340,135 +452,37 @@ class AsyncBacktestEngine:
         params: StrategyParameters
     ) -> pd.DataFrame:
         """비동기로 시그널 생성."""
-        loop = asyncio.get_event_loop()
-
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            future = executor.submit(self._generate_signals, df, params)
-            result = await loop.run_in_executor(None, lambda: future.result())
-
-        return result
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_process_pool(), generate_signals, df, params)
 
-    def _generate_signals(self, df: pd.DataFrame, params: StrategyParameters) -> pd.DataFrame:
+    @staticmethod
+    def _generate_signals(df: pd.DataFrame, params: StrategyParameters) -> pd.DataFrame:
         """시그널 생성."""
-        df = df.copy()
-
-        # EMA 크로스오버 시그널
-        df['ema_signal'] = 0
-        df.loc[df['ema_short'] > df['ema_long'], 'ema_signal'] = 1
-        df.loc[df['ema_short'] < df['ema_long'], 'ema_signal'] = -1
-
-        # RSI 필터
-        df['rsi_filter'] = 0
-        df.loc[df['rsi'] < params.rsi_oversold, 'rsi_filter'] = 1  # 과매도
-        df.loc[df['rsi'] > params.rsi_overbought, 'rsi_filter'] = -1  # 과매수
-
-        # 최종 시그널 (EMA + RSI 조건)
-        df['signal'] = 0
-        df.loc[(df['ema_signal'] == 1) & (df['rsi_filter'] != -1), 'signal'] = 1  # 매수
-        df.loc[(df['ema_signal'] == -1) & (df['rsi_filter'] != 1), 'signal'] = -1  # 매도
-
-        return df
+        return generate_signals(df, params)
 
     async def _execute_backtest_async(
         self,
         df: pd.DataFrame,
         signals: pd.DataFrame,
         params: StrategyParameters
-    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    ) -> Tuple[List[Dict[str, Any]], pd.DataFrame]:
         """비동기로 백테스트 실행."""
-        loop = asyncio.get_event_loop()
-
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            future = executor.submit(self._execute_backtest, df, params)
-            result = await loop.run_in_executor(None, lambda: future.result())
-
-        return result
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _get_process_pool(),
+            execute_backtest,
+            signals,
+            params,
+            float(self.initial_capital)
+        )
 
     def _execute_backtest(
         self,
         df: pd.DataFrame,
         params: StrategyParameters
-    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    ) -> Tuple[List[Dict[str, Any]], pd.DataFrame]:
         """백테스트 실행."""
-        trades = []
-        equity_curve = []
-
-        cash = float(self.initial_capital)
-        position = 0
-        position_value = 0
-        entry_price = 0
-
-        for i, (timestamp, row) in enumerate(df.iterrows()):
-            current_price = row['close']
-            signal = row['signal']
-            atr = row.get('atr', 0)
-
-            # 포지션 가치 업데이트
-            if position > 0:
-                position_value = position * current_price
-
-            total_equity = cash + position_value
-
-            # 시그널 처리
-            if signal == 1 and position == 0:  # 매수 진입
-                position_size = (total_equity * params.position_size_percent / 100) / current_price
-                position = position_size
-                cash -= position_size * current_price
-                entry_price = current_price
-
-                trades.append({
-                    'timestamp': timestamp,
-                    'type': 'buy',
-                    'price': current_price,
-                    'quantity': position_size,
-                    'value': position_size * current_price
-                })
-
-            elif signal == -1 and position > 0:  # 매도 청산
-                cash += position * current_price
-
-                pnl = (current_price - entry_price) * position
-                trades.append({
-                    'timestamp': timestamp,
-                    'type': 'sell',
-                    'price': current_price,
-                    'quantity': position,
-                    'value': position * current_price,
-                    'pnl': pnl
-                })
-
-                position = 0
-                position_value = 0
-
-            # 손절 체크
-            elif position > 0 and atr > 0:
-                stop_loss_price = entry_price - (atr * params.stop_loss_atr_multiplier)
-                if current_price <= stop_loss_price:
-                    cash += position * current_price
-
-                    pnl = (current_price - entry_price) * position
-                    trades.append({
-                        'timestamp': timestamp,
-                        'type': 'stop_loss',
-                        'price': current_price,
-                        'quantity': position,
-                        'value': position * current_price,
-                        'pnl': pnl
-                    })
-
-                    position = 0
-                    position_value = 0
-
-            # 자산 곡선 기록
-            total_equity = cash + position_value
-            equity_curve.append({
-                'timestamp': timestamp,
-                'equity': total_equity,
-                'cash': cash,
-                'position_value': position_value
-            })
-
-        return trades, equity_curve
+        return execute_backtest(df, params, float(self.initial_capital))
 
     def _generate_param_combinations(
         self,
@@ -477,18 +491,23 @@ class AsyncBacktestEngine:
     ) -> List[Dict[str, Any]]:
         """파라미터 조합 생성."""
         import itertools
+        import random
 
-        # 모든 조합 생성
         param_names = list(param_ranges.keys())
         param_values = list(param_ranges.values())
-
-        all_combinations = list(itertools.product(*param_values))
-
-        # 최대 조합 수 제한
-        if len(all_combinations) > max_combinations:
-            # 랜덤 샘플링
-            import random
-            all_combinations = random.sample(all_combinations, max_combinations)
+        sizes = [len(values) for values in param_values]
+        total = math.prod(sizes)
+
+        if total <= max_combinations:
+            # 모든 조합 생성
+            all_combinations = list(itertools.product(*param_values))
+        else:
+            # 전체 곱집합을 만들지 않고 조합 번호를 직접 샘플링 (중복 없음)
+            indices = np.unravel_index(random.sample(range(total), max_combinations), sizes)
+            all_combinations = list(zip(*(
+                [values[i] for i in axis_indices.tolist()]
+                for values, axis_indices in zip(param_values, indices)
+            )))
 
         # 딕셔너리 형태로 변환
         combinations = []
@@ -496,4 +515,159 @@ class AsyncBacktestEngine:
             param_dict = dict(zip(param_names, combo))
             combinations.append(param_dict)
 
-        return combinations
\ No newline at end of file
+        return combinations
+
+
+def _is_closed_range(end_date: datetime, interval_minutes: Optional[int]) -> bool:
+    """요청 구간의 마지막 캔들까지 마감되었는지 확인 (지원하지 않는 간격이면 False)."""
+    if interval_minutes is None:
+        return False
+    return end_date + timedelta(minutes=interval_minutes) <= datetime.now(end_date.tzinfo)
+
+
+def _cache_key(
+    symbol: str,
+    start_date: datetime,
+    end_date: datetime,
+    interval: str,
+    indicator_params: Tuple[Any, ...]
+) -> str:
+    """지표 캐시 파일 이름으로 쓸 입력값 해시."""
+    raw = repr((symbol, start_date.isoformat(), end_date.isoformat(), interval, indicator_params))
+    return hashlib.blake2b(raw.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def calculate_indicators(df: pd.DataFrame, params: StrategyParameters) -> pd.DataFrame:
+    """기술적 지표 계산 (프로세스 풀 작업)."""
+    # 컬럼 추가만 하므로 얕은 복사로 충분 (입력 데이터는 공유)
+    df = df.copy(deep=False)
+
+    close = df['close'].to_numpy(np.float64)
+    high = df['high'].to_numpy(np.float64)
+    low = df['low'].to_numpy(np.float64)
+
+    # EMA 계산
+    df['ema_short'] = _bt_kernels.ema(close, params.short_ema_period)
+    df['ema_long'] = _bt_kernels.ema(close, params.long_ema_period)
+
+    # RSI 계산
+    df['rsi'] = _bt_kernels.rsi(close, params.rsi_period)
+
+    # ATR 계산
+    tr = _bt_kernels.true_range(high, low, close)
+    df['tr'] = tr
+    df['atr'], _ = _bt_kernels.rolling_mean_std(tr, 14)
+
+    # Bollinger Bands
+    df['bb_middle'], df['bb_upper'], df['bb_lower'] = _bt_kernels.bollinger_bands(close, 20, 2.0)
+
+    return df
+
+
+def generate_signals(df: pd.DataFrame, params: StrategyParameters) -> pd.DataFrame:
+    """EMA/RSI 조건으로 시그널 생성 (프로세스 풀 작업)."""
+    # 컬럼 추가만 하므로 얕은 복사로 충분 (입력 데이터는 공유)
+    df = df.copy(deep=False)
+
+    ema_short = df['ema_short'].to_numpy()
+    ema_long = df['ema_long'].to_numpy()
+    rsi = df['rsi'].to_numpy()
+
+    # EMA 크로스오버 방향과 RSI 과매수/과매도 구간
+    ema_up = ema_short > ema_long
+    ema_down = ema_short < ema_long
+    overbought = rsi > float(params.rsi_overbought)
+    oversold = rsi < float(params.rsi_oversold)
+
+    # 최종 시그널 (EMA + RSI 조건)
+    signal = np.zeros(len(df), dtype=np.int8)
+    signal[ema_up & ~overbought] = 1  # 매수
+    signal[ema_down & ~oversold] = -1  # 매도
+    df['signal'] = signal
+
+    return df
+
+
+def execute_backtest(
+    df: pd.DataFrame,
+    params: StrategyParameters,
+    initial_capital: float
+) -> Tuple[List[Dict[str, Any]], pd.DataFrame]:
+    """시그널이 포함된 데이터로 백테스트 실행."""
+    n = len(df)
+    close = df['close'].to_numpy(np.float64)
+    signal = df['signal'].to_numpy(np.int8)
+    atr = df['atr'].to_numpy(np.float64) if 'atr' in df.columns else np.zeros(n, np.float64)
+
+    (
+        n_trades, trade_idx, trade_type, trade_price, trade_qty, trade_pnl,
+        equity, cash, position_value
+    ) = _bt_kernels.run_backtest(
+        close,
+        signal,
+        atr,
+        initial_capital,
+        float(params.capital_allocation_per_position) * 100,  # 포지션당 자본 배분 비율 (%)
+        float(params.atr_multiplier)
+    )
+
+    # 루프 종료 후 한 번에 결과 레코드 생성
+    trades = []
+    trade_timestamps = df.index[trade_idx[:n_trades]]
+    for timestamp, kind, price, quantity, pnl in zip(
+        trade_timestamps,
+        trade_type[:n_trades].tolist(),
+        trade_price[:n_trades].tolist(),
+        trade_qty[:n_trades].tolist(),
+        trade_pnl[:n_trades].tolist()
+    ):
+        trade = {
+            'timestamp': timestamp,
+            'type': _bt_kernels.TRADE_TYPE_NAMES[kind],
+            'price': price,
+            'quantity': quantity,
+            'value': quantity * price
+        }
+        if kind != _bt_kernels.TRADE_BUY:
+            trade['pnl'] = pnl
+        trades.append(trade)
+
+    # 봉마다 딕셔너리를 만들지 않고 커널이 채운 배열을 그대로 컬럼으로 사용
+    equity_curve = pd.DataFrame(
+        {'equity': equity, 'cash': cash, 'position_value': position_value},
+        index=df.index
+    )
+
+    return trades, equity_curve
+
+
+def _cpu_pipeline(
+    df: pd.DataFrame,
+    params: StrategyParameters,
+    initial_capital: float
+) -> Tuple[List[Dict[str, Any]], pd.DataFrame]:
+    """지표 계산부터 백테스트까지 한 번에 실행 (프로세스 풀 작업)."""
+    signals = generate_signals(calculate_indicators(df, params), params)
+    return execute_backtest(signals, params, initial_capital)
+
+
+def _score_combinations(
+    df: pd.DataFrame,
+    combos: List[StrategyParameters],
+    initial_capital: float
+) -> List[Optional[float]]:
+    """지표가 계산된 데이터로 조합별 백테스트 후 샤프 비율 반환 (프로세스 풀 작업)."""
+    analyzer = PerformanceAnalyzer()
+    scores: List[Optional[float]] = []
+
+    for params in combos:
+        try:
+            signals = generate_signals(df, params)
+            trades, equity_curve = execute_backtest(signals, params, initial_capital)
+            metrics = analyzer.calculate_metrics(trades, equity_curve, initial_capital)
+            scores.append(metrics.get('sharpe_ratio', float('-inf')))
+        except Exception as e:
+            logger.error(f"파라미터 조합 {params} 백테스트 실패: {e}")
+            scores.append(None)
+
+    return scores
@@ -3,8 +3,8 @@
 import logging
 import time
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple
-from decimal import Decimal
+from typing import List, Dict, Optional, Tuple, Union
+import numpy as np
 import pandas as pd
 from dataclasses import dataclass
 
@@ -14,28 +14,130 @@ from ..utils.exceptions import ExchangeError
 
 @dataclass
 class CandleData:
-    """캔들 데이터."""
+    """캔들 데이터 (지표 계산용이므로 가격/거래량은 float로 보관)."""
     timestamp: datetime
-    open_price: Decimal
-    high_price: Decimal
-    low_price: Decimal
-    close_price: Decimal
-    volume: Decimal
+    open_price: float
+    high_price: float
+    low_price: float
+    close_price: float
+    volume: float
     symbol: str
 
     def to_dict(self) -> dict:
         """딕셔너리로 변환."""
         return {
             'timestamp': self.timestamp,
-            'open': float(self.open_price),
-            'high': float(self.high_price),
-            'low': float(self.low_price),
-            'close': float(self.close_price),
-            'volume': float(self.volume),
+            'open': self.open_price,
+            'high': self.high_price,
+            'low': self.low_price,
+            'close': self.close_price,
+            'volume': self.volume,
             'symbol': self.symbol
         }
 
 
+@dataclass
+class CandleBatch:
+    """컬럼별 배열로 보관하는 캔들 데이터 (SoA)."""
+    symbol: str
+    timestamps: np.ndarray  # datetime64[ns]
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @classmethod
+    def from_candles(cls, candles: List[CandleData], symbol: Optional[str] = None) -> 'CandleBatch':
+        """CandleData 리스트를 배치로 변환."""
+        n = len(candles)
+        if symbol is None:
+            symbol = candles[0].symbol if candles else ''
+
+        return cls(
+            symbol=symbol,
+            timestamps=pd.DatetimeIndex([c.timestamp for c in candles]).to_numpy(),
+            open=np.fromiter((c.open_price for c in candles), np.float64, count=n),
+            high=np.fromiter((c.high_price for c in candles), np.float64, count=n),
+            low=np.fromiter((c.low_price for c in candles), np.float64, count=n),
+            close=np.fromiter((c.close_price for c in candles), np.float64, count=n),
+            volume=np.fromiter((c.volume for c in candles), np.float64, count=n)
+        )
+
+    def to_candles(self) -> List[CandleData]:
+        """기존 API 호환용 CandleData 리스트로 변환."""
+        return [
+            CandleData(
+                timestamp=timestamp,
+                open_price=open_price,
+                high_price=high_price,
+                low_price=low_price,
+                close_price=close_price,
+                volume=volume,
+                symbol=self.symbol
+            )
+            for timestamp, open_price, high_price, low_price, close_price, volume in zip(
+                pd.DatetimeIndex(self.timestamps).to_pydatetime(),
+                self.open.tolist(),
+                self.high.tolist(),
+                self.low.tolist(),
+                self.close.tolist(),
+                self.volume.tolist()
+            )
+        ]
+
+    @classmethod
+    def concat(cls, batches: List['CandleBatch'], symbol: str) -> 'CandleBatch':
+        """여러 배치를 하나로 연결."""
+        if not batches:
+            return cls.from_candles([], symbol)
+
+        return cls(
+            symbol=symbol,
+            timestamps=np.concatenate([b.timestamps for b in batches]),
+            open=np.concatenate([b.open for b in batches]),
+            high=np.concatenate([b.high for b in batches]),
+            low=np.concatenate([b.low for b in batches]),
+            close=np.concatenate([b.close for b in batches]),
+            volume=np.concatenate([b.volume for b in batches])
+        )
+
+    def take(self, indexer: np.ndarray) -> 'CandleBatch':
+        """인덱스 배열 또는 불리언 마스크로 행 선택."""
+        return CandleBatch(
+            symbol=self.symbol,
+            timestamps=self.timestamps[indexer],
+            open=self.open[indexer],
+            high=self.high[indexer],
+            low=self.low[indexer],
+            close=self.close[indexer],
+            volume=self.volume[indexer]
+        )
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """timestamp 인덱스의 OHLCV DataFrame으로 변환 (배열을 그대로 컬럼으로 사용)."""
+        return pd.DataFrame(
+            {
+                'open': self.open,
+                'high': self.high,
+                'low': self.low,
+                'close': self.close,
+                'volume': self.volume
+            },
+            index=pd.DatetimeIndex(self.timestamps, name='timestamp')
+        )
+
+
+def as_candle_batch(candles: Union[List[CandleData], CandleBatch]) -> CandleBatch:
+    """리스트 또는 배치 입력을 배치로 통일."""
+    if isinstance(candles, CandleBatch):
+        return candles
+    return CandleBatch.from_candles(candles)
+
+
 class DataCollector:
     """백테스트용 데이터 수집기."""
 
@@ -64,6 +166,9 @@ class DataCollector:
         self.request_delay = 0.2  # 초
         self.last_request_time = 0.0
 
+        # Mock 데이터용 난수 생성기
+        self._rng = np.random.default_rng()
+
     def _rate_limit(self):
         """Rate limit 관리."""
         current_time = time.time()
@@ -93,12 +198,38 @@ class DataCollector:
         Returns:
             캔들 데이터 리스트
         """
+        return self.collect_candle_batch(symbol, interval, start_date, end_date, limit).to_candles()
+
+    def collect_candle_batch(
+        self,
+        symbol: str,
+        interval: str,
+        start_date: datetime,
+        end_date: datetime,
+        limit: int = 200
+    ) -> CandleBatch:
+        """
+        캔들 데이터를 컬럼 배열 배치로 수집.
+
+        Args:
+            symbol: 종목 코드 (예: "BTC_KRW")
+            interval: 시간 간격 (1m, 5m, 15m, 30m, 1h, 4h, 1d)
+            start_date: 시작 날짜
+            end_date: 종료 날짜
+            limit: 한 번에 가져올 최대 개수
+
+        Returns:
+            시간 오름차순 캔들 배치
+        """
         if interval not in self.supported_intervals:
             raise ValueError(f"지원하지 않는 간격: {interval}")
 
         self.logger.info(f"캔들 데이터 수집 시작: {symbol} {interval} {start_date} ~ {end_date}")
 
-        all_candles = []
+        start_ts = np.datetime64(start_date, 'ns')
+        end_ts = np.datetime64(end_date, 'ns')
+        batches = []
+        total = 0
         current_end = end_date
 
         while current_end > start_date:
@@ -108,25 +239,26 @@ class DataCollector:
                 # 빗썸 API 호출
                 candles = self._fetch_candles_batch(symbol, interval, current_end, limit)
 
-                if not candles:
+                if len(candles) == 0:
                     break
 
                 # 날짜 범위 필터링
-                filtered_candles = [
-                    candle for candle in candles
-                    if start_date <= candle.timestamp <= end_date
-                ]
+                in_range = (candles.timestamps >= start_ts) & (candles.timestamps <= end_ts)
+                filtered_candles = candles.take(in_range)
+
+                batches.append(filtered_candles)
+                total += len(filtered_candles)
 
-                all_candles.extend(filtered_candles)
+                # 배치는 시간 오름차순이므로 첫 캔들이 가장 이른 시각
+                earliest = pd.Timestamp(candles.timestamps[0]).to_pydatetime()
 
                 # 다음 배치를 위한 시간 업데이트
-                if candles:
-                    current_end = min(candle.timestamp for candle in candles) - timedelta(minutes=1)
+                current_end = earliest - timedelta(minutes=1)
 
-                self.logger.debug(f"수집된 캔들 수: {len(filtered_candles)}, 총 {len(all_candles)}개")
+                self.logger.debug(f"수집된 캔들 수: {len(filtered_candles)}, 총 {total}개")
 
                 # 시작 날짜에 도달했으면 중단
-                if candles and min(candle.timestamp for candle in candles) <= start_date:
+                if earliest <= start_date:
                     break
 
             except Exception as e:
@@ -134,7 +266,8 @@ class DataCollector:
                 time.sleep(1)  # 오류 발생 시 잠시 대기
 
         # 시간순 정렬
-        all_candles.sort(key=lambda x: x.timestamp)
+        all_candles = CandleBatch.concat(batches, symbol)
+        all_candles = all_candles.take(np.argsort(all_candles.timestamps, kind='stable'))
 
         self.logger.info(f"캔들 데이터 수집 완료: {len(all_candles)}개")
         return all_candles
@@ -145,7 +278,7 @@ class DataCollector:
         interval: str,
         end_time: datetime,
         limit: int
-    ) -> List[CandleData]:
+    ) -> CandleBatch:
         """
         한 번의 API 호출로 캔들 데이터 가져오기.
 
@@ -156,7 +289,7 @@ class DataCollector:
             limit: 개수 제한
 
         Returns:
-            캔들 데이터 리스트
+            시간 오름차순으로 정렬된 캔들 배치
         """
         try:
             # 빗썸 API는 캔들 데이터 제공하지 않으므로 mock 데이터 생성
@@ -165,7 +298,7 @@ class DataCollector:
 
         except Exception as e:
             self.logger.error(f"캔들 데이터 배치 수집 실패: {e}")
-            return []
+            return CandleBatch.from_candles([], symbol)
 
     def _generate_mock_candles(
         self,
@@ -173,7 +306,7 @@ class DataCollector:
         interval: str,
         end_time: datetime,
         limit: int
-    ) -> List[CandleData]:
+    ) -> CandleBatch:
         """
         Mock 캔들 데이터 생성 (실제 데이터 대신 사용).
 
@@ -184,52 +317,38 @@ class DataCollector:
             limit: 개수 제한
 
         Returns:
-            Mock 캔들 데이터 리스트
+            end_time에서 끝나는 시간 오름차순 Mock 캔들 배치
         """
-        candles = []
         interval_minutes = self.supported_intervals[interval]
 
         # 현재가 기준으로 시작
         try:
             ticker = self.client.get_ticker(symbol)
             if not ticker:
-                return []
+                return CandleBatch.from_candles([], symbol)
 
-            base_price = Decimal(str(ticker.get('closing_price', 100000)))
+            base_price = float(ticker.get('closing_price', 100000))
         except:
-            base_price = Decimal('100000')  # 기본값
-
-        for i in range(limit):
-            timestamp = end_time - timedelta(minutes=interval_minutes * i)
-
-            # 가격 변동 시뮬레이션 (±2% 랜덤)
-            import random
-            change_rate = Decimal(str(random.uniform(-0.02, 0.02)))
-            price = base_price * (Decimal('1') + change_rate)
-
-            # OHLC 생성
-            high_rate = Decimal(str(random.uniform(0, 0.01)))
-            low_rate = Decimal(str(random.uniform(-0.01, 0)))
-
-            open_price = price
-            high_price = price * (Decimal('1') + high_rate)
-            low_price = price * (Decimal('1') + low_rate)
-            close_price = price
-
-            volume = Decimal(str(random.uniform(1, 100)))
-
-            candle = CandleData(
-                timestamp=timestamp,
-                open_price=open_price,
-                high_price=high_price,
-                low_price=low_price,
-                close_price=close_price,
-                volume=volume,
-                symbol=symbol
-            )
-            candles.append(candle)
-
-        return candles
+            base_price = 100000.0  # 기본값
+
+        # 가격 변동 시뮬레이션 (±2% 랜덤)과 OHLC를 한 번에 생성
+        change_rate = self._rng.uniform(-0.02, 0.02, limit)
+        high_rate = self._rng.uniform(0, 0.01, limit)
+        low_rate = self._rng.uniform(-0.01, 0, limit)
+        volume = self._rng.uniform(1, 100, limit)
+
+        price = base_price * (1 + change_rate)
+        offsets = np.arange(limit - 1, -1, -1) * np.timedelta64(interval_minutes, 'm')
+
+        return CandleBatch(
+            symbol=symbol,
+            timestamps=np.datetime64(end_time, 'ns') - offsets,
+            open=price,
+            high=price * (1 + high_rate),
+            low=price * (1 + low_rate),
+            close=price.copy(),
+            volume=volume
+        )
 
     def collect_multiple_symbols(
         self,
@@ -271,47 +390,49 @@ class DataCollector:
         self.logger.info("다중 종목 데이터 수집 완료")
         return results
 
-    def validate_data(self, candles: List[CandleData]) -> Tuple[bool, List[str]]:
+    def validate_data(self, candles: Union[List[CandleData], CandleBatch]) -> Tuple[bool, List[str]]:
         """
         데이터 검증.
 
         Args:
-            candles: 캔들 데이터 리스트
+            candles: 캔들 데이터 리스트 또는 배치
 
         Returns:
             (검증 성공 여부, 오류 메시지 리스트)
         """
         errors = []
 
-        if not candles:
+        if len(candles) == 0:
             errors.append("데이터가 비어있습니다.")
             return False, errors
 
-        # 시간 순서 확인
-        for i in range(1, len(candles)):
-            if candles[i].timestamp <= candles[i-1].timestamp:
-                errors.append(f"시간 순서 오류: {i}번째 데이터")
-
-        # 가격 데이터 확인
-        for i, candle in enumerate(candles):
-            if candle.high_price < candle.low_price:
-                errors.append(f"고가 < 저가 오류: {i}번째 데이터")
-
-            if not (candle.low_price <= candle.open_price <= candle.high_price):
-                errors.append(f"시가 범위 오류: {i}번째 데이터")
+        batch = as_candle_batch(candles)
+        ts = batch.timestamps.view(np.int64)
+        high, low, open_, close, volume = batch.high, batch.low, batch.open, batch.close, batch.volume
 
-            if not (candle.low_price <= candle.close_price <= candle.high_price):
-                errors.append(f"종가 범위 오류: {i}번째 데이터")
-
-            if candle.volume < 0:
-                errors.append(f"거래량 음수 오류: {i}번째 데이터")
+        # 시간 순서 확인
+        for i in np.flatnonzero(ts[1:] <= ts[:-1]) + 1:
+            errors.append(f"시간 순서 오류: {i}번째 데이터")
+
+        # 가격 데이터 확인 (NaN은 범위 검사에서 오류로 취급)
+        checks = (
+            (high < low, "고가 < 저가 오류"),
+            (~((low <= open_) & (open_ <= high)), "시가 범위 오류"),
+            (~((low <= close) & (close <= high)), "종가 범위 오류"),
+            (volume < 0, "거래량 음수 오류"),
+        )
+        bad = np.logical_or.reduce([mask for mask, _ in checks])
+        for i in np.flatnonzero(bad):
+            for mask, message in checks:
+                if mask[i]:
+                    errors.append(f"{message}: {i}번째 데이터")
 
         # 결측치 확인
         missing_count = 0
-        if len(candles) > 1:
-            interval_minutes = (candles[1].timestamp - candles[0].timestamp).total_seconds() / 60
-            expected_count = int((candles[-1].timestamp - candles[0].timestamp).total_seconds() / (interval_minutes * 60)) + 1
-            missing_count = expected_count - len(candles)
+        if len(ts) > 1:
+            interval_seconds = int(ts[1] - ts[0]) / 1e9
+            expected_count = int((int(ts[-1] - ts[0]) / 1e9) / interval_seconds) + 1
+            missing_count = expected_count - len(ts)
 
         if missing_count > 0:
             errors.append(f"결측치 {missing_count}개 발견")
@@ -321,32 +442,31 @@ class DataCollector:
 
         return is_valid, errors
 
-    def to_dataframe(self, candles: List[CandleData]) -> pd.DataFrame:
+    def to_dataframe(self, candles: Union[List[CandleData], CandleBatch]) -> pd.DataFrame:
         """
         캔들 데이터를 pandas DataFrame으로 변환.
 
         Args:
-            candles: 캔들 데이터 리스트
+            candles: 캔들 데이터 리스트 또는 배치
 
         Returns:
             pandas DataFrame
         """
-        if not candles:
+        if len(candles) == 0:
             return pd.DataFrame()
 
-        data = [candle.to_dict() for candle in candles]
-        df = pd.DataFrame(data)
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
-        df.set_index('timestamp', inplace=True)
+        batch = as_candle_batch(candles)
+        df = batch.to_dataframe()
+        df['symbol'] = batch.symbol
 
         return df
 
-    def save_to_csv(self, candles: List[CandleData], filepath: str):
+    def save_to_csv(self, candles: Union[List[CandleData], CandleBatch], filepath: str):
         """
         캔들 데이터를 CSV 파일로 저장.
 
         Args:
-            candles: 캔들 데이터 리스트
+            candles: 캔들 데이터 리스트 또는 배치
             filepath: 저장할 파일 경로
         """
         df = self.to_dataframe(candles)
@@ -364,25 +484,40 @@ class DataCollector:
         Returns:
             캔들 데이터 리스트
         """
+        return self.load_candle_batch(filepath, symbol).to_candles()
+
+    def load_candle_batch(self, filepath: str, symbol: str) -> CandleBatch:
+        """
+        CSV 또는 parquet 파일에서 캔들 배치를 컬럼 단위로 로드.
+
+        Args:
+            filepath: CSV/parquet 파일 경로 (.parquet 확장자면 parquet로 읽음)
+            symbol: 종목 코드
+
+        Returns:
+            캔들 배치 (실패 시 빈 배치)
+        """
         try:
-            df = pd.read_csv(filepath, index_col='timestamp', parse_dates=True)
-
-            candles = []
-            for timestamp, row in df.iterrows():
-                candle = CandleData(
-                    timestamp=timestamp,
-                    open_price=Decimal(str(row['open'])),
-                    high_price=Decimal(str(row['high'])),
-                    low_price=Decimal(str(row['low'])),
-                    close_price=Decimal(str(row['close'])),
-                    volume=Decimal(str(row['volume'])),
-                    symbol=symbol
-                )
-                candles.append(candle)
-
-            self.logger.info(f"데이터 로드 완료: {filepath} ({len(candles)}개 레코드)")
-            return candles
+            if filepath.endswith('.parquet'):
+                df = pd.read_parquet(filepath)
+                if 'timestamp' in df.columns:
+                    df = df.set_index('timestamp')
+            else:
+                df = pd.read_csv(filepath, index_col='timestamp', parse_dates=True)
+
+            batch = CandleBatch(
+                symbol=symbol,
+                timestamps=pd.DatetimeIndex(df.index).to_numpy(),
+                open=df['open'].to_numpy(np.float64),
+                high=df['high'].to_numpy(np.float64),
+                low=df['low'].to_numpy(np.float64),
+                close=df['close'].to_numpy(np.float64),
+                volume=df['volume'].to_numpy(np.float64)
+            )
+
+            self.logger.info(f"데이터 로드 완료: {filepath} ({len(batch)}개 레코드)")
+            return batch
 
         except Exception as e:
             self.logger.error(f"데이터 로드 실패: {filepath}, {e}")
-            return []
\ No newline at end of file
+            return CandleBatch.from_candles([], symbol)
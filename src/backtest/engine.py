@@ -1,22 +1,36 @@
 """백테스트 엔진."""
 
+import itertools
 import logging
+import types
+from bisect import bisect_left
+from collections import deque
 from datetime import datetime
-from decimal import Decimal
-from queue import Queue, Empty
-from typing import List, Dict, Optional, Callable, Any, Tuple
-from uuid import uuid4
+from typing import List, Dict, Optional, Callable, Any, Tuple, Mapping
 
-from .events import Event, EventType, MarketEvent, SignalEvent, OrderEvent, FillEvent
+import numpy as np
+import pandas as pd
+
+from .events import Event, EventType, EVENT_FILL, EVENT_KINDS, MarketEvent, SignalEvent, OrderEvent, FillEvent
 from .portfolio import Portfolio
 from .data_collector import CandleData
 from ..core.order_types import OrderSide, OrderType
 
+# 벡터화 전략에 전달하는 종목별 캔들 레코드 배열 형식
+CANDLE_DTYPE = np.dtype([
+    ('ts', 'i8'),
+    ('open', 'f8'),
+    ('high', 'f8'),
+    ('low', 'f8'),
+    ('close', 'f8'),
+    ('volume', 'f8')
+])
+
 
 class ExecutionHandler:
     """백테스트 주문 실행 처리기."""
 
-    def __init__(self, events: Queue, commission_rate: Decimal = Decimal('0.0025')):
+    def __init__(self, events: deque, commission_rate: float = 0.0025):
         """
         실행 처리기 초기화.
 
@@ -25,13 +39,21 @@ class ExecutionHandler:
             commission_rate: 수수료율
         """
         self.events = events
-        self.commission_rate = commission_rate
+        self.commission_rate = float(commission_rate)
         self.logger = logging.getLogger(self.__class__.__name__)
 
         # 슬리피지 설정
-        self.slippage_rate = Decimal('0.001')  # 0.1%
+        self.slippage_rate = 0.001  # 0.1%
+
+        # 체결마다 다시 계산하지 않도록 슬리피지 배율을 미리 계산
+        self._buy_mult = 1 + self.slippage_rate
+        self._sell_mult = 1 - self.slippage_rate
+
+        # 주문/체결 ID 발급용 단조 증가 카운터
+        self._order_id_counter = itertools.count()
+        self._fill_id_counter = itertools.count()
 
-    def execute_order(self, order_event: OrderEvent, current_price: Decimal):
+    def execute_order(self, order_event: OrderEvent, current_price: float):
         """
         주문 실행.
 
@@ -41,9 +63,9 @@ class ExecutionHandler:
         """
         # 슬리피지 적용
         if order_event.side == OrderSide.BUY:
-            fill_price = current_price * (Decimal('1') + self.slippage_rate)
+            fill_price = current_price * self._buy_mult
         else:
-            fill_price = current_price * (Decimal('1') - self.slippage_rate)
+            fill_price = current_price * self._sell_mult
 
         # 지정가 주문의 경우 가격 확인
         if order_event.order_type == OrderType.LIMIT:
@@ -65,12 +87,13 @@ class ExecutionHandler:
             quantity=order_event.quantity,
             fill_price=fill_price,
             commission=commission,
-            order_id=order_event.order_id or f"order_{uuid4().hex[:8]}",
-            fill_id=f"fill_{uuid4().hex[:8]}"
+            order_id=order_event.order_id or f"order_{next(self._order_id_counter):08x}",
+            fill_id=f"fill_{next(self._fill_id_counter):08x}"
         )
 
-        self.events.put(fill_event)
-        self.logger.debug(f"주문 체결: {fill_event}")
+        self.events.append(fill_event)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("주문 체결: %s", fill_event)
 
 
 class BacktestEngine:
@@ -78,9 +101,9 @@ class BacktestEngine:
 
     def __init__(
         self,
-        initial_capital: Decimal,
-        commission_rate: Decimal = Decimal('0.0025'),
-        slippage_rate: Decimal = Decimal('0.001')
+        initial_capital: float,
+        commission_rate: float = 0.0025,
+        slippage_rate: float = 0.001
     ):
         """
         백테스트 엔진 초기화.
@@ -90,28 +113,61 @@ class BacktestEngine:
             commission_rate: 수수료율
             slippage_rate: 슬리피지율
         """
-        self.initial_capital = initial_capital
-        self.commission_rate = commission_rate
-        self.slippage_rate = slippage_rate
+        # 시뮬레이션 내부 연산은 float로 처리 (Decimal 입력도 허용)
+        self.initial_capital = float(initial_capital)
+        self.commission_rate = float(commission_rate)
+        self.slippage_rate = float(slippage_rate)
         self.logger = logging.getLogger(self.__class__.__name__)
 
         # 컴포넌트 초기화
-        self.events = Queue()
+        # 단일 스레드 이벤트 루프이므로 잠금 없는 deque 사용
+        self.events: deque = deque()
         self.portfolio = Portfolio(initial_capital, commission_rate)
         self.execution_handler = ExecutionHandler(self.events, commission_rate)
 
         # 데이터 저장
         self.market_data: Dict[str, List[CandleData]] = {}
         self.current_data: Dict[str, CandleData] = {}
+        # 전략 콜백에 전달하는 읽기 전용 뷰 (틱마다 복사하지 않음)
+        self._current_data_view: Mapping[str, CandleData] = types.MappingProxyType(self.current_data)
+        self._close_prices: Dict[str, float] = {}  # 종목별 현재 종가 (틱마다 갱신)
+
+        # 종목 코드 -> 정수 ID (add_data 순서대로 부여, 틱 루프 상태는 ID로 인덱싱)
+        self._symbol_ids: Dict[str, int] = {}
+        self._symbols: List[str] = []
+        self._candles_by_id: List[List[CandleData]] = []
+
+        # 종목 ID별 캔들 시각 키 (int64 ns)와 조회 커서 (시간순 조회 시 앞으로만 이동)
+        self._timestamps: List[List[int]] = []
+        self._cursors: List[int] = []
+
+        # 종목별 캔들 시각 (int64 ns, 전체 타임라인 병합용)과 시간대
+        self._ts_ns: Dict[str, np.ndarray] = {}
+        self._tz = None
+
+        # 종목별 캔들 레코드 배열 (CANDLE_DTYPE)과 종목 ID별 이벤트 생성용 행 튜플
+        self._candle_arrays: Dict[str, np.ndarray] = {}
+        self._candle_rows: List[List[Tuple[int, float, float, float, float, float]]] = []
 
         # 전략 및 콜백
-        self.strategy_callbacks: List[Callable] = []
+        self.strategy_callbacks: List[Tuple[Callable, bool]] = []
+        self.vectorized_strategies: List[Tuple[Callable[[np.ndarray, np.ndarray], None], str]] = []
         self.event_callbacks: Dict[EventType, List[Callable]] = {
             EventType.MARKET: [],
             EventType.SIGNAL: [],
             EventType.ORDER: [],
             EventType.FILL: []
         }
+        # kind 태그로 인덱싱하는 콜백 튜플 (콜백 등록 시 갱신)
+        self._callbacks_by_kind: Tuple[Tuple[Callable[[Event], None], ...], ...] = ((), (), (), ())
+
+        # 이벤트 kind 태그로 인덱싱하는 핸들러 테이블
+        self._event_handlers = (
+            self._handle_market_event,
+            self._handle_signal_event,
+            self._handle_order_event,
+            self._handle_fill_event
+        )
 
         # 백테스트 상태
         self.current_time: Optional[datetime] = None
@@ -131,16 +187,108 @@ class BacktestEngine:
             candles: 캔들 데이터 리스트
         """
         self.market_data[symbol] = sorted(candles, key=lambda x: x.timestamp)
+        candles = self.market_data[symbol]
+
+        # 시각은 로드 시 한 번만 int64 ns 키로 변환해 이후 비교/해시에 사용
+        index = pd.DatetimeIndex([candle.timestamp for candle in candles]).as_unit('ns')
+        self._ts_ns[symbol] = index.asi8
+        if index.tz is not None:
+            self._tz = index.tz
+        n = len(candles)
+        records = np.empty(n, dtype=CANDLE_DTYPE)
+        records['ts'] = self._ts_ns[symbol]
+        records['open'] = np.fromiter((c.open_price for c in candles), np.float64, count=n)
+        records['high'] = np.fromiter((c.high_price for c in candles), np.float64, count=n)
+        records['low'] = np.fromiter((c.low_price for c in candles), np.float64, count=n)
+        records['close'] = np.fromiter((c.close_price for c in candles), np.float64, count=n)
+        records['volume'] = np.fromiter((c.volume for c in candles), np.float64, count=n)
+        self._candle_arrays[symbol] = records
+
+        # 종목 ID별 틱 루프 상태 (같은 종목을 다시 추가하면 기존 ID 재사용)
+        sym_id = self._symbol_ids.get(symbol)
+        if sym_id is None:
+            sym_id = len(self._symbols)
+            self._symbol_ids[symbol] = sym_id
+            self._symbols.append(symbol)
+            self._candles_by_id.append(candles)
+            self._timestamps.append([])
+            self._cursors.append(0)
+            self._candle_rows.append([])
+
+        self._candles_by_id[sym_id] = candles
+        self._timestamps[sym_id] = self._ts_ns[symbol].tolist()
+        self._cursors[sym_id] = 0
+        self._candle_rows[sym_id] = records.tolist()
+
         self.logger.info(f"데이터 추가: {symbol} ({len(candles)}개 캔들)")
 
-    def add_strategy_callback(self, callback: Callable[[Dict[str, CandleData]], None]):
+    def add_strategy_callback(
+        self,
+        callback: Callable[[Mapping[str, CandleData]], None],
+        copy_data: bool = False
+    ):
         """
         전략 콜백 추가.
 
+        콜백은 현재 시장 데이터의 읽기 전용 뷰를 받으며, 뷰는 다음 틱에 갱신됩니다.
+
         Args:
             callback: 전략 함수 (현재 시장 데이터를 받아 신호 생성)
+            copy_data: True면 틱마다 복사한 딕셔너리를 전달 (데이터를 보관하는 콜백용)
         """
-        self.strategy_callbacks.append(callback)
+        self.strategy_callbacks.append((callback, copy_data))
+
+    def add_vectorized_strategy(
+        self,
+        strategy: Callable[[np.ndarray, np.ndarray], None],
+        strategy_id: str = "vectorized"
+    ):
+        """
+        벡터화 전략 추가.
+
+        전략은 실행 전에 종목마다 한 번 호출되어 전체 캔들 레코드 배열(CANDLE_DTYPE)을 받고,
+        같은 길이의 int8 배열에 봉별 신호(1 매수, -1 매도, 0 없음)를 기록합니다.
+        틱 루프에서는 미리 계산된 신호만 재생합니다.
+
+        Args:
+            strategy: 전략 함수 (캔들 레코드 배열, 신호 출력 배열)
+            strategy_id: 생성되는 신호의 전략 ID
+        """
+        self.vectorized_strategies.append((strategy, strategy_id))
+
+    def _compute_vectorized_signals(self) -> Dict[str, List[Tuple[str, np.ndarray]]]:
+        """벡터화 전략을 종목별로 한 번씩 실행해 봉별 신호 배열 생성."""
+        signals: Dict[str, List[Tuple[str, np.ndarray]]] = {}
+
+        for strategy, strategy_id in self.vectorized_strategies:
+            for symbol, records in self._candle_arrays.items():
+                out = np.zeros(len(records), dtype=np.int8)
+                try:
+                    strategy(records, out)
+                except Exception as e:
+                    self.logger.error(f"벡터화 전략 실행 오류: {symbol}, {e}")
+                    continue
+                signals.setdefault(symbol, []).append((strategy_id, out))
+
+        return signals
+
+    def _replay_vectorized_signals(
+        self,
+        signals: Dict[str, List[Tuple[str, np.ndarray]]],
+        symbols: List[str]
+    ):
+        """현재 틱에 캔들이 있는 종목의 미리 계산된 신호 제출."""
+        symbol_ids = self._symbol_ids
+        cursors = self._cursors
+
+        for symbol in symbols:
+            row = cursors[symbol_ids[symbol]]
+            for strategy_id, out in signals.get(symbol, ()):
+                signal = out[row]
+                if signal > 0:
+                    self.submit_signal(symbol, OrderSide.BUY, 1.0, strategy_id)
+                elif signal < 0:
+                    self.submit_signal(symbol, OrderSide.SELL, 1.0, strategy_id)
 
     def add_event_callback(self, event_type: EventType, callback: Callable[[Event], None]):
         """
@@ -153,78 +301,111 @@ class BacktestEngine:
         if event_type in self.event_callbacks:
             self.event_callbacks[event_type].append(callback)
 
-    def generate_market_events(self, timestamp: datetime) -> List[MarketEvent]:
+            callbacks_by_kind = list(self._callbacks_by_kind)
+            callbacks_by_kind[EVENT_KINDS[event_type]] = tuple(self.event_callbacks[event_type])
+            self._callbacks_by_kind = tuple(callbacks_by_kind)
+
+    def generate_market_events(
+        self,
+        timestamp: datetime,
+        ts_key: Optional[int] = None
+    ) -> List[MarketEvent]:
         """
         시장 이벤트 생성.
 
         Args:
             timestamp: 현재 시점
+            ts_key: 현재 시점의 int64 ns 키 (없으면 timestamp에서 계산)
 
         Returns:
             시장 이벤트 리스트
         """
         market_events = []
+        if ts_key is None:
+            ts_key = pd.Timestamp(timestamp).value
+
+        candle_rows = self._candle_rows
+        candles_by_id = self._candles_by_id
 
-        for symbol, candles in self.market_data.items():
-            # 현재 시점의 캔들 데이터 찾기
-            current_candle = None
-            for candle in candles:
-                if candle.timestamp == timestamp:
-                    current_candle = candle
-                    break
+        for sym_id, symbol in enumerate(self._symbols):
+            # 현재 시점의 캔들 위치 찾기
+            i = self._find_candle_index(sym_id, ts_key)
 
-            if current_candle:
-                self.current_data[symbol] = current_candle
+            if i >= 0:
+                # 가격은 레코드 배열에서 변환한 행에서 읽고, 전략용 CandleData는 그대로 노출
+                _, open_price, high_price, low_price, close_price, volume = candle_rows[sym_id][i]
+                self.current_data[symbol] = candles_by_id[sym_id][i]
+                self._close_prices[symbol] = close_price
 
-                market_event = MarketEvent(
+                market_event = MarketEvent.acquire(
                     timestamp=timestamp,
                     symbol=symbol,
-                    open_price=current_candle.open_price,
-                    high_price=current_candle.high_price,
-                    low_price=current_candle.low_price,
-                    close_price=current_candle.close_price,
-                    volume=current_candle.volume
+                    open_price=open_price,
+                    high_price=high_price,
+                    low_price=low_price,
+                    close_price=close_price,
+                    volume=volume
                 )
                 market_events.append(market_event)
 
         return market_events
 
+    def _find_candle_index(self, sym_id: int, ts_key: int) -> int:
+        """커서를 앞으로 옮기며 해당 시점(int64 ns 키)의 캔들 위치 조회 (없으면 -1, 과거 시점이면 이진 탐색)."""
+        timestamps = self._timestamps[sym_id]
+        n = len(timestamps)
+        i = self._cursors[sym_id]
+
+        if i > 0 and timestamps[i - 1] >= ts_key:
+            i = bisect_left(timestamps, ts_key)
+        else:
+            while i < n and timestamps[i] < ts_key:
+                i += 1
+
+        self._cursors[sym_id] = i
+        if i < n and timestamps[i] == ts_key:
+            return i
+        return -1
+
     def run_strategy_callbacks(self):
         """전략 콜백 실행."""
         if not self.current_data:
             return
 
-        for callback in self.strategy_callbacks:
+        view = self._current_data_view
+        for callback, copy_data in self.strategy_callbacks:
             try:
-                callback(self.current_data.copy())
+                callback(self.current_data.copy() if copy_data else view)
             except Exception as e:
                 self.logger.error(f"전략 콜백 실행 오류: {e}")
 
     def process_events(self):
         """이벤트 처리."""
-        while not self.events.empty():
-            try:
-                event = self.events.get(False)
-            except Empty:
-                break
-
-            # 이벤트 타입별 처리
-            if event.event_type == EventType.MARKET:
-                self._handle_market_event(event)
-            elif event.event_type == EventType.SIGNAL:
-                self._handle_signal_event(event)
-            elif event.event_type == EventType.ORDER:
-                self._handle_order_event(event)
-            elif event.event_type == EventType.FILL:
-                self._handle_fill_event(event)
+        events = self.events
+        popleft = events.popleft
+        handlers = self._event_handlers
+        callbacks_by_kind = self._callbacks_by_kind
+
+        while events:
+            event = popleft()
+            kind = event.kind
+
+            # 이벤트 종류별 처리
+            handlers[kind](event)
 
             # 콜백 실행
-            for callback in self.event_callbacks[event.event_type]:
+            callbacks = callbacks_by_kind[kind]
+            for callback in callbacks:
                 try:
                     callback(event)
                 except Exception as e:
                     self.logger.error(f"이벤트 콜백 실행 오류: {e}")
 
+            # 콜백이 참조를 보관할 수 있으므로 콜백이 없을 때만 풀에 반환
+            # (체결 이벤트는 포트폴리오가 보관)
+            if not callbacks and kind != EVENT_FILL:
+                event.release()
+
     def _handle_market_event(self, event: MarketEvent):
         """마켓 이벤트 처리."""
         # 포트폴리오 시장가 업데이트
@@ -237,49 +418,56 @@ class BacktestEngine:
     def _handle_signal_event(self, event: SignalEvent):
         """신호 이벤트 처리."""
         self.signals_generated += 1
-        self.logger.debug(f"신호 처리: {event}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("신호 처리: %s", event)
 
         # 신호를 주문으로 변환 (간단한 구현)
         # 실제 구현에서는 더 복잡한 로직 사용
-        if event.symbol in self.current_data:
-            current_price = self.current_data[event.symbol].close_price
+        symbol = event.symbol
+        current_price = self._close_prices.get(symbol)
+        if current_price is None:
+            return
 
-            # 포지션 사이즈 계산 (간단한 예시)
-            if event.signal_type == OrderSide.BUY:
-                buying_power = self.portfolio.calculate_buying_power(event.symbol, current_price)
-                quantity = min(buying_power, current_price)  # 1주 또는 가용 자금 내에서
+        # 포지션 사이즈 계산 (간단한 예시)
+        signal_type = event.signal_type
+        portfolio = self.portfolio
+        if signal_type == OrderSide.BUY:
+            buying_power = portfolio.calculate_buying_power(symbol, current_price)
+            quantity = min(buying_power, current_price)  # 1주 또는 가용 자금 내에서
+        else:
+            position = portfolio.get_position(symbol)
+            if position and position.quantity > 0:
+                quantity = position.quantity
             else:
-                position = self.portfolio.get_position(event.symbol)
-                if position and position.quantity > 0:
-                    quantity = position.quantity
-                else:
-                    return  # 매도할 포지션이 없음
-
-            if quantity > 0:
-                order_event = OrderEvent(
-                    timestamp=event.timestamp,
-                    symbol=event.symbol,
-                    order_type=OrderType.MARKET,
-                    side=event.signal_type,
-                    quantity=quantity,
-                    strategy_id=event.strategy_id
-                )
-                self.events.put(order_event)
+                return  # 매도할 포지션이 없음
+
+        if quantity > 0:
+            order_event = OrderEvent.acquire(
+                timestamp=event.timestamp,
+                symbol=symbol,
+                order_type=OrderType.MARKET,
+                side=signal_type,
+                quantity=quantity,
+                strategy_id=event.strategy_id
+            )
+            self.events.append(order_event)
 
     def _handle_order_event(self, event: OrderEvent):
         """주문 이벤트 처리."""
         self.orders_executed += 1
-        self.logger.debug(f"주문 처리: {event}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("주문 처리: %s", event)
 
         # 현재가 확인
-        if event.symbol in self.current_data:
-            current_price = self.current_data[event.symbol].close_price
+        current_price = self._close_prices.get(event.symbol)
+        if current_price is not None:
             self.execution_handler.execute_order(event, current_price)
 
     def _handle_fill_event(self, event: FillEvent):
         """체결 이벤트 처리."""
         self.fills_completed += 1
-        self.logger.debug(f"체결 처리: {event}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("체결 처리: %s", event)
 
         # 포트폴리오 업데이트
         self.portfolio.update_fill(event)
@@ -289,8 +477,8 @@ class BacktestEngine:
         symbol: str,
         side: OrderSide,
         order_type: OrderType,
-        quantity: Decimal,
-        price: Optional[Decimal] = None,
+        quantity: float,
+        price: Optional[float] = None,
         strategy_id: Optional[str] = None
     ):
         """
@@ -307,22 +495,22 @@ class BacktestEngine:
         if not self.current_time:
             return
 
-        order_event = OrderEvent(
+        order_event = OrderEvent.acquire(
             timestamp=self.current_time,
             symbol=symbol,
             order_type=order_type,
             side=side,
-            quantity=quantity,
-            price=price,
+            quantity=float(quantity),
+            price=float(price) if price is not None else None,
             strategy_id=strategy_id
         )
-        self.events.put(order_event)
+        self.events.append(order_event)
 
     def submit_signal(
         self,
         symbol: str,
         signal_type: OrderSide,
-        strength: Decimal,
+        strength: float,
         strategy_id: str,
         reason: str = ""
     ):
@@ -339,15 +527,15 @@ class BacktestEngine:
         if not self.current_time:
             return
 
-        signal_event = SignalEvent(
+        signal_event = SignalEvent.acquire(
             timestamp=self.current_time,
             symbol=symbol,
             signal_type=signal_type,
-            strength=strength,
+            strength=float(strength),
             strategy_id=strategy_id,
             reason=reason
         )
-        self.events.put(signal_event)
+        self.events.append(signal_event)
 
     def run(self, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None):
         """
@@ -360,44 +548,60 @@ class BacktestEngine:
         if not self.market_data:
             raise ValueError("시장 데이터가 없습니다.")
 
-        # 전체 시간 범위 계산
-        all_timestamps = set()
-        for candles in self.market_data.values():
-            for candle in candles:
-                if start_date and candle.timestamp < start_date:
-                    continue
-                if end_date and candle.timestamp > end_date:
-                    continue
-                all_timestamps.add(candle.timestamp)
+        # 전체 시간 범위 계산 (int64 시각 배열을 한 번에 병합)
+        start_ns = pd.Timestamp(start_date).value if start_date else None
+        end_ns = pd.Timestamp(end_date).value if end_date else None
+
+        # 종목별 시각 배열은 정렬되어 있으므로 이진 탐색으로 구간만 잘라냄
+        selected = []
+        for ts_ns in self._ts_ns.values():
+            lo = np.searchsorted(ts_ns, start_ns, 'left') if start_ns is not None else 0
+            hi = np.searchsorted(ts_ns, end_ns, 'right') if end_ns is not None else len(ts_ns)
+            selected.append(ts_ns[lo:hi])
 
-        timestamps = sorted(all_timestamps)
+        timeline = np.unique(np.concatenate(selected))
 
-        if not timestamps:
+        if timeline.size == 0:
             raise ValueError("지정된 기간에 데이터가 없습니다.")
 
+        timestamps = self._to_datetimes(timeline)
+
         self.logger.info(f"백테스트 시작: {timestamps[0]} ~ {timestamps[-1]} ({len(timestamps)}개 시점)")
         self.is_running = True
 
+        # 벡터화 전략 신호는 틱 루프 밖에서 한 번에 계산
+        vectorized_signals = self._compute_vectorized_signals()
+
+        # 틱 루프에서 반복 조회하는 메서드를 지역 변수로 바인딩
+        events = self.events
+        generate_market_events = self.generate_market_events
+        process_events = self.process_events
+        run_strategy_callbacks = self.run_strategy_callbacks
+        update_equity_curve = self.portfolio.update_equity_curve
+        self.portfolio.reserve_equity_curve(len(timestamps))
+
         try:
-            for timestamp in timestamps:
+            for ts_key, timestamp in zip(timeline.tolist(), timestamps):
                 self.current_time = timestamp
 
                 # 1. 시장 이벤트 생성
-                market_events = self.generate_market_events(timestamp)
-                for event in market_events:
-                    self.events.put(event)
+                market_events = generate_market_events(timestamp, ts_key)
+                tick_symbols = [event.symbol for event in market_events]
+                events.extend(market_events)
 
                 # 2. 이벤트 처리
-                self.process_events()
+                process_events()
 
                 # 3. 전략 실행
-                self.run_strategy_callbacks()
+                if vectorized_signals:
+                    self._replay_vectorized_signals(vectorized_signals, tick_symbols)
+                run_strategy_callbacks()
 
                 # 4. 다시 이벤트 처리 (전략에서 생성된 신호/주문)
-                self.process_events()
+                process_events()
 
                 # 5. 포트폴리오 업데이트
-                self.portfolio.update_equity_curve(timestamp)
+                update_equity_curve(timestamp)
 
         except Exception as e:
             self.logger.error(f"백테스트 실행 중 오류: {e}")
@@ -408,6 +612,13 @@ class BacktestEngine:
         self.logger.info("백테스트 완료")
         self._log_summary()
 
+    def _to_datetimes(self, timeline: np.ndarray) -> List[datetime]:
+        """int64 ns 타임라인을 입력 데이터와 같은 시간대의 datetime 리스트로 변환."""
+        index = pd.DatetimeIndex(timeline)
+        if self._tz is not None:
+            index = index.tz_localize('UTC').tz_convert(self._tz)
+        return list(index.to_pydatetime())
+
     def _log_summary(self):
         """백테스트 결과 요약 로그."""
         summary = self.get_summary()
@@ -1,14 +1,22 @@
 """백테스트 이벤트 시스템 - 단순화 버전."""
 
-from abc import ABC, abstractmethod
 from datetime import datetime
-from decimal import Decimal
 from enum import Enum
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, ClassVar, List
 
 from ..core.order_types import OrderSide, OrderType
 
 
+# 이벤트 타입별 재사용 풀 최대 크기
+EVENT_POOL_SIZE = 1024
+
+# 이벤트 종류 태그 (엔진의 핸들러 테이블 인덱스)
+EVENT_MARKET = 0
+EVENT_SIGNAL = 1
+EVENT_ORDER = 2
+EVENT_FILL = 3
+
+
 class EventType(Enum):
     """이벤트 타입."""
     MARKET = "market"
@@ -17,30 +25,62 @@ class EventType(Enum):
     FILL = "fill"
 
 
-class Event(ABC):
-    """이벤트 기본 클래스."""
+# 이벤트 타입 -> kind 태그
+EVENT_KINDS = {
+    EventType.MARKET: EVENT_MARKET,
+    EventType.SIGNAL: EVENT_SIGNAL,
+    EventType.ORDER: EVENT_ORDER,
+    EventType.FILL: EVENT_FILL
+}
+
+
+class Event:
+    """이벤트 기본 레코드 (kind 태그로 구분, 하위 클래스별 객체 풀로 재사용)."""
+
+    __slots__ = ('timestamp', 'event_type')
+
+    kind: ClassVar[int] = -1
+    _pool: ClassVar[List['Event']] = []
 
     def __init__(self, timestamp: datetime, event_type: EventType):
         self.timestamp = timestamp
         self.event_type = event_type
 
-    @abstractmethod
+    @classmethod
+    def acquire(cls, *args, **kwargs) -> 'Event':
+        """풀에서 이벤트를 꺼내 다시 초기화 (풀이 비어 있으면 새로 생성)."""
+        pool = cls._pool
+        event = pool.pop() if pool else object.__new__(cls)
+        event.__init__(*args, **kwargs)
+        return event
+
+    def release(self):
+        """처리가 끝난 이벤트를 풀에 반환 (반환 후에는 참조하지 않아야 함)."""
+        pool = type(self)._pool
+        if len(pool) < EVENT_POOL_SIZE:
+            pool.append(self)
+
     def __str__(self) -> str:
-        pass
+        return f"{type(self).__name__}({self.timestamp})"
 
 
 class MarketEvent(Event):
     """마켓 이벤트 (새로운 시장 데이터)."""
 
+    __slots__ = ('symbol', 'open_price', 'high_price', 'low_price', 'close_price', 'volume')
+
+    kind: ClassVar[int] = EVENT_MARKET
+    _pool: ClassVar[List['MarketEvent']] = []
+
     def __init__(
         self,
         timestamp: datetime,
         symbol: str,
-        open_price: Decimal,
-        high_price: Decimal,
-        low_price: Decimal,
-        close_price: Decimal,
-        volume: Decimal
+        open_price: float,
+        high_price: float,
+        low_price: float,
+        close_price: float,
+        volume: float
     ):
         super().__init__(timestamp, EventType.MARKET)
         self.symbol = symbol
@@ -57,12 +97,17 @@ class MarketEvent(Event):
 class SignalEvent(Event):
     """신호 이벤트 (매수/매도 신호)."""
 
+    __slots__ = ('symbol', 'signal_type', 'strength', 'strategy_id', 'reason', 'metadata')
+
+    kind: ClassVar[int] = EVENT_SIGNAL
+    _pool: ClassVar[List['SignalEvent']] = []
+
     def __init__(
         self,
         timestamp: datetime,
         symbol: str,
         signal_type: OrderSide,
-        strength: Decimal,
+        strength: float,
         strategy_id: str,
         reason: str,
         metadata: Optional[Dict[str, Any]] = None
@@ -82,14 +127,19 @@ class SignalEvent(Event):
 class OrderEvent(Event):
     """주문 이벤트."""
 
+    __slots__ = ('symbol', 'order_type', 'side', 'quantity', 'price', 'order_id', 'strategy_id')
+
+    kind: ClassVar[int] = EVENT_ORDER
+    _pool: ClassVar[List['OrderEvent']] = []
+
     def __init__(
         self,
         timestamp: datetime,
         symbol: str,
         order_type: OrderType,
         side: OrderSide,
-        quantity: Decimal,
-        price: Optional[Decimal] = None,
+        quantity: float,
+        price: Optional[float] = None,
         order_id: Optional[str] = None,
         strategy_id: Optional[str] = None
     ):
@@ -97,8 +147,9 @@ class OrderEvent(Event):
         self.symbol = symbol
         self.order_type = order_type
         self.side = side
-        self.quantity = quantity
-        self.price = price
+        # 수량/가격은 float로 보관 (Decimal 입력도 허용)
+        self.quantity = float(quantity)
+        self.price = float(price) if price is not None else None
         self.order_id = order_id
         self.strategy_id = strategy_id
 
@@ -108,25 +159,31 @@ class OrderEvent(Event):
 
 
 class FillEvent(Event):
-    """체결 이벤트."""
+    """체결 이벤트 (포트폴리오가 보관하므로 풀에 반환하지 않음)."""
+
+    __slots__ = ('symbol', 'side', 'quantity', 'fill_price', 'commission', 'order_id', 'fill_id')
+
+    kind: ClassVar[int] = EVENT_FILL
+    _pool: ClassVar[List['FillEvent']] = []
 
     def __init__(
         self,
         timestamp: datetime,
         symbol: str,
         side: OrderSide,
-        quantity: Decimal,
-        fill_price: Decimal,
-        commission: Decimal,
+        quantity: float,
+        fill_price: float,
+        commission: float,
         order_id: str,
         fill_id: str
     ):
         super().__init__(timestamp, EventType.FILL)
         self.symbol = symbol
         self.side = side
-        self.quantity = quantity
-        self.fill_price = fill_price
-        self.commission = commission
+        # 수량/가격/수수료는 float로 보관 (Decimal 입력도 허용)
+        self.quantity = float(quantity)
+        self.fill_price = float(fill_price)
+        self.commission = float(commission)
         self.order_id = order_id
         self.fill_id = fill_id
 
@@ -134,7 +191,7 @@ class FillEvent(Event):
         return f"FillEvent({self.side.value} {self.quantity} {self.symbol} @ {self.fill_price})"
 
     @property
-    def fill_cost(self) -> Decimal:
+    def fill_cost(self) -> float:
         """체결 비용 (수수료 포함)."""
         cost = self.quantity * self.fill_price
         if self.side == OrderSide.BUY:
@@ -2,11 +2,13 @@
 
 import math
 import logging
+from collections import deque
 from datetime import datetime, timedelta
 from decimal import Decimal
 from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass
 
+import numpy as np
 import pandas as pd
 
 
@@ -89,20 +91,16 @@ class PerformanceAnalyzer:
         # 수익률 지표 계산
         total_return = self._calculate_total_return(df)
         annualized_return = self._calculate_annualized_return(df)
-        daily_return_mean = df['daily_return'].mean()
-        daily_return_std = df['daily_return'].std()
+
+        # 일별 수익률 기반 지표는 한 번에 계산
+        return_stats = self._compute_return_stats(df['daily_return'].to_numpy(dtype=np.float64))
 
         # 리스크 지표 계산
         max_drawdown = self._calculate_max_drawdown(df)
-        volatility = self._calculate_volatility(df)
-        downside_deviation = self._calculate_downside_deviation(df)
         var_95, var_99 = self._calculate_var(df)
 
         # 효율성 지표 계산
-        sharpe_ratio = self._calculate_sharpe_ratio(df)
-        sortino_ratio = self._calculate_sortino_ratio(df)
         calmar_ratio = self._calculate_calmar_ratio(annualized_return, max_drawdown)
-        information_ratio = self._calculate_information_ratio(df)
 
         # 거래 통계 계산
         trade_stats = self._calculate_trade_statistics(trades)
@@ -115,21 +113,21 @@ class PerformanceAnalyzer:
             # 수익률 지표
             total_return=total_return,
             annualized_return=annualized_return,
-            daily_return_mean=daily_return_mean,
-            daily_return_std=daily_return_std,
+            daily_return_mean=return_stats['mean'],
+            daily_return_std=return_stats['std'],
 
             # 리스크 지표
             max_drawdown=max_drawdown,
-            volatility=volatility,
-            downside_deviation=downside_deviation,
+            volatility=return_stats['volatility'],
+            downside_deviation=return_stats['downside_deviation'],
             var_95=var_95,
             var_99=var_99,
 
             # 효율성 지표
-            sharpe_ratio=sharpe_ratio,
-            sortino_ratio=sortino_ratio,
+            sharpe_ratio=return_stats['sharpe_ratio'],
+            sortino_ratio=return_stats['sortino_ratio'],
             calmar_ratio=calmar_ratio,
-            information_ratio=information_ratio,
+            information_ratio=return_stats['information_ratio'],
 
             # 거래 통계
             total_trades=trade_stats['total_trades'],
@@ -150,6 +148,143 @@ class PerformanceAnalyzer:
         self.logger.info("성과 분석 완료")
         return metrics
 
+    def calculate_comprehensive_metrics(self, trades: List[Dict], daily_pnl: List[Dict]) -> Dict:
+        """
+        DB 거래/일별 손익 데이터로부터 종합 성과 지표 계산.
+
+        자산과 실현손익을 float64 배열로 한 번 변환한 뒤 모든 지표를
+        벡터 연산으로 계산한다.
+
+        Args:
+            trades: 거래 내역 리스트 (각 항목에 'pnl' 포함)
+            daily_pnl: 일별 손익 리스트 [{'date', 'pnl', 'equity'}, ...]
+
+        Returns:
+            성과 지표 딕셔너리
+        """
+        daily = sorted(daily_pnl, key=lambda x: x['date'])
+        equity = np.fromiter((d['equity'] for d in daily), dtype=np.float64, count=len(daily))
+        trade_pnl = np.fromiter((t['pnl'] for t in trades), dtype=np.float64, count=len(trades))
+
+        total_return = 0.0
+        annualized_return = 0.0
+        max_drawdown = 0.0
+        sharpe_ratio = 0.0
+        sortino_ratio = 0.0
+
+        if equity.size >= 2 and equity[0] > 0:
+            # 수익률 지표
+            growth = equity[-1] / equity[0]
+            total_return = float((growth - 1) * 100)
+
+            days = (daily[-1]['date'] - daily[0]['date']).days
+            if days > 0 and growth > 0:
+                annualized_return = float((growth ** (365.25 / days) - 1) * 100)
+
+            # 최대 낙폭 (첫 자산이 양수이므로 누적 최대값은 항상 양수)
+            running_max = np.maximum.accumulate(equity)
+            max_drawdown = float(((equity - running_max) / running_max).min() * 100)
+
+            # 일별 수익률 기반 효율성 지표
+            prev_equity = equity[:-1]
+            valid = prev_equity > 0
+            returns = np.diff(equity)[valid] / prev_equity[valid]
+            excess_returns = returns - self.risk_free_rate / 252
+
+            if excess_returns.size > 1:
+                excess_std = excess_returns.std(ddof=1)
+                if excess_std > 0:
+                    sharpe_ratio = float(excess_returns.mean() / excess_std * math.sqrt(252))
+
+                negative_returns = excess_returns[excess_returns < 0]
+                if negative_returns.size > 1:
+                    downside_std = negative_returns.std(ddof=1)
+                    if downside_std > 0:
+                        sortino_ratio = float(excess_returns.mean() / downside_std * math.sqrt(252))
+
+        # 거래 통계
+        wins = trade_pnl[trade_pnl > 0]
+        losses = trade_pnl[trade_pnl < 0]
+        total_trades = int(trade_pnl.size)
+        gross_loss = abs(float(losses.sum()))
+
+        return {
+            'total_return': total_return,
+            'annualized_return': annualized_return,
+            'max_drawdown': max_drawdown,
+            'sharpe_ratio': sharpe_ratio,
+            'sortino_ratio': sortino_ratio,
+            'calmar_ratio': self._calculate_calmar_ratio(annualized_return, max_drawdown),
+            'win_rate': wins.size / total_trades * 100 if total_trades > 0 else 0.0,
+            'profit_factor': float(wins.sum()) / gross_loss if gross_loss > 0 else 0.0,
+            'total_trades': total_trades,
+            'profitable_trades': int(wins.size),
+            'losing_trades': int(losses.size),
+            'avg_win': float(wins.mean()) if wins.size else 0.0,
+            'avg_loss': float(losses.mean()) if losses.size else 0.0,
+            'largest_win': float(wins.max()) if wins.size else 0.0,
+            'largest_loss': float(losses.min()) if losses.size else 0.0
+        }
+
+    def calculate_metrics(
+        self,
+        trades: List[Dict],
+        equity_curve: pd.DataFrame,
+        initial_capital: float
+    ) -> Dict[str, float]:
+        """
+        비동기 백테스트 결과(자산 곡선 DataFrame)로 성과 지표 계산.
+
+        Args:
+            trades: 거래 내역 리스트 (청산 거래에 'pnl' 포함)
+            equity_curve: timestamp 인덱스와 'equity' 컬럼을 가진 자산 곡선
+            initial_capital: 초기 자본
+
+        Returns:
+            성과 지표 딕셔너리
+        """
+        if len(equity_curve) == 0:
+            raise ValueError("자산 곡선 데이터가 없습니다.")
+
+        df = pd.DataFrame(
+            {'equity': equity_curve['equity'].to_numpy(dtype=np.float64)},
+            index=pd.DatetimeIndex(equity_curve.index)
+        ).sort_index()
+        df = self._add_equity_columns(df, initial_capital)
+
+        # 수익률/리스크/효율성 지표
+        total_return = float(self._calculate_total_return(df))
+        annualized_return = float(self._calculate_annualized_return(df))
+        max_drawdown = float(self._calculate_max_drawdown(df))
+        var_95, var_99 = self._calculate_var(df)
+        return_stats = self._compute_return_stats(df['daily_return'].to_numpy(dtype=np.float64))
+
+        # 청산 거래(매도/손절)의 실현 손익 기준 거래 통계
+        trade_pnl = np.fromiter((t['pnl'] for t in trades if 'pnl' in t), dtype=np.float64)
+        wins = trade_pnl[trade_pnl > 0]
+        losses = trade_pnl[trade_pnl < 0]
+        total_trades = int(trade_pnl.size)
+        gross_loss = abs(float(losses.sum()))
+
+        return {
+            'total_return': total_return,
+            'annualized_return': annualized_return,
+            'max_drawdown': max_drawdown,
+            'volatility': return_stats['volatility'],
+            'var_95': var_95,
+            'var_99': var_99,
+            'sharpe_ratio': return_stats['sharpe_ratio'],
+            'sortino_ratio': return_stats['sortino_ratio'],
+            'calmar_ratio': self._calculate_calmar_ratio(annualized_return, max_drawdown),
+            'win_rate': wins.size / total_trades * 100 if total_trades > 0 else 0.0,
+            'profit_factor': float(wins.sum()) / gross_loss if gross_loss > 0 else 0.0,
+            'total_trades': total_trades,
+            'profitable_trades': int(wins.size),
+            'losing_trades': int(losses.size),
+            'avg_win': float(wins.mean()) if wins.size else 0.0,
+            'avg_loss': float(losses.mean()) if losses.size else 0.0
+        }
+
     def _prepare_dataframe(self, equity_curve: List[Tuple[datetime, float]], initial_capital: float) -> pd.DataFrame:
         """데이터프레임 준비."""
         df = pd.DataFrame(equity_curve, columns=['timestamp', 'equity'])
@@ -157,16 +292,28 @@ class PerformanceAnalyzer:
         df.set_index('timestamp', inplace=True)
         df.sort_index(inplace=True)
 
-        # 수익률 계산
-        df['return_pct'] = df['equity'].pct_change()
-        df['daily_return'] = df['return_pct']
+        return self._add_equity_columns(df, initial_capital)
+
+    def _add_equity_columns(self, df: pd.DataFrame, initial_capital: float) -> pd.DataFrame:
+        """시간순 equity 컬럼에서 수익률/누적 수익률/드로다운 컬럼 추가."""
+        equity = df['equity'].to_numpy(dtype=np.float64)
+
+        # 수익률 계산 (pct_change와 동일, 첫 행은 NaN)
+        returns = np.empty_like(equity)
+        returns[:1] = np.nan
+        with np.errstate(divide='ignore', invalid='ignore'):
+            returns[1:] = equity[1:] / equity[:-1] - 1
+        df['return_pct'] = returns
+        df['daily_return'] = returns
 
         # 누적 수익률
-        df['cumulative_return'] = (df['equity'] / initial_capital - 1) * 100
+        df['cumulative_return'] = (equity / initial_capital - 1) * 100
 
-        # 드로다운 계산
-        df['running_max'] = df['equity'].expanding().max()
-        df['drawdown'] = (df['equity'] - df['running_max']) / df['running_max'] * 100
+        # 드로다운 계산 (누적 최대값을 numpy로 한 번에 계산)
+        running_max = np.maximum.accumulate(equity)
+        df['running_max'] = running_max
+        with np.errstate(divide='ignore', invalid='ignore'):
+            df['drawdown'] = (equity - running_max) / running_max * 100
 
         return df
 
@@ -210,64 +357,79 @@ class PerformanceAnalyzer:
             return 0.0
         return df['drawdown'].min()
 
-    def _calculate_volatility(self, df: pd.DataFrame) -> float:
-        """변동성 계산 (연환산)."""
-        if len(df) < 2:
-            return 0.0
+    def _compute_return_stats(self, returns: np.ndarray) -> Dict[str, float]:
+        """
+        일별 수익률 배열에서 평균/표준편차/변동성/하방 편차/샤프/소르티노/정보 비율 계산.
 
-        daily_vol = df['daily_return'].std()
-        annualized_vol = daily_vol * math.sqrt(252) * 100  # 252 trading days
-        return annualized_vol
+        NaN을 한 번 제거한 배열의 평균과 표준편차를 모든 지표가 공유해
+        지표마다 수익률 열을 다시 훑지 않는다.
 
-    def _calculate_downside_deviation(self, df: pd.DataFrame) -> float:
-        """하방 편차 계산."""
-        if len(df) < 2:
-            return 0.0
+        Args:
+            returns: 일별 수익률 배열 (첫 행 NaN 포함 가능)
 
-        negative_returns = df['daily_return'][df['daily_return'] < 0]
-        if len(negative_returns) == 0:
-            return 0.0
+        Returns:
+            지표 딕셔너리
+        """
+        returns = returns[~np.isnan(returns)]
+        count = returns.size
+
+        mean = float(returns.mean()) if count > 0 else float('nan')
+        std = float(returns.std(ddof=1)) if count > 1 else float('nan')
+
+        stats = {
+            'mean': mean,
+            'std': std,
+            'volatility': 0.0,
+            'downside_deviation': 0.0,
+            'sharpe_ratio': 0.0,
+            'sortino_ratio': 0.0,
+            'information_ratio': 0.0
+        }
 
-        downside_dev = negative_returns.std() * math.sqrt(252) * 100
-        return downside_dev
+        # 시점이 하나뿐이면 수익률이 없음
+        if count == 0:
+            return stats
 
-    def _calculate_var(self, df: pd.DataFrame) -> Tuple[float, float]:
-        """VaR 계산."""
-        if len(df) < 2:
-            return 0.0, 0.0
+        annual_factor = math.sqrt(252)
+        daily_risk_free = self.risk_free_rate / 252
 
-        returns = df['daily_return'].dropna()
-        var_95 = returns.quantile(0.05) * 100
-        var_99 = returns.quantile(0.01) * 100
+        # 변동성 (연환산)
+        stats['volatility'] = std * annual_factor * 100
 
-        return var_95, var_99
-
-    def _calculate_sharpe_ratio(self, df: pd.DataFrame) -> float:
-        """샤프 비율 계산."""
-        if len(df) < 2:
-            return 0.0
+        # 하방 편차
+        negative_returns = returns[returns < 0]
+        if negative_returns.size > 0:
+            downside_std = float(negative_returns.std(ddof=1)) if negative_returns.size > 1 else float('nan')
+            stats['downside_deviation'] = downside_std * annual_factor * 100
 
-        excess_returns = df['daily_return'] - (self.risk_free_rate / 252)
+        # 샤프/정보 비율 (초과 수익률의 표준편차는 수익률 표준편차와 같음, 벤치마크는 0으로 가정)
+        if std != 0:
+            stats['sharpe_ratio'] = (mean - daily_risk_free) / std * annual_factor
+            stats['information_ratio'] = mean / std * annual_factor
 
-        if excess_returns.std() == 0:
-            return 0.0
+        # 소르티노 비율
+        negative_excess = returns[returns < daily_risk_free] - daily_risk_free
+        if negative_excess.size > 0:
+            excess_downside_std = float(negative_excess.std(ddof=1)) if negative_excess.size > 1 else float('nan')
+            if excess_downside_std != 0:
+                stats['sortino_ratio'] = (mean - daily_risk_free) / excess_downside_std * annual_factor
 
-        sharpe = excess_returns.mean() / excess_returns.std() * math.sqrt(252)
-        return sharpe
+        return stats
 
-    def _calculate_sortino_ratio(self, df: pd.DataFrame) -> float:
-        """소르티노 비율 계산."""
+    def _calculate_var(self, df: pd.DataFrame) -> Tuple[float, float]:
+        """VaR 계산."""
         if len(df) < 2:
-            return 0.0
+            return 0.0, 0.0
 
-        excess_returns = df['daily_return'] - (self.risk_free_rate / 252)
-        negative_returns = excess_returns[excess_returns < 0]
+        returns = df['daily_return'].to_numpy(dtype=np.float64)
+        returns = returns[~np.isnan(returns)]
+        if returns.size == 0:
+            return float('nan'), float('nan')
 
-        if len(negative_returns) == 0 or negative_returns.std() == 0:
-            return 0.0
+        # 두 분위수를 한 번의 부분 정렬(np.partition)로 선택 (선형 보간은 pandas와 동일)
+        var_95, var_99 = np.quantile(returns, [0.05, 0.01]) * 100
 
-        sortino = excess_returns.mean() / negative_returns.std() * math.sqrt(252)
-        return sortino
+        return float(var_95), float(var_99)
 
     def _calculate_calmar_ratio(self, annualized_return: float, max_drawdown: float) -> float:
         """칼마 비율 계산."""
@@ -275,20 +437,6 @@ class PerformanceAnalyzer:
             return 0.0
         return annualized_return / abs(max_drawdown)
 
-    def _calculate_information_ratio(self, df: pd.DataFrame) -> float:
-        """정보 비율 계산 (벤치마크 대비)."""
-        # 벤치마크가 없으므로 0으로 가정
-        if len(df) < 2:
-            return 0.0
-
-        active_returns = df['daily_return']  # 벤치마크 대비 초과 수익
-
-        if active_returns.std() == 0:
-            return 0.0
-
-        info_ratio = active_returns.mean() / active_returns.std() * math.sqrt(252)
-        return info_ratio
-
     def _calculate_trade_statistics(self, trades: List[Dict]) -> Dict:
         """거래 통계 계산."""
         if not trades:
@@ -304,9 +452,9 @@ class PerformanceAnalyzer:
             }
 
         # 거래쌍 생성 (매수-매도)
-        trade_pairs = self._create_trade_pairs(trades)
+        pnl, durations = self._create_trade_pairs(trades)
 
-        if not trade_pairs:
+        if pnl.size == 0:
             return {
                 'total_trades': len(trades),
                 'winning_trades': 0,
@@ -318,25 +466,24 @@ class PerformanceAnalyzer:
                 'avg_trade_duration': 0.0
             }
 
-        winning_trades = [tp for tp in trade_pairs if tp['pnl'] > 0]
-        losing_trades = [tp for tp in trade_pairs if tp['pnl'] < 0]
+        winning_pnl = pnl[pnl > 0]
+        losing_pnl = pnl[pnl < 0]
 
-        total_pairs = len(trade_pairs)
-        win_count = len(winning_trades)
-        loss_count = len(losing_trades)
+        total_pairs = int(pnl.size)
+        win_count = int(winning_pnl.size)
+        loss_count = int(losing_pnl.size)
 
         win_rate = (win_count / total_pairs * 100) if total_pairs > 0 else 0.0
 
-        avg_win = sum(tp['pnl'] for tp in winning_trades) / win_count if win_count > 0 else 0.0
-        avg_loss = sum(tp['pnl'] for tp in losing_trades) / loss_count if loss_count > 0 else 0.0
+        gross_profit = float(winning_pnl.sum())
+        gross_loss = abs(float(losing_pnl.sum()))
 
-        gross_profit = sum(tp['pnl'] for tp in winning_trades)
-        gross_loss = abs(sum(tp['pnl'] for tp in losing_trades))
+        avg_win = gross_profit / win_count if win_count > 0 else 0.0
+        avg_loss = -gross_loss / loss_count if loss_count > 0 else 0.0
         profit_factor = gross_profit / gross_loss if gross_loss > 0 else 0.0
 
         # 평균 거래 기간
-        durations = [tp['duration_days'] for tp in trade_pairs]
-        avg_duration = sum(durations) / len(durations) if durations else 0.0
+        avg_duration = float(durations.mean()) if durations.size else 0.0
 
         return {
             'total_trades': total_pairs,
@@ -349,73 +496,94 @@ class PerformanceAnalyzer:
             'avg_trade_duration': avg_duration
         }
 
-    def _create_trade_pairs(self, trades: List[Dict]) -> List[Dict]:
-        """거래쌍 생성 (매수-매도)."""
-        pairs = []
-        positions = {}  # symbol -> [buy_trades]
+    def _create_trade_pairs(self, trades: List[Dict]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        매수-매도 거래쌍을 종목별 FIFO로 매칭해 손익과 보유 기간 계산.
 
-        for trade in sorted(trades, key=lambda x: x['timestamp']):
-            symbol = trade['symbol']
-            side = trade['side']
+        매칭 루프는 종목별 매수 큐에 [거래 인덱스, 남은 수량]만 보관하고,
+        손익은 매칭된 인덱스로 모은 가격/수수료 배열에서 한 번에 계산한다.
+        매도는 가장 오래된 매수 하나와만 매칭되며, 남은 매수 수량은 큐 앞에 유지된다.
+
+        Args:
+            trades: 거래 내역 리스트
+
+        Returns:
+            (거래쌍 손익 배열, 거래쌍 보유 기간(일) 배열)
+        """
+        ordered = sorted(trades, key=lambda x: x['timestamp'])
 
-            if symbol not in positions:
-                positions[symbol] = []
+        buy_idx: List[int] = []
+        sell_idx: List[int] = []
+        matched_qty: List[float] = []
+        open_buys: Dict[str, deque] = {}  # symbol -> [매수 거래 인덱스, 남은 수량] 큐
+
+        for i, trade in enumerate(ordered):
+            side = trade['side']
 
             if side == 'buy':
-                positions[symbol].append(trade)
-            elif side == 'sell' and positions[symbol]:
+                queue = open_buys.get(trade['symbol'])
+                if queue is None:
+                    queue = open_buys[trade['symbol']] = deque()
+                queue.append([i, trade['quantity']])
+            elif side == 'sell':
+                queue = open_buys.get(trade['symbol'])
+                if not queue:
+                    continue
+
                 # FIFO로 매칭
-                buy_trade = positions[symbol].pop(0)
-
-                quantity = min(trade['quantity'], buy_trade['quantity'])
-                buy_cost = quantity * buy_trade['price'] + buy_trade['commission']
-                sell_proceeds = quantity * trade['price'] - trade['commission']
-                pnl = sell_proceeds - buy_cost
-
-                duration = (trade['timestamp'] - buy_trade['timestamp']).days
-
-                pairs.append({
-                    'symbol': symbol,
-                    'buy_price': buy_trade['price'],
-                    'sell_price': trade['price'],
-                    'quantity': quantity,
-                    'pnl': pnl,
-                    'duration_days': duration,
-                    'buy_time': buy_trade['timestamp'],
-                    'sell_time': trade['timestamp']
-                })
+                head = queue[0]
+                quantity = min(trade['quantity'], head[1])
+                buy_idx.append(head[0])
+                sell_idx.append(i)
+                matched_qty.append(quantity)
 
                 # 부분 체결 처리
-                if buy_trade['quantity'] > quantity:
-                    buy_trade['quantity'] -= quantity
-                    positions[symbol].insert(0, buy_trade)
+                if head[1] > quantity:
+                    head[1] -= quantity
+                else:
+                    queue.popleft()
+
+        count = len(buy_idx)
+        buys = [ordered[j] for j in buy_idx]
+        sells = [ordered[i] for i in sell_idx]
+
+        quantity = np.fromiter(matched_qty, dtype=np.float64, count=count)
+        buy_cost = (
+            quantity * np.fromiter((t['price'] for t in buys), dtype=np.float64, count=count)
+            + np.fromiter((t['commission'] for t in buys), dtype=np.float64, count=count)
+        )
+        sell_proceeds = (
+            quantity * np.fromiter((t['price'] for t in sells), dtype=np.float64, count=count)
+            - np.fromiter((t['commission'] for t in sells), dtype=np.float64, count=count)
+        )
+        pnl = sell_proceeds - buy_cost
 
-        return pairs
+        durations = np.fromiter(
+            ((sell['timestamp'] - buy['timestamp']).days for buy, sell in zip(buys, sells)),
+            dtype=np.int64,
+            count=count
+        )
+
+        return pnl, durations
 
     def _calculate_consecutive_stats(self, df: pd.DataFrame) -> Dict:
         """연속 승패 통계."""
         if len(df) < 2:
             return {'max_wins': 0, 'max_losses': 0}
 
-        returns = df['daily_return'].dropna()
-
-        max_wins = 0
-        max_losses = 0
-        current_wins = 0
-        current_losses = 0
-
-        for ret in returns:
-            if ret > 0:
-                current_wins += 1
-                current_losses = 0
-                max_wins = max(max_wins, current_wins)
-            elif ret < 0:
-                current_losses += 1
-                current_wins = 0
-                max_losses = max(max_losses, current_losses)
-            else:
-                current_wins = 0
-                current_losses = 0
+        returns = df['daily_return'].to_numpy(dtype=np.float64)
+        returns = returns[~np.isnan(returns)]
+        if returns.size == 0:
+            return {'max_wins': 0, 'max_losses': 0}
+
+        # 부호가 바뀌는 지점으로 같은 부호 구간을 나누고 구간 길이를 계산
+        signs = np.sign(returns)
+        run_starts = np.concatenate(([0], np.flatnonzero(np.diff(signs)) + 1))
+        run_lengths = np.diff(np.append(run_starts, returns.size))
+        run_signs = signs[run_starts]
+
+        max_wins = int(run_lengths[run_signs > 0].max(initial=0))
+        max_losses = int(run_lengths[run_signs < 0].max(initial=0))
 
         return {'max_wins': max_wins, 'max_losses': max_losses}
 
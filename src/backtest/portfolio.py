@@ -3,10 +3,11 @@
 import logging
 from collections import defaultdict
 from datetime import datetime
-from decimal import Decimal
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 
+import numpy as np
+
 from .events import FillEvent
 from ..core.order_types import OrderSide
 
@@ -15,25 +16,25 @@ from ..core.order_types import OrderSide
 class Position:
     """포지션 정보."""
     symbol: str
-    quantity: Decimal = Decimal('0')
-    average_price: Decimal = Decimal('0')
-    realized_pnl: Decimal = Decimal('0')
-    unrealized_pnl: Decimal = Decimal('0')
-    market_price: Decimal = Decimal('0')
+    quantity: float = 0.0
+    average_price: float = 0.0
+    realized_pnl: float = 0.0
+    unrealized_pnl: float = 0.0
+    market_price: float = 0.0
     last_updated: datetime = field(default_factory=datetime.now)
 
     @property
-    def market_value(self) -> Decimal:
+    def market_value(self) -> float:
         """현재 시장 가치."""
         return self.quantity * self.market_price
 
     @property
-    def cost_basis(self) -> Decimal:
+    def cost_basis(self) -> float:
         """매입 원가."""
         return self.quantity * self.average_price
 
     @property
-    def total_pnl(self) -> Decimal:
+    def total_pnl(self) -> float:
         """총 손익 (실현 + 미실현)."""
         return self.realized_pnl + self.unrealized_pnl
 
@@ -52,7 +53,7 @@ class Position:
         """플랫 포지션 여부."""
         return self.quantity == 0
 
-    def update_market_price(self, new_price: Decimal, timestamp: datetime):
+    def update_market_price(self, new_price: float, timestamp: datetime):
         """시장가 업데이트."""
         self.market_price = new_price
         if not self.is_flat:
@@ -65,19 +66,19 @@ class Trade:
     """거래 기록."""
     symbol: str
     side: OrderSide
-    quantity: Decimal
-    price: Decimal
-    commission: Decimal
+    quantity: float
+    price: float
+    commission: float
     timestamp: datetime
     fill_id: str
 
     @property
-    def gross_amount(self) -> Decimal:
+    def gross_amount(self) -> float:
         """총 거래 금액."""
         return self.quantity * self.price
 
     @property
-    def net_amount(self) -> Decimal:
+    def net_amount(self) -> float:
         """순 거래 금액 (수수료 차감)."""
         if self.side == OrderSide.BUY:
             return self.gross_amount + self.commission
@@ -88,7 +89,7 @@ class Trade:
 class Portfolio:
     """백테스트 포트폴리오."""
 
-    def __init__(self, initial_capital: Decimal, commission_rate: Decimal = Decimal('0.0025')):
+    def __init__(self, initial_capital: float, commission_rate: float = 0.0025):
         """
         포트폴리오 초기화.
 
@@ -96,25 +97,29 @@ class Portfolio:
             initial_capital: 초기 자본
             commission_rate: 수수료율 (기본 0.25%)
         """
-        self.initial_capital = initial_capital
-        self.commission_rate = commission_rate
+        # 시뮬레이션 내부 연산은 float로 처리 (Decimal 입력도 허용)
+        self.initial_capital = float(initial_capital)
+        self.commission_rate = float(commission_rate)
         self.logger = logging.getLogger(self.__class__.__name__)
 
         # 포지션 관리
         self.positions: Dict[str, Position] = {}
-        self.cash = initial_capital
+        self.cash = self.initial_capital
 
         # 거래 기록
         self.trades: List[Trade] = []
         self.fills: List[FillEvent] = []
 
-        # 성과 추적
-        self.equity_curve: List[Tuple[datetime, Decimal]] = []
-        self.drawdown_curve: List[Tuple[datetime, Decimal]] = []
+        # 성과 추적 (값은 미리 할당한 배열에 기록, 튜플 리스트는 조회 시 생성)
+        self._curve_timestamps: List[datetime] = []
+        self._equity_values = np.empty(0, dtype=np.float64)
+        self._drawdown_values = np.empty(0, dtype=np.float64)
+        self._curve_len = 0
+        self._peak_equity = float('-inf')  # 자산 곡선 최고점 (드로다운 계산용)
 
         # 통계
-        self.total_commission = Decimal('0')
-        self.total_slippage = Decimal('0')
+        self.total_commission = 0.0
+        self.total_slippage = 0.0
 
     def update_fill(self, fill_event: FillEvent):
         """
@@ -125,11 +130,13 @@ class Portfolio:
         """
         symbol = fill_event.symbol
         side = fill_event.side
-        quantity = fill_event.quantity
-        price = fill_event.fill_price
-        commission = fill_event.commission
+        # 포트폴리오 상태는 float이므로 입력을 float로 변환 (Decimal 입력도 허용)
+        quantity = float(fill_event.quantity)
+        price = float(fill_event.fill_price)
+        commission = float(fill_event.commission)
 
-        self.logger.debug(f"체결 처리: {side.value} {quantity} {symbol} @ {price}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("체결 처리: %s %s %s @ %s", side.value, quantity, symbol, price)
 
         # 포지션 업데이트
         if symbol not in self.positions:
@@ -160,15 +167,16 @@ class Portfolio:
         # 통계 업데이트
         self.total_commission += commission
 
-        self.logger.info(f"포지션 업데이트: {symbol} {position.quantity} @ {position.average_price}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("포지션 업데이트: %s %s @ %s", symbol, position.quantity, position.average_price)
 
     def _update_position(
         self,
         position: Position,
         side: OrderSide,
-        quantity: Decimal,
-        price: Decimal,
-        commission: Decimal
+        quantity: float,
+        price: float,
+        commission: float
     ):
         """포지션 업데이트."""
         if side == OrderSide.BUY:
@@ -176,7 +184,7 @@ class Portfolio:
                 # 롱 추가 또는 신규 롱
                 total_cost = position.quantity * position.average_price + quantity * price
                 position.quantity += quantity
-                position.average_price = total_cost / position.quantity if position.quantity > 0 else Decimal('0')
+                position.average_price = total_cost / position.quantity if position.quantity > 0 else 0.0
             else:
                 # 숏 커버
                 if quantity >= abs(position.quantity):
@@ -190,8 +198,8 @@ class Portfolio:
                         position.quantity = remaining_quantity
                         position.average_price = price
                     else:
-                        position.quantity = Decimal('0')
-                        position.average_price = Decimal('0')
+                        position.quantity = 0.0
+                        position.average_price = 0.0
                 else:
                     # 부분 청산
                     realized_pnl = (position.average_price - price) * quantity - commission
@@ -203,7 +211,7 @@ class Portfolio:
                 # 숏 추가 또는 신규 숏
                 total_cost = abs(position.quantity) * position.average_price + quantity * price
                 position.quantity -= quantity
-                position.average_price = total_cost / abs(position.quantity) if position.quantity != 0 else Decimal('0')
+                position.average_price = total_cost / abs(position.quantity) if position.quantity != 0 else 0.0
             else:
                 # 롱 청산
                 if quantity >= position.quantity:
@@ -217,15 +225,15 @@ class Portfolio:
                         position.quantity = -remaining_quantity
                         position.average_price = price
                     else:
-                        position.quantity = Decimal('0')
-                        position.average_price = Decimal('0')
+                        position.quantity = 0.0
+                        position.average_price = 0.0
                 else:
                     # 부분 청산
                     realized_pnl = (price - position.average_price) * quantity - commission
                     position.realized_pnl += realized_pnl
                     position.quantity -= quantity
 
-    def update_market_data(self, symbol: str, price: Decimal, timestamp: datetime):
+    def update_market_data(self, symbol: str, price: float, timestamp: datetime):
         """
         시장 데이터 업데이트.
 
@@ -235,9 +243,9 @@ class Portfolio:
             timestamp: 시점
         """
         if symbol in self.positions:
-            self.positions[symbol].update_market_price(price, timestamp)
+            self.positions[symbol].update_market_price(float(price), timestamp)
 
-    def calculate_total_equity(self) -> Decimal:
+    def calculate_total_equity(self) -> float:
         """총 자산 계산."""
         total_equity = self.cash
 
@@ -247,21 +255,51 @@ class Portfolio:
 
         return total_equity
 
+    def reserve_equity_curve(self, size: int):
+        """자산/낙폭 곡선 배열을 최소 size개 시점만큼 미리 할당."""
+        if size <= len(self._equity_values):
+            return
+
+        equity_values = np.empty(size, dtype=np.float64)
+        drawdown_values = np.empty(size, dtype=np.float64)
+        n = self._curve_len
+        equity_values[:n] = self._equity_values[:n]
+        drawdown_values[:n] = self._drawdown_values[:n]
+        self._equity_values = equity_values
+        self._drawdown_values = drawdown_values
+
     def update_equity_curve(self, timestamp: datetime):
         """자산 곡선 업데이트."""
         total_equity = self.calculate_total_equity()
-        self.equity_curve.append((timestamp, total_equity))
 
-        # 드로다운 계산
-        if self.equity_curve:
-            peak = max(eq[1] for eq in self.equity_curve)
-            drawdown = (total_equity - peak) / peak * Decimal('100')
-            self.drawdown_curve.append((timestamp, drawdown))
+        i = self._curve_len
+        if i >= len(self._equity_values):
+            self.reserve_equity_curve(max(2 * i, 64))
+
+        # 드로다운 계산 (최고점은 누적 갱신해 매 틱 전체 곡선을 다시 훑지 않음)
+        if total_equity > self._peak_equity:
+            self._peak_equity = total_equity
+        peak = self._peak_equity
+
+        self._curve_timestamps.append(timestamp)
+        self._equity_values[i] = total_equity
+        self._drawdown_values[i] = (total_equity - peak) / peak * 100
+        self._curve_len = i + 1
+
+    @property
+    def equity_curve(self) -> List[Tuple[datetime, float]]:
+        """자산 곡선 [(timestamp, equity), ...]."""
+        return list(zip(self._curve_timestamps, self._equity_values[:self._curve_len].tolist()))
+
+    @property
+    def drawdown_curve(self) -> List[Tuple[datetime, float]]:
+        """낙폭 곡선 [(timestamp, drawdown %), ...]."""
+        return list(zip(self._curve_timestamps, self._drawdown_values[:self._curve_len].tolist()))
 
     def get_portfolio_summary(self) -> Dict:
         """포트폴리오 요약 정보."""
         total_equity = self.calculate_total_equity()
-        total_return = (total_equity - self.initial_capital) / self.initial_capital * Decimal('100')
+        total_return = (total_equity - self.initial_capital) / self.initial_capital * 100
 
         # 활성 포지션
         active_positions = {
@@ -293,14 +331,14 @@ class Portfolio:
         """모든 포지션 조회."""
         return self.positions.copy()
 
-    def calculate_buying_power(self, symbol: str, price: Decimal) -> Decimal:
+    def calculate_buying_power(self, symbol: str, price: float) -> float:
         """매수 가능 수량 계산."""
         available_cash = self.cash
         commission = price * self.commission_rate
         max_quantity = available_cash / (price + commission)
         return max_quantity
 
-    def can_sell(self, symbol: str, quantity: Decimal) -> bool:
+    def can_sell(self, symbol: str, quantity: float) -> bool:
         """매도 가능 여부 확인."""
         if symbol not in self.positions:
             return False
@@ -308,29 +346,30 @@ class Portfolio:
         position = self.positions[symbol]
         return position.quantity >= quantity
 
-    def get_daily_returns(self) -> List[Tuple[datetime, Decimal]]:
+    def get_daily_returns(self) -> List[Tuple[datetime, float]]:
         """일별 수익률 계산."""
-        if len(self.equity_curve) < 2:
+        if self._curve_len < 2:
             return []
 
+        equity = self._equity_values[:self._curve_len].tolist()
         daily_returns = []
-        for i in range(1, len(self.equity_curve)):
-            prev_equity = self.equity_curve[i-1][1]
-            curr_equity = self.equity_curve[i][1]
-            timestamp = self.equity_curve[i][0]
+        for i in range(1, len(equity)):
+            prev_equity = equity[i-1]
+            curr_equity = equity[i]
+            timestamp = self._curve_timestamps[i]
 
             if prev_equity > 0:
-                daily_return = (curr_equity - prev_equity) / prev_equity * Decimal('100')
+                daily_return = (curr_equity - prev_equity) / prev_equity * 100
                 daily_returns.append((timestamp, daily_return))
 
         return daily_returns
 
-    def get_max_drawdown(self) -> Decimal:
+    def get_max_drawdown(self) -> float:
         """최대 낙폭 계산."""
-        if not self.drawdown_curve:
-            return Decimal('0')
+        if not self._curve_len:
+            return 0.0
 
-        return min(dd[1] for dd in self.drawdown_curve)
+        return float(self._drawdown_values[:self._curve_len].min())
 
     def get_trade_statistics(self) -> Dict:
         """거래 통계."""
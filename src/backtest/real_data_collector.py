@@ -4,7 +4,6 @@ import logging
 import time
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Tuple
-from decimal import Decimal
 import pandas as pd
 from dataclasses import dataclass
 import asyncio
@@ -12,7 +11,7 @@ import json
 
 from ..exchange.bithumb_client import BithumbClient
 from ..utils.exceptions import ExchangeError
-from .data_collector import CandleData
+from .data_collector import CandleData, CandleBatch
 
 
 class RealDataCollector:
@@ -96,6 +95,28 @@ class RealDataCollector:
             # 실패 시 기존 Mock 데이터로 폴백
             return await self._fallback_to_ticker_data(symbol, interval, start_time, end_time)
 
+    async def collect_candle_batch(
+        self,
+        symbol: str,
+        interval: str,
+        start_time: datetime,
+        end_time: datetime
+    ) -> CandleBatch:
+        """
+        collect_candles_from_trades 결과를 컬럼 배열 배치로 반환.
+
+        Args:
+            symbol: 종목 코드
+            interval: 시간 간격
+            start_time: 시작 시간
+            end_time: 종료 시간
+
+        Returns:
+            캔들 배치
+        """
+        candles = await self.collect_candles_from_trades(symbol, interval, start_time, end_time)
+        return CandleBatch.from_candles(candles, symbol)
+
     async def _collect_historical_candles(
         self,
         symbol: str,
@@ -167,11 +188,11 @@ class RealDataCollector:
         timestamp: datetime
     ) -> CandleData:
         """Ticker 데이터를 캔들 데이터로 변환."""
-        price = Decimal(str(ticker_data.get('closing_price', 0)))
-        volume = Decimal(str(ticker_data.get('units_traded_24H', 0)))
+        price = float(ticker_data.get('closing_price', 0))
+        volume = float(ticker_data.get('units_traded_24H', 0))
 
         # ticker는 OHLC가 없으므로 현재가를 기준으로 약간의 변동 추가
-        variation = price * Decimal('0.001')  # 0.1% 변동
+        variation = price * 0.001  # 0.1% 변동
 
         return CandleData(
             timestamp=timestamp,
@@ -208,8 +229,8 @@ class RealDataCollector:
                 trade_groups[group_key] = []
 
             trade_groups[group_key].append({
-                'price': Decimal(str(trade.get('price', 0))),
-                'amount': Decimal(str(trade.get('units_traded', 0))),
+                'price': float(trade.get('price', 0)),
+                'amount': float(trade.get('units_traded', 0)),
                 'timestamp': timestamp
             })
 
@@ -111,6 +111,7 @@ class Trade(TimestampMixin, Base):
 
     __table_args__ = (
         Index("ix_trades_symbol_time", "symbol", "executed_at"),
+        Index("ix_trades_time_symbol", "executed_at", "symbol"),
     )
 
 
@@ -143,6 +144,10 @@ class DailyPnL(TimestampMixin, Base):
     total_equity: Mapped[Decimal] = mapped_column(Numeric(24, 8), nullable=False, default=Decimal("0"))
     return_rate: Mapped[Decimal] = mapped_column(Numeric(10, 4), nullable=False, default=Decimal("0"))
 
+    __table_args__ = (
+        Index("ix_pnl_daily_date_equity", "date", "realized_pnl", "total_equity"),
+    )
+
 
 class Config(TimestampMixin, Base):
     """전략 및 시스템 설정."""
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.routers import analysis
+
+
+PARAMS = {"start_date": "2024-01-01", "end_date": "2024-01-21"}
+
+
+@pytest.fixture()
+def api_client() -> TestClient:
+    app = FastAPI()
+    app.include_router(analysis.router, prefix="/api/analysis")
+    return TestClient(app)
+
+
+def expected_points() -> list[dict]:
+    start = datetime(2024, 1, 1)
+    peak = 1_000_000
+    points = []
+    for i in range(20):
+        equity = 1_000_000 * (1 + (i * 0.001) + ((i % 7) - 3) * 0.002)
+        peak = max(peak, equity)
+        points.append({
+            "timestamp": (start + timedelta(days=i)).isoformat(),
+            "equity": round(equity, 2),
+            "drawdown": round((equity - peak) / peak * 100, 2),
+        })
+    return points
+
+
+def test_equity_curve_defaults_to_point_list(api_client) -> None:
+    response = api_client.get("/api/analysis/equity-curve", params=PARAMS)
+
+    assert response.status_code == 200
+    assert response.json() == expected_points()
+
+
+def test_equity_curve_columnar_opt_in(api_client) -> None:
+    response = api_client.get("/api/analysis/equity-curve", params={**PARAMS, "columnar": True})
+
+    assert response.status_code == 200
+    points = expected_points()
+    assert response.json() == {
+        "timestamps": [point["timestamp"] for point in points],
+        "equity": pytest.approx([point["equity"] for point in points]),
+        "drawdown": pytest.approx([point["drawdown"] for point in points]),
+    }
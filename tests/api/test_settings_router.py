@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.routers import settings
+
+
+@pytest.fixture()
+def api_client() -> TestClient:
+    app = FastAPI()
+    app.include_router(settings.router, prefix="/api/settings")
+    return TestClient(app)
+
+
+@pytest.mark.parametrize(
+    ("path", "model"),
+    [
+        ("strategy", settings.StrategyConfig),
+        ("risk", settings.RiskConfig),
+        ("notifications", settings.NotificationConfig),
+    ],
+)
+def test_config_get_returns_precomputed_payload(api_client, path, model) -> None:
+    response = api_client.get(f"/api/settings/{path}")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert model.model_validate(response.json()).model_dump() == response.json()
+
+
+def test_config_put_does_not_change_get_payload(api_client) -> None:
+    before = api_client.get("/api/settings/strategy").json()
+
+    updated = {**before, "max_positions": before["max_positions"] + 1}
+    response = api_client.put("/api/settings/strategy", json=updated)
+
+    assert response.status_code == 200
+    assert response.json()["config"] == updated
+    assert api_client.get("/api/settings/strategy").json() == before
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.routers import trading
+
+
+class FakeExchangeClient:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, dict]] = []
+
+    async def limit_buy(self, **kwargs):
+        self.calls.append(("limit_buy", kwargs))
+        return {"order_id": "order_fake"}
+
+    async def get_orders(self, **kwargs):
+        self.calls.append(("get_orders", kwargs))
+        return [
+            {"order_id": "order_001", "symbol": "BTC_KRW", "status": "filled"},
+            {"order_id": "order_002", "symbol": "BTC_KRW", "status": "pending"},
+        ]
+
+
+@pytest.fixture()
+def exchange_client() -> FakeExchangeClient:
+    return FakeExchangeClient()
+
+
+@pytest.fixture()
+def api_client(exchange_client) -> TestClient:
+    app = FastAPI()
+    app.include_router(trading.router, prefix="/api/trading")
+    app.dependency_overrides[trading.get_client] = lambda: exchange_client
+    return TestClient(app)
+
+
+def test_trade_history_cursor_pages_newest_first(api_client) -> None:
+    first = api_client.get("/api/trading/trades", params={"limit": 1})
+    assert first.status_code == 200
+    first_page = first.json()
+    assert [trade["trade_id"] for trade in first_page["trades"]] == ["trade_001"]
+    assert first_page["next_cursor"] == "2025-09-22T13:30:00Z:trade_001"
+
+    second = api_client.get(
+        "/api/trading/trades", params={"limit": 1, "after": first_page["next_cursor"]}
+    )
+    assert second.status_code == 200
+    second_page = second.json()
+    assert [trade["trade_id"] for trade in second_page["trades"]] == ["trade_002"]
+    assert second_page["next_cursor"] is None
+
+
+def test_trade_history_symbol_filter_single_page(api_client) -> None:
+    response = api_client.get("/api/trading/trades", params={"symbol": "ETH_KRW"})
+    payload = response.json()
+    assert [trade["trade_id"] for trade in payload["trades"]] == ["trade_002"]
+    assert payload["next_cursor"] is None
+
+
+def test_trade_history_offset_paging_reports_total(api_client) -> None:
+    first = api_client.get("/api/trading/trades", params={"limit": 1}).json()
+    assert first["total"] == 2
+    assert first["offset"] == 0
+
+    second = api_client.get("/api/trading/trades", params={"limit": 1, "offset": 1}).json()
+    assert [trade["trade_id"] for trade in second["trades"]] == ["trade_002"]
+    assert second["total"] == 2
+    assert second["offset"] == 1
+    assert second["next_cursor"] is None
+
+    past_end = api_client.get("/api/trading/trades", params={"offset": 5}).json()
+    assert past_end["trades"] == []
+    assert past_end["total"] == 2
+
+
+@pytest.mark.parametrize("cursor", ["garbage", ":trade_001", "2025-09-22T13:30:00Z:"])
+def test_trade_history_rejects_malformed_cursor(api_client, cursor: str) -> None:
+    response = api_client.get("/api/trading/trades", params={"after": cursor})
+    assert response.status_code == 400
+
+
+def test_create_limit_order(api_client, exchange_client) -> None:
+    response = api_client.post(
+        "/api/trading/orders",
+        json={"symbol": "BTC_KRW", "side": "buy", "order_type": "limit", "quantity": 0.01, "price": 98000000},
+    )
+    assert response.status_code == 200
+    assert response.json()["order_id"] == "order_fake"
+    assert exchange_client.calls == [
+        ("limit_buy", {"symbol": "BTC_KRW", "quantity": 0.01, "price": 98000000.0})
+    ]
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"symbol": "BTC_KRW", "side": "hold", "order_type": "market", "quantity": 1},
+        {"symbol": "BTC_KRW", "side": "buy", "order_type": "stop", "quantity": 1},
+        {"symbol": "BTC_KRW", "side": "buy", "order_type": "limit", "quantity": 1},
+    ],
+)
+def test_create_order_rejects_invalid_request(api_client, exchange_client, payload) -> None:
+    response = api_client.post("/api/trading/orders", json=payload)
+    assert response.status_code == 422
+    assert exchange_client.calls == []
+
+
+def test_trade_history_etag_returns_304_when_unchanged(api_client) -> None:
+    first = api_client.get("/api/trading/trades", params={"limit": 1})
+    etag = first.headers["etag"]
+    assert first.status_code == 200
+
+    cached = api_client.get("/api/trading/trades", params={"limit": 1}, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+
+    other_page = api_client.get("/api/trading/trades", params={"limit": 2}, headers={"If-None-Match": etag})
+    assert other_page.status_code == 200
+    assert other_page.headers["etag"] != etag
+
+
+def test_orders_status_filter_and_etag(api_client, exchange_client) -> None:
+    response = api_client.get("/api/trading/orders", params={"symbol": "BTC_KRW", "status": "pending"})
+    assert response.status_code == 200
+    assert [order["order_id"] for order in response.json()["orders"]] == ["order_002"]
+    assert exchange_client.calls == [("get_orders", {"symbol": "BTC_KRW"})]
+
+    cached = api_client.get(
+        "/api/trading/orders",
+        params={"symbol": "BTC_KRW", "status": "pending"},
+        headers={"If-None-Match": response.headers["etag"]},
+    )
+    assert cached.status_code == 304
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+
+import orjson
+import ormsgpack
+from fastapi.testclient import TestClient
+
+from src.api.websocket import BROADCAST_BATCH_WINDOW, ConnectionManager, WebSocketManager
+
+
+class FakeWebSocket:
+    def __init__(self) -> None:
+        self.frames: list = []
+
+    async def accept(self) -> None:
+        pass
+
+    async def send_text(self, payload: str) -> None:
+        self.frames.append(orjson.loads(payload))
+
+    async def send_bytes(self, payload: bytes) -> None:
+        self.frames.append(ormsgpack.unpackb(payload))
+
+    async def close(self, code: int = 1000) -> None:
+        pass
+
+
+async def broadcast_and_flush(manager: ConnectionManager, *messages: dict) -> None:
+    for message in messages:
+        await manager.broadcast(message)
+    await asyncio.sleep(BROADCAST_BATCH_WINDOW * 4)
+    await manager.close()
+
+
+def test_broadcast_sends_individual_messages_by_default() -> None:
+    async def scenario() -> FakeWebSocket:
+        manager = ConnectionManager()
+        websocket = FakeWebSocket()
+        await manager.connect(websocket)
+        await broadcast_and_flush(manager, {"type": "a"}, {"type": "b"})
+        return websocket
+
+    websocket = asyncio.run(scenario())
+
+    assert websocket.frames == [{"type": "a"}, {"type": "b"}]
+
+
+def test_broadcast_batches_messages_for_opted_in_clients() -> None:
+    async def scenario() -> tuple[FakeWebSocket, FakeWebSocket, FakeWebSocket]:
+        manager = ConnectionManager()
+        plain, batched, batched_msgpack = FakeWebSocket(), FakeWebSocket(), FakeWebSocket()
+        for websocket in (plain, batched, batched_msgpack):
+            await manager.connect(websocket)
+        manager.set_batch(batched, True)
+        manager.set_batch(batched_msgpack, True)
+        manager.set_format(batched_msgpack, "msgpack")
+        await broadcast_and_flush(manager, {"type": "a"}, {"type": "b"})
+        return plain, batched, batched_msgpack
+
+    plain, batched, batched_msgpack = asyncio.run(scenario())
+
+    assert plain.frames == [{"type": "a"}, {"type": "b"}]
+    expected = [{"type": "batch", "messages": [{"type": "a"}, {"type": "b"}]}]
+    assert batched.frames == expected
+    assert batched_msgpack.frames == expected
+
+
+def price(symbol: str, value: float) -> dict:
+    return {
+        "symbol": symbol,
+        "price": value,
+        "change_24h": 0.0,
+        "change_rate_24h": 0.0,
+        "volume_24h": 1.0,
+        "timestamp": "2024-01-01T00:00:00",
+    }
+
+
+def test_price_update_sends_changed_symbols_only_to_delta_clients() -> None:
+    first = {"BTC_KRW": price("BTC_KRW", 100.0), "ETH_KRW": price("ETH_KRW", 10.0)}
+    second = {"BTC_KRW": price("BTC_KRW", 101.0), "ETH_KRW": price("ETH_KRW", 10.0)}
+
+    async def scenario() -> tuple[FakeWebSocket, FakeWebSocket]:
+        manager = ConnectionManager()
+        full, delta = FakeWebSocket(), FakeWebSocket()
+        await manager.connect(full)
+        await manager.connect(delta)
+        manager.set_delta(delta, True)
+        for price_data in (first, second, second):
+            await manager.broadcast_price_update(price_data)
+            await asyncio.sleep(BROADCAST_BATCH_WINDOW * 2)
+        await manager.close()
+        return full, delta
+
+    full, delta = asyncio.run(scenario())
+
+    assert full.frames == [{"type": "price_update", "data": data} for data in (first, second, second)]
+    assert delta.frames == [
+        {"type": "price_update", "data": first},
+        {"type": "price_update", "data": {"BTC_KRW": second["BTC_KRW"]}},
+    ]
+
+
+def test_pong_timestamp_is_iso_string() -> None:
+    with TestClient(WebSocketManager().app).websocket_connect("/") as websocket:
+        websocket.send_text(orjson.dumps({"type": "ping"}).decode())
+        message = websocket.receive_json()
+
+    assert message["type"] == "pong"
+    assert isinstance(message["timestamp"], str)
+    datetime.fromisoformat(message["timestamp"])
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import asyncio
+import math
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.backtest.async_engine import AsyncBacktestEngine, _cache_key
+from src.core.parameters import StrategyParameters
+from src.backtest.data_collector import CandleBatch
+
+
+def make_batch(symbol: str = "BTC_KRW", count: int = 400) -> CandleBatch:
+    rng = np.random.default_rng(3)
+    steps = np.arange(count)
+    close = 100_000_000 * (1 + 0.05 * np.sin(steps / 15)) * (1 + rng.normal(0, 0.002, count))
+    return CandleBatch(
+        symbol=symbol,
+        timestamps=pd.date_range(datetime(2024, 1, 1), periods=count, freq="h").to_numpy(),
+        open=close,
+        high=close * 1.003,
+        low=close * 0.997,
+        close=close,
+        volume=np.full(count, 5.0),
+    )
+
+
+class StaticCollector:
+    supported_intervals = {"1h": 60}
+
+    def __init__(self, batch: CandleBatch) -> None:
+        self.batch = batch
+        self.calls = 0
+
+    async def collect_candle_batch(self, symbol, interval, start_date, end_date):
+        self.calls += 1
+        return self.batch
+
+
+def make_cached_engine(cache_dir) -> AsyncBacktestEngine:
+    engine = AsyncBacktestEngine(bithumb_client=None, indicator_cache_dir=cache_dir)
+    engine.data_collector = StaticCollector(make_batch())
+    return engine
+
+
+def load_indicators(engine: AsyncBacktestEngine, start: datetime, end: datetime) -> pd.DataFrame:
+    return asyncio.run(engine._load_indicators("BTC_KRW", "1h", start, end, StrategyParameters()))
+
+
+def test_indicator_cache_miss_then_hit(tmp_path) -> None:
+    pytest.importorskip("pyarrow")
+    engine = make_cached_engine(tmp_path)
+    start = datetime(2024, 1, 1)
+    end = start + timedelta(days=16)
+
+    first = load_indicators(engine, start, end)
+    assert engine.data_collector.calls == 1
+    assert len(list(tmp_path.glob("*.parquet"))) == 1
+
+    second = load_indicators(engine, start, end)
+    assert engine.data_collector.calls == 1
+    pd.testing.assert_frame_equal(first, second, check_freq=False)
+
+
+def test_indicator_cache_recomputes_corrupt_file(tmp_path) -> None:
+    engine = make_cached_engine(tmp_path)
+    start = datetime(2024, 1, 1)
+    end = start + timedelta(days=16)
+    key = _cache_key("BTC_KRW", start, end, "1h", engine._indicator_key(StrategyParameters()))
+    (tmp_path / f"{key}.parquet").write_bytes(b"not a parquet file")
+
+    df = load_indicators(engine, start, end)
+
+    assert engine.data_collector.calls == 1
+    assert len(df) == 400
+    assert {"ema_short", "ema_long", "rsi", "atr"} <= set(df.columns)
+
+
+def test_indicator_cache_skips_open_range(tmp_path) -> None:
+    cache_dir = tmp_path / "cache"
+    engine = make_cached_engine(cache_dir)
+    start = datetime.now() - timedelta(days=16)
+    end = datetime.now() + timedelta(hours=1)
+
+    load_indicators(engine, start, end)
+    load_indicators(engine, start, end)
+
+    assert engine.data_collector.calls == 2
+    assert not cache_dir.exists()
+
+
+def test_indicator_cache_is_disabled_by_default(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("HOME", str(tmp_path))
+    engine = AsyncBacktestEngine(bithumb_client=None)
+    engine.data_collector = StaticCollector(make_batch())
+    start = datetime(2024, 1, 1)
+    end = start + timedelta(days=16)
+
+    load_indicators(engine, start, end)
+    load_indicators(engine, start, end)
+
+    assert engine.indicator_cache_dir is None
+    assert engine.data_collector.calls == 2
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_parameter_optimization_returns_best_combination() -> None:
+    engine = AsyncBacktestEngine(bithumb_client=None)
+    engine.data_collector = StaticCollector(make_batch())
+    start = datetime(2024, 1, 1)
+
+    result = asyncio.run(
+        engine.run_parameter_optimization(
+            "BTC_KRW",
+            start,
+            start + timedelta(days=16),
+            {"short_ema_period": [5, 10], "long_ema_period": [20, 30]},
+        )
+    )
+
+    assert result["total_combinations"] == 4
+    assert result["best_params"] is not None
+    assert math.isfinite(result["best_score"])
+    best = result["best_result"]
+    assert best is not None
+    assert best.performance_metrics["sharpe_ratio"] == result["best_score"]
+    assert len(best.equity_curve) == 400
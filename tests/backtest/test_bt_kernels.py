@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.backtest import _bt_kernels
+
+
+def random_walk(count: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return 100.0 * np.cumprod(1 + rng.normal(0, 0.01, count))
+
+
+def reference_backtest(close, signal, atr, initial_cash, position_size_percent, stop_loss_atr_multiplier):
+    trades = []
+    equity_curve = []
+    cash = initial_cash
+    position = 0.0
+    position_value = 0.0
+    entry_price = 0.0
+
+    for i, current_price in enumerate(close):
+        if position > 0:
+            position_value = position * current_price
+        total_equity = cash + position_value
+
+        if signal[i] == 1 and position == 0:
+            position = (total_equity * position_size_percent / 100) / current_price
+            cash -= position * current_price
+            entry_price = current_price
+            trades.append((i, _bt_kernels.TRADE_BUY, current_price, position, 0.0))
+        elif signal[i] == -1 and position > 0:
+            cash += position * current_price
+            trades.append((i, _bt_kernels.TRADE_SELL, current_price, position, (current_price - entry_price) * position))
+            position = 0.0
+            position_value = 0.0
+        elif position > 0 and atr[i] > 0:
+            if current_price <= entry_price - atr[i] * stop_loss_atr_multiplier:
+                cash += position * current_price
+                trades.append(
+                    (i, _bt_kernels.TRADE_STOP_LOSS, current_price, position, (current_price - entry_price) * position)
+                )
+                position = 0.0
+                position_value = 0.0
+
+        equity_curve.append((cash + position_value, cash, position_value))
+
+    return trades, np.array(equity_curve)
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_run_backtest_matches_reference_loop(seed: int) -> None:
+    rng = np.random.default_rng(seed)
+    close = random_walk(2000, seed)
+    signal = rng.choice(np.array([-1, 0, 0, 0, 1], dtype=np.int8), size=close.size)
+    atr = np.abs(rng.normal(0, 1.5, close.size))
+    atr[:14] = np.nan
+
+    expected_trades, expected_curve = reference_backtest(close, signal, atr, 1_000_000.0, 10.0, 2.0)
+    (
+        n_trades, trade_idx, trade_type, trade_price, trade_qty, trade_pnl,
+        equity, cash, position_value,
+    ) = _bt_kernels.run_backtest(close, signal, atr, 1_000_000.0, 10.0, 2.0)
+
+    assert n_trades == len(expected_trades)
+    assert any(kind == _bt_kernels.TRADE_STOP_LOSS for _, kind, *_ in expected_trades)
+    idx, kinds, prices, quantities, pnls = map(np.array, zip(*expected_trades))
+    np.testing.assert_array_equal(trade_idx[:n_trades], idx)
+    np.testing.assert_array_equal(trade_type[:n_trades], kinds)
+    np.testing.assert_allclose(trade_price[:n_trades], prices, rtol=1e-12)
+    np.testing.assert_allclose(trade_qty[:n_trades], quantities, rtol=1e-12)
+    np.testing.assert_allclose(trade_pnl[:n_trades], pnls, rtol=1e-9, atol=1e-9)
+    np.testing.assert_allclose(np.column_stack([equity, cash, position_value]), expected_curve, rtol=1e-12)
+
+@pytest.mark.parametrize("span", [5, 20, 50])
+def test_ema_matches_pandas(span: int) -> None:
+    close = random_walk(500, span)
+    expected = pd.Series(close).ewm(span=span).mean().to_numpy()
+    np.testing.assert_allclose(_bt_kernels.ema(close, span), expected, rtol=1e-10)
+
+
+def test_true_range_and_atr_match_pandas() -> None:
+    rng = np.random.default_rng(7)
+    close = random_walk(500, 7)
+    high = close * (1 + np.abs(rng.normal(0, 0.005, close.size)))
+    low = close * (1 - np.abs(rng.normal(0, 0.005, close.size)))
+
+    prev_close = pd.Series(close).shift(1)
+    expected_tr = np.maximum(
+        high - low, np.maximum(np.abs(high - prev_close), np.abs(low - prev_close))
+    ).to_numpy()
+    tr = _bt_kernels.true_range(high, low, close)
+    np.testing.assert_allclose(tr, expected_tr, rtol=1e-12, equal_nan=True)
+
+    mean, std = _bt_kernels.rolling_mean_std(tr, 14)
+    expected = pd.Series(tr).rolling(14)
+    np.testing.assert_allclose(mean, expected.mean().to_numpy(), rtol=1e-9, equal_nan=True)
+    np.testing.assert_allclose(std, expected.std().to_numpy(), rtol=1e-9, equal_nan=True)
+
+
+def test_bollinger_bands_match_pandas() -> None:
+    close = random_walk(500, 11)
+    rolling = pd.Series(close).rolling(20)
+    middle = rolling.mean().to_numpy()
+    std = rolling.std().to_numpy()
+
+    result = _bt_kernels.bollinger_bands(close, 20, 2.0)
+    for actual, expected in zip(result, (middle, middle + 2 * std, middle - 2 * std)):
+        np.testing.assert_allclose(actual, expected, rtol=1e-9, equal_nan=True)
+
+
+def test_rsi_matches_pandas() -> None:
+    # 상승만 있는 구간(RSI 100)과 횡보 구간(0/0 → NaN)을 함께 검증
+    close = np.concatenate([random_walk(300, 13), np.linspace(120, 140, 30), np.full(30, 140.0)])
+    delta = pd.Series(close).diff()
+    gain = delta.where(delta > 0, 0).rolling(14).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(14).mean()
+    expected = (100 - (100 / (1 + gain / loss))).to_numpy()
+
+    np.testing.assert_allclose(_bt_kernels.rsi(close, 14), expected, rtol=1e-9, atol=1e-9, equal_nan=True)
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from src.backtest.data_collector import CandleData
+from src.backtest.engine import BacktestEngine
+from src.backtest.events import EventType, FillEvent, MarketEvent, OrderEvent, SignalEvent
+from src.core.order_types import OrderSide
+
+
+SYMBOL = "BTC_KRW"
+START = datetime(2024, 1, 1)
+
+
+def make_candles(count: int = 20) -> list[CandleData]:
+    return [
+        CandleData(
+            timestamp=START + timedelta(hours=i),
+            open_price=100.0 + i,
+            high_price=101.0 + i,
+            low_price=99.0 + i,
+            close_price=100.0 + i,
+            volume=1.0,
+            symbol=SYMBOL,
+        )
+        for i in range(count)
+    ]
+
+
+def make_engine() -> BacktestEngine:
+    engine = BacktestEngine(initial_capital=1_000_000)
+    engine.add_data(SYMBOL, make_candles())
+
+    def alternate(data) -> None:
+        # 틱마다 매수/매도를 번갈아 제출해 신호·주문·체결 이벤트를 생성
+        hour = engine.current_time.hour
+        engine.submit_signal(SYMBOL, OrderSide.BUY if hour % 2 == 0 else OrderSide.SELL, 1.0, "alternate")
+
+    engine.add_strategy_callback(alternate)
+    return engine
+
+
+@pytest.fixture(autouse=True)
+def empty_pools():
+    for event_cls in (MarketEvent, SignalEvent, OrderEvent, FillEvent):
+        event_cls._pool.clear()
+    yield
+    for event_cls in (MarketEvent, SignalEvent, OrderEvent, FillEvent):
+        event_cls._pool.clear()
+
+
+def test_events_captured_by_callbacks_are_not_recycled() -> None:
+    engine = make_engine()
+    captured: dict[EventType, list] = {event_type: [] for event_type in EventType}
+    for event_type, events in captured.items():
+        engine.add_event_callback(event_type, events.append)
+
+    engine.run()
+
+    for event_type, events in captured.items():
+        assert events, event_type
+        assert len({id(event) for event in events}) == len(events)
+
+    # 보관된 이벤트는 이후 틱에서 다시 초기화되지 않아야 함
+    for i, event in enumerate(captured[EventType.MARKET]):
+        assert event.timestamp == START + timedelta(hours=i)
+        assert event.close_price == 100.0 + i
+    for event in captured[EventType.SIGNAL]:
+        expected_side = OrderSide.BUY if event.timestamp.hour % 2 == 0 else OrderSide.SELL
+        assert event.signal_type == expected_side
+
+    for event_cls in (MarketEvent, SignalEvent, OrderEvent, FillEvent):
+        assert event_cls._pool == []
+
+
+def test_events_without_callbacks_are_recycled_except_fills() -> None:
+    engine = make_engine()
+
+    engine.run()
+
+    assert engine.fills_completed > 0
+    assert MarketEvent._pool
+    assert SignalEvent._pool
+    assert FillEvent._pool == []
+    assert all(isinstance(fill, FillEvent) for fill in engine.portfolio.fills)
+    assert len({id(fill) for fill in engine.portfolio.fills}) == len(engine.portfolio.fills)
+
+
+MA_WINDOW = 10
+
+
+def moving_average_signal(closes: np.ndarray) -> np.ndarray:
+    """종가가 단순 이동평균 대비 ±1% 벗어나면 매수/매도 신호."""
+    ma = np.convolve(closes, np.ones(MA_WINDOW) / MA_WINDOW, "full")[:len(closes)]
+    signal = np.zeros(len(closes), dtype=np.int8)
+    signal[closes > ma * 1.01] = 1
+    signal[closes < ma * 0.99] = -1
+    return signal
+
+
+def random_walk_candles(symbol: str, count: int, step_hours: int, seed: int) -> list[CandleData]:
+    rng = np.random.default_rng(seed)
+    closes = 100.0 * np.cumprod(1 + rng.normal(0, 0.01, count))
+    return [
+        CandleData(
+            timestamp=START + timedelta(hours=i * step_hours),
+            open_price=float(close),
+            high_price=float(close),
+            low_price=float(close),
+            close_price=float(close),
+            volume=1.0,
+            symbol=symbol,
+        )
+        for i, close in enumerate(closes)
+    ]
+
+
+def test_vectorized_strategy_matches_per_tick_strategy() -> None:
+    # 봉 간격이 다른 두 종목으로 틱마다 캔들이 없는 종목의 커서 처리까지 검증
+    datasets = {
+        "BTC_KRW": random_walk_candles("BTC_KRW", 600, 1, seed=7),
+        "ETH_KRW": random_walk_candles("ETH_KRW", 300, 2, seed=8),
+    }
+
+    def vectorized(records: np.ndarray, out: np.ndarray) -> None:
+        out[:] = moving_average_signal(records["close"])
+
+    vectorized_engine = BacktestEngine(initial_capital=1_000_000)
+    per_tick_engine = BacktestEngine(initial_capital=1_000_000)
+    for symbol, candles in datasets.items():
+        vectorized_engine.add_data(symbol, candles)
+        per_tick_engine.add_data(symbol, candles)
+    vectorized_engine.add_vectorized_strategy(vectorized, "ma")
+
+    history: dict[str, list[float]] = {symbol: [] for symbol in datasets}
+
+    def per_tick(data) -> None:
+        for symbol, candle in data.items():
+            if candle.timestamp != per_tick_engine.current_time:
+                continue
+            closes = history[symbol]
+            closes.append(candle.close_price)
+            signal = moving_average_signal(np.array(closes))[-1]
+            if signal > 0:
+                per_tick_engine.submit_signal(symbol, OrderSide.BUY, 1.0, "ma")
+            elif signal < 0:
+                per_tick_engine.submit_signal(symbol, OrderSide.SELL, 1.0, "ma")
+
+    per_tick_engine.add_strategy_callback(per_tick)
+
+    vectorized_engine.run()
+    per_tick_engine.run()
+
+    summary = vectorized_engine.get_summary()
+    assert summary["total_trades"] > 0
+    assert summary == per_tick_engine.get_summary()
+    assert vectorized_engine.get_trades() == per_tick_engine.get_trades()
+    assert vectorized_engine.get_equity_curve() == per_tick_engine.get_equity_curve()
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from src.backtest.events import FillEvent
+from src.backtest.portfolio import Portfolio
+from src.core.order_types import OrderSide
+
+
+def test_update_fill_accepts_decimal_inputs() -> None:
+    portfolio = Portfolio(Decimal("1000000"), Decimal("0.0025"))
+    fill = FillEvent(
+        timestamp=datetime(2024, 1, 1),
+        symbol="BTC_KRW",
+        side=OrderSide.BUY,
+        quantity=Decimal("0.01"),
+        fill_price=Decimal("50000000"),
+        commission=Decimal("1250"),
+        order_id="order_1",
+        fill_id="fill_1",
+    )
+
+    portfolio.update_fill(fill)
+    portfolio.update_market_data("BTC_KRW", Decimal("51000000"), datetime(2024, 1, 2))
+
+    position = portfolio.get_position("BTC_KRW")
+    assert isinstance(position.quantity, float)
+    assert position.quantity == pytest.approx(0.01)
+    assert portfolio.cash == pytest.approx(1000000 - 500000 - 1250)
+    assert portfolio.calculate_total_equity() == pytest.approx(portfolio.cash + 510000)